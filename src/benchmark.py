@@ -0,0 +1,336 @@
+######################################################
+# Benchmark suite of the simulation core. Builds the #
+# fixed seed layouts of several sizes, measures the  #
+# time of every stage of the algorithms and the peak #
+# memory, and compares them with a stored baseline   #
+######################################################
+
+
+###########
+# Imports #
+###########
+
+
+# The plots are only saved, there is no window to show them in
+import matplotlib
+
+matplotlib.use("Agg")
+
+# The measured core and the plots generation, neither of them needs the Qt
+from packages.backend.wsn import SimulationCore
+from packages.backend.misc import DataCollector
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+
+#############
+# Functions #
+#############
+
+
+# Parses a comma separated list of values, eg. "50,100,200"
+def parse_list(text, value_type=int):
+    return [value_type(value) for value in text.split(",") if value != ""]
+
+
+# Parses a comma separated list of area sizes, eg. "200x200,500x500"
+def parse_areas(text):
+    return [
+        tuple(int(value) for value in area.split("x"))
+        for area in text.split(",")
+        if area != ""
+    ]
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description="Measures the simulation stages on fixed seed layouts"
+    )
+
+    parser.add_argument(
+        "--nodes", default="50,200,1000,5000,20000", help="node amounts"
+    )
+    parser.add_argument(
+        "--areas", default="200x200,500x500,1000x1000", help="area sizes, WxH"
+    )
+    parser.add_argument(
+        "--battery", type=int, default=1, help="battery capacity in J"
+    )
+    parser.add_argument(
+        "--coverage", type=int, default=70, help="minimum coverage in percent"
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=10, help="max iterations of the PSO setup"
+    )
+    parser.add_argument(
+        "--pso-max-nodes",
+        type=int,
+        default=1000,
+        help="the PSO stages are measured only up to this amount of nodes",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="seed of the layouts")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs of every stage, the best is kept"
+    )
+    parser.add_argument(
+        "--output", default="benchmark_results.json", help="path of the results"
+    )
+    parser.add_argument(
+        "--baseline", default=None, help="path of the baseline results to compare with"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="stores the results as the new baseline",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="relative slowdown reported as a regression",
+    )
+    parser.add_argument(
+        "--minimum-time",
+        type=float,
+        default=0.001,
+        help="stages faster than this in the baseline are too noisy to compare, in s",
+    )
+
+    return parser.parse_args()
+
+
+# Creates the network of the case, every layout built from it is the same
+def create_network(arguments, nodes, width, height):
+    network = SimulationCore(
+        node_amount=nodes,
+        battery_capacity=arguments.battery,
+        height=height,
+        width=width,
+        minimum_coverage=arguments.coverage,
+        seed=arguments.seed,
+    )
+    network.mv_MaxIteration = arguments.iterations
+
+    return network
+
+
+# Builds the fixed seed layout of the network again
+def rebuild_layout(network, arguments):
+    network.cleanup_after_simulation()
+    network.set_seed(arguments.seed)
+    network.initiate_network()
+
+
+# Returns the shortest time of the measured function, the prepare function is run untimed before every measurement
+def measure(function, repeat, prepare=None):
+    best = None
+
+    for _ in range(repeat):
+        if prepare is not None:
+            prepare()
+
+        started = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - started
+
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
+
+
+# Runs a single steady state round of the PSO algorithm, without the energy being used
+def pso_round(network):
+    network.establish_cluster_head_paths()
+    network.calculate_round_consumption()
+
+
+# Runs the naive algorithm and returns its (FND, HND, LND) rounds and the coverage data
+def naive_run(network):
+    coverage = []
+    network.add_observer("coverage_delta_data_naive", coverage.append)
+
+    network.naive_algorithm_new()
+
+    network.remove_observer("coverage_delta_data_naive", coverage.append)
+
+    return (network.mv_FND, network.mv_HND, network.mv_LND), coverage
+
+
+# Saves the plots of the naive runs results in a temporary directory
+def save_plots(rounds, coverage, nodes, runs=int(3)):
+    collector = DataCollector()
+    collector.set_nodes_amount(nodes)
+    collector.set_plot_name("benchmark.png")
+
+    for _ in range(runs):
+        collector.add_simulation_results([(0, rounds, coverage)])
+
+    directory = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as temporary:
+        os.chdir(temporary)
+
+        try:
+            collector.save_separate_plot()
+        finally:
+            os.chdir(directory)
+            collector.clear()
+
+
+# Measures all of the stages of a single case, the PSO stages only if they are not too slow
+def run_case(arguments, nodes, width, height):
+    network = create_network(arguments, nodes, width, height)
+    with_pso = nodes <= arguments.pso_max_nodes
+
+    results = {}
+
+    results["initiate_network"] = measure(
+        lambda: rebuild_layout(network, arguments), arguments.repeat
+    )
+
+    if with_pso:
+        network.set_algorithm(1)
+
+        results["pso_setup"] = measure(
+            network.pso_setup,
+            arguments.repeat,
+            lambda: rebuild_layout(network, arguments),
+        )
+
+        # The round is measured on the clusters of the last setup
+        results["pso_round"] = measure(lambda: pso_round(network), arguments.repeat)
+
+    network.set_algorithm(0)
+
+    outcome = []
+
+    results["naive_algorithm"] = measure(
+        lambda: outcome.append(naive_run(network)),
+        arguments.repeat,
+        lambda: rebuild_layout(network, arguments),
+    )
+
+    rounds, coverage = outcome[-1]
+
+    results["plots"] = measure(
+        lambda: save_plots(rounds, coverage, nodes), arguments.repeat
+    )
+
+    # The peak memory of the layout and the PSO stages, measured separately as the tracing slows everything down.
+    # The naive run only adds the short lived plot data, which is very slow to trace for the big layouts
+    tracemalloc.start()
+
+    rebuild_layout(network, arguments)
+
+    if with_pso:
+        network.set_algorithm(1)
+        network.pso_setup()
+        pso_round(network)
+
+    results["peak_memory_mb"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+
+    tracemalloc.stop()
+
+    return results
+
+
+# Returns the name of a case in the results
+def get_case_name(nodes, width, height):
+    return str(nodes) + "_nodes_" + str(width) + "x" + str(height)
+
+
+# Compares the results with the baseline, returns the list of the regressions as (case, stage, baseline, current)
+def find_regressions(results, baseline, threshold, minimum_time):
+    regressions = []
+
+    for case, stages in results.items():
+        for stage, value in stages.items():
+            old_value = baseline.get(case, {}).get(stage)
+
+            if old_value is None:
+                continue
+
+            # The memory is compared regardless of the time limit
+            if stage != "peak_memory_mb" and old_value < minimum_time:
+                continue
+
+            if value > old_value * (1 + threshold):
+                regressions.append((case, stage, old_value, value))
+
+    return regressions
+
+
+#################
+# Main function #
+#################
+
+
+def main():
+    arguments = parse_arguments()
+
+    results = {}
+
+    for nodes in parse_list(arguments.nodes):
+        for width, height in parse_areas(arguments.areas):
+            case = get_case_name(nodes, width, height)
+
+            print("Measuring " + case, flush=True)
+
+            # The simulation's own messages would bury the measurements
+            with contextlib.redirect_stdout(io.StringIO()):
+                results[case] = run_case(arguments, nodes, width, height)
+
+            for stage, value in results[case].items():
+                print("    " + stage.ljust(20) + "{:.4f}".format(value))
+
+    with open(arguments.output, "w") as file:
+        json.dump(results, file, indent=4)
+
+    print("Results saved to: " + arguments.output)
+
+    if arguments.baseline is None:
+        return 0
+
+    if arguments.update_baseline:
+        with open(arguments.baseline, "w") as file:
+            json.dump(results, file, indent=4)
+
+        print("Baseline updated: " + arguments.baseline)
+        return 0
+
+    with open(arguments.baseline) as file:
+        baseline = json.load(file)
+
+    regressions = find_regressions(
+        results, baseline, arguments.threshold, arguments.minimum_time
+    )
+
+    for case, stage, old_value, value in regressions:
+        print(
+            "REGRESSION "
+            + case
+            + " "
+            + stage
+            + ": {:.4f} -> {:.4f} ({:+.0%})".format(
+                old_value, value, value / old_value - 1
+            )
+        )
+
+    if len(regressions) == 0:
+        print("No regressions above {:.0%}".format(arguments.threshold))
+        return 0
+
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
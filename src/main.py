@@ -14,6 +14,9 @@ from packages.window import window_gui as gui
 
 import sys
 
+# Showing the progress messages of the simulations in the console
+import logging
+
 
 #################
 # Main function #
@@ -21,6 +24,7 @@ import sys
 
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
 
     app = gui.QApplication(sys.argv)
 
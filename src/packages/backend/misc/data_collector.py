@@ -91,6 +91,16 @@ class DataCollector:
 
         self.ml_PsoCoverageData.append(copy(data))
 
+    # Adds the results of the runs from the Monte Carlo runner, algorithm 0 is the naive one, 1 is the PSO
+    def add_simulation_results(self, results):
+        for algorithm, rounds, coverage in results:
+            if algorithm == 0:
+                self.add_naive_round_data(rounds)
+                self.add_naive_coverage_data(coverage)
+            else:
+                self.add_pso_round_data(rounds)
+                self.add_pso_coverage_data(coverage)
+
     def add_rounds_number(self, amount):
         self.mv_Rounds = amount
 
@@ -12,6 +12,9 @@
 
 
 class Battery:
+    # Fixed set of the attributes, there is no per object dictionary
+    __slots__ = ("mv_DesignedCapacity", "mv_CurrentCapacity")
+
     # Takes in the battery capacity as a default argument
     def __init__(self, capacity_J=1):
         #############
@@ -17,6 +17,9 @@ from .battery import Battery
 # For the energy consumption formulas
 from math import sqrt, pow
 
+# For the energy consumption of many transmissions at once
+import numpy as np
+
 
 #####################
 # Object definition #
@@ -24,24 +27,14 @@ from math import sqrt, pow
 
 
 class EMU(Battery):
-    #########################
-    # Objects and variables #
-    #########################
-
-    # Energy consumed per node sensor activation
-    mv_SensingPowerConsumption = 0.0000005
-
-    # Energy consumed per bit in Joules
-    mv_AntennaPowerConsumption = 0.00000005
-
-    # Energy consumed in Joules per bit per meter squared
-    mv_AmplifierLowPowerConsumption = 0.00000000001
-
-    # Energy consumed in Joules per bit per meter quadrupled
-    mv_AmplifierHighPowerConsumption = 0.0000000000000013
-
-    # Amplifier power mode switch threshold value[m]
-    mv_AmplifierThreshold = None
+    # Fixed set of the attributes, on top of the battery ones
+    __slots__ = (
+        "mv_SensingPowerConsumption",
+        "mv_AntennaPowerConsumption",
+        "mv_AmplifierLowPowerConsumption",
+        "mv_AmplifierHighPowerConsumption",
+        "mv_AmplifierThreshold",
+    )
 
     #######################
     # Methods definitions #
@@ -52,7 +45,23 @@ class EMU(Battery):
         # Initialising the battery class from which the EMU inherits
         super().__init__(capacity_j)
 
-        # Calculating the amplifier threshold value
+        #########################
+        # Objects and variables #
+        #########################
+
+        # Energy consumed per node sensor activation
+        self.mv_SensingPowerConsumption = 0.0000005
+
+        # Energy consumed per bit in Joules
+        self.mv_AntennaPowerConsumption = 0.00000005
+
+        # Energy consumed in Joules per bit per meter squared
+        self.mv_AmplifierLowPowerConsumption = 0.00000000001
+
+        # Energy consumed in Joules per bit per meter quadrupled
+        self.mv_AmplifierHighPowerConsumption = 0.0000000000000013
+
+        # Amplifier power mode switch threshold value[m]
         self.mv_AmplifierThreshold = sqrt(
             (
                 self.mv_AmplifierLowPowerConsumption
@@ -120,3 +129,79 @@ class EMU(Battery):
     # Calculates the receiver consumption depending on the data size that has been received
     def calculate_receiver_consumption(self, packet_size):
         return packet_size * self.mv_AntennaPowerConsumption
+
+    # Calculates the transmission energy for whole arrays of packet sizes and distances in one go,
+    # using the same amplifier power mode switch as the scalar version
+    def calculate_transmission_consumption_batch(self, packet_sizes, distances):
+        packet_sizes = np.asarray(packet_sizes, dtype=np.float64)
+        distances = np.asarray(distances, dtype=np.float64)
+
+        return packet_sizes * self.mv_AntennaPowerConsumption + np.where(
+            distances < self.mv_AmplifierThreshold,
+            packet_sizes
+            * self.mv_AmplifierLowPowerConsumption
+            * np.power(distances, 2),
+            packet_sizes
+            * self.mv_AmplifierHighPowerConsumption
+            * np.power(distances, 4),
+        )
+
+    # Calculates the receiver consumption for a whole array of packet sizes
+    def calculate_receiver_consumption_batch(self, packet_sizes):
+        return (
+            np.asarray(packet_sizes, dtype=np.float64) * self.mv_AntennaPowerConsumption
+        )
+
+    # Discharges a whole array of cells at once, in place. The amount is either a single value
+    # or one value per cell, the optional mask chooses which cells are discharged
+    def subtract_energy_batch(self, energy, amount, mask=None):
+        if mask is None:
+            mask = True
+
+        return np.subtract(energy, amount, out=energy, where=mask)
+
+    # Sets the cells to the charge left after the given amount of rounds, each one using the same amount of energy.
+    # Counting from the initial charge makes one call for many rounds give the same values as many single round calls
+    def drain_energy_batch(self, energy, initial, amount, rounds, mask=None):
+        if mask is None:
+            mask = True
+
+        return np.subtract(
+            initial, np.multiply(amount, rounds), out=energy, where=mask
+        )
+
+    # Calculates after how many rounds of the given energy usage the charge percentage of
+    # the cells drops bellow the level. Matches the values given by drain_energy_batch exactly
+    def calculate_rounds_until_level_batch(self, initial, designed, amount, level):
+        initial = np.asarray(initial, dtype=np.float64)
+        designed = np.asarray(designed, dtype=np.float64)
+        amount = np.broadcast_to(np.asarray(amount, dtype=np.float64), initial.shape)
+
+        # Checks if the level is reached after the given amount of rounds
+        def level_reached(rounds):
+            return (initial - amount * rounds) * 100 / designed < level
+
+        # The cells that are not used never reach the level, unless they are already bellow it
+        draining = amount > 0
+        rounds = np.where(level_reached(1), 1.0, np.inf)
+
+        # Estimating the value with the closed form of the charge
+        estimate = np.floor(
+            (initial[draining] - level * designed[draining] / 100) / amount[draining]
+        )
+        rounds[draining] = np.maximum(estimate + 1, 1)
+
+        # Correcting the rounding errors of the estimate
+        while True:
+            earlier = draining & (rounds > 1) & level_reached(np.where(draining, rounds - 1, 0))
+            if not earlier.any():
+                break
+            rounds[earlier] -= 1
+
+        while True:
+            later = draining & ~level_reached(np.where(draining, rounds, 0))
+            if not later.any():
+                break
+            rounds[later] += 1
+
+        return rounds
@@ -21,24 +21,31 @@
 # Includes #
 ############
 
-# Contains the whole energy management module
+# Contains the whole energy management module, the SOC extends it instead of owning one
 from .emu import EMU
 
+# For the batched energy calculations
+import numpy as np
+
 #####################
 # Object definition #
 #####################
 
 
-class SOC:
+# The SOC, its energy management unit and its battery are a single object, a node carries one object instead of three
+class SOC(EMU):
+    # Fixed set of the attributes, on top of the energy management ones
+    __slots__ = ("mv_StatusMessageSize", "mv_DataPacketSize")
+
     # Takes the battery capacity in mAH as a parameter
     def __init__(self, battery_capacity_j=1):
+        # Initialising the energy management unit with given battery capacity, defaults to 100 mAH
+        super().__init__(battery_capacity_j)
+
         #########################
         # Objects and variables #
         #########################
 
-        # Initialising the energy management unit with given battery capacity, defaults to 100 mAH
-        self.mo_EnergyManagement = EMU(battery_capacity_j)
-
         # The size of hello/status message
         self.mv_StatusMessageSize = 200
 
@@ -49,46 +56,9 @@ class SOC:
     # Methods definitions #
     #######################
 
-    # Battery size setter
-    def set_battery_capacity(self, capacity):
-        self.mo_EnergyManagement.set_battery_capacity(capacity)
-
-    # Gets the device battery level
-    def get_charge_percentage_left(self):
-        # Asks the energy management module for battery status
-        return self.mo_EnergyManagement.get_charge_percentage_left()
-
-    # Gets the sensing power consumption
-    def get_sensing_consumption(self):
-        return self.mo_EnergyManagement.get_sensing_consumption()
-
-    # Gets the antenna power consumption
-    def get_antenna_consumption(self):
-        return self.mo_EnergyManagement.get_antenna_consumption()
-
-    # Gets the low power amplifier consumption
-    def get_low_power_amplifier_consumption(self):
-        return self.mo_EnergyManagement.get_low_power_amplifier_consumption()
-
-    # Gets the high power amplifier consumption
-    def get_high_power_amplifier_consumption(self):
-        return self.mo_EnergyManagement.get_high_power_amplifier_consumption()
-
     # Gets the distance after which amplifier switches to a high power mode
     def get_amplifier_threshold_distance(self):
-        return self.mo_EnergyManagement.get_threshold_distance()
-
-    # Calculates the transmission energy depending on the packet size and distance traveled
-    def calculate_transmission_consumption(self, packet_size=int, distance=int):
-        return self.mo_EnergyManagement.calculate_transmission_consumption(
-            packet_size=packet_size, distance=distance
-        )
-
-    # Calculates the receiver consumption depending on the data size that has been received
-    def calculate_receiver_consumption(self, packet_size):
-        return self.mo_EnergyManagement.calculate_receiver_consumption(
-            packet_size=packet_size
-        )
+        return self.get_threshold_distance()
 
     # Gets the data packet size
     def get_data_packet_size(self):
@@ -100,45 +70,67 @@ class SOC:
 
     # Emulates the sending of the status message into the network
     def send_status(self, distance=float):
-        self.mo_EnergyManagement.subtract_energy(
-            self.mo_EnergyManagement.calculate_transmission_consumption(
-                self.mv_StatusMessageSize, distance
-            )
+        self.subtract_energy(
+            self.calculate_transmission_consumption(self.mv_StatusMessageSize, distance)
         )
 
     # Emulates the sending of the data into the network
     def send_data(self, distance=float):
-        self.mo_EnergyManagement.subtract_energy(
-            self.mo_EnergyManagement.calculate_transmission_consumption(
-                self.mv_DataPacketSize, distance
-            )
+        self.subtract_energy(
+            self.calculate_transmission_consumption(self.mv_DataPacketSize, distance)
         )
 
     def aggregate_and_send_data(self, distance=float, amount_of_data_packets=int):
-        self.mo_EnergyManagement.subtract_energy(
-            self.mo_EnergyManagement.calculate_transmission_consumption(
+        self.subtract_energy(
+            self.calculate_transmission_consumption(
                 amount_of_data_packets * self.mv_DataPacketSize, distance
             )
         )
 
     # Emulates the receiving of the data from the network
     def receive_data(self):
-        self.mo_EnergyManagement.subtract_energy(
-            self.mo_EnergyManagement.calculate_receiver_consumption(
-                self.mv_DataPacketSize
-            )
-        )
+        self.subtract_energy(self.calculate_receiver_consumption(self.mv_DataPacketSize))
 
     # Emulates the receiving of a status from the network
     def receive_status(self):
-        self.mo_EnergyManagement.subtract_energy(
-            self.mo_EnergyManagement.calculate_receiver_consumption(
-                self.mv_StatusMessageSize
-            )
+        self.subtract_energy(
+            self.calculate_receiver_consumption(self.mv_StatusMessageSize)
         )
 
     # Emulates the activation and data collection from the sensors
     def sense_data(self):
-        self.mo_EnergyManagement.subtract_energy(
-            self.mo_EnergyManagement.get_sensing_consumption()
+        self.subtract_energy(self.get_sensing_consumption())
+
+    #################################
+    # Batched, array based versions #
+    #################################
+
+    # Emulates the sending of the data by every cell of the energy array over the given distances
+    def send_data_batch(self, energy, distances, mask=None):
+        return self.subtract_energy_batch(
+            energy,
+            self.calculate_transmission_consumption_batch(
+                self.mv_DataPacketSize, distances
+            ),
+            mask,
+        )
+
+    # Emulates the aggregation and sending of given amounts of data packets over the given distances
+    def aggregate_and_send_data_batch(
+        self, energy, distances, amount_of_data_packets, mask=None
+    ):
+        return self.subtract_energy_batch(
+            energy,
+            self.calculate_transmission_consumption_batch(
+                np.asarray(amount_of_data_packets) * self.mv_DataPacketSize, distances
+            ),
+            mask,
+        )
+
+    # Emulates the receiving of the data by every cell of the energy array
+    def receive_data_batch(self, energy, mask=None):
+        return self.subtract_energy_batch(
+            energy,
+            self.calculate_receiver_consumption(self.mv_DataPacketSize),
+            mask,
         )
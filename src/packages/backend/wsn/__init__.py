@@ -1,3 +1,41 @@
+# importing the simulation core, it runs without the Qt
+from .simulation_core import *
 
-# importing the ready-made sensoric network for further use
-from .wsn import *
+# importing the spatial index over the nodes positions
+from .spatial_index import *
+
+# importing the per layout cache of the distances between the nodes
+from .distance_cache import *
+
+# importing the sparse graph of the links within the communication range
+from .communication_graph import *
+
+# importing the tracking of the nodes connectivity with the base station
+from .connectivity_tracker import *
+
+# importing the shortest path tree of the routes to the sink
+from .routing_tree import *
+
+# importing the profiler of the simulations phases
+from .profiler import *
+
+# importing the throttle of the plot updates
+from .plot_throttle import *
+
+# importing the on disk cache of the simulations results
+from .result_cache import *
+
+# importing the process pool runner for the repeated simulations
+from .monte_carlo import *
+
+# importing the non blocking queue of the simulation jobs
+from .simulation_queue import *
+
+# importing the parameter sweeps over the network settings
+from .sweep import *
+
+# importing the ready-made sensoric network for further use, available only with the PyQt5 installed
+try:
+    from .wsn import *
+except ImportError:
+    pass
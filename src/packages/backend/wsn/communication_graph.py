@@ -0,0 +1,147 @@
+################################################################
+# Sparse graph of the links between the nodes. Two nodes are   #
+# linked when they are within the communication range of each  #
+# other. The links are found in bulk with the spatial index    #
+# and stored in the compressed rows, along with their lengths  #
+# and the energy of sending a packet over them, so the routes  #
+# and the neighbourhoods never need the geometry again         #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# Arrays of the links
+import numpy as np
+
+# Compressed rows storage of the links
+from scipy.sparse import csr_matrix
+
+
+#####################
+# Object definition #
+#####################
+
+
+class CommunicationGraph:
+    # Takes the distance cache of the layout, the communication range and optionally the energy consumption model
+    # with the size of the sent packet, used for the costs of the links. The data packet size is used by default
+    def __init__(
+        self, distance_cache, communication_range=float, soc=None, packet_size=None
+    ):
+        #############
+        # Variables #
+        #############
+
+        # The range within which the nodes are linked
+        self.mv_Range = communication_range
+
+        # The lengths of the links, both of the directions are stored, the columns of every row are sorted
+        self.mo_Distances = distance_cache.get_sparse_distances(communication_range)
+        self.mo_Distances.sort_indices()
+
+        # The energy of sending a packet over the links, sharing the structure of the lengths
+        self.mo_Costs = None
+
+        if soc is not None:
+            if packet_size is None:
+                packet_size = soc.get_data_packet_size()
+
+            self.mo_Costs = csr_matrix(
+                (
+                    soc.calculate_transmission_consumption_batch(
+                        packet_size, self.mo_Distances.data
+                    ),
+                    self.mo_Distances.indices,
+                    self.mo_Distances.indptr,
+                ),
+                shape=self.mo_Distances.shape,
+                copy=False,
+            )
+
+    ##############################
+    # Member methods definitions #
+    ##############################
+
+    # Returns the range within which the nodes are linked
+    def get_range(self):
+        return self.mv_Range
+
+    # Returns the amount of nodes in the graph
+    def get_size(self):
+        return self.mo_Distances.shape[0]
+
+    # Returns the amount of links, every one of them counted once
+    def get_links_amount(self):
+        return self.mo_Distances.nnz // 2
+
+    # Returns the sparse matrix of the links weighted with the "distance" or the transmission "energy"
+    def get_matrix(self, weight="distance"):
+        if weight == "energy":
+            return self.mo_Costs
+
+        return self.mo_Distances
+
+    # Returns the indices of the nodes linked with the node
+    def get_neighbours(self, index=int):
+        return self.mo_Distances.indices[
+            self.mo_Distances.indptr[index] : self.mo_Distances.indptr[index + 1]
+        ]
+
+    # Returns the amount of the nodes linked with the node
+    def get_neighbours_amount(self, index=int):
+        return int(
+            self.mo_Distances.indptr[index + 1] - self.mo_Distances.indptr[index]
+        )
+
+    # Returns the amounts of the linked nodes of every node
+    def get_neighbours_amounts(self):
+        return np.diff(self.mo_Distances.indptr)
+
+    # Returns the lengths of the links of the node, in the order of its neighbours
+    def get_distances(self, index=int):
+        return self.mo_Distances.data[
+            self.mo_Distances.indptr[index] : self.mo_Distances.indptr[index + 1]
+        ]
+
+    # Returns the energy of sending a packet over the links of the node, in the order of its neighbours
+    def get_costs(self, index=int):
+        return self.mo_Costs.data[
+            self.mo_Costs.indptr[index] : self.mo_Costs.indptr[index + 1]
+        ]
+
+    # Returns the position of the link between the nodes in the stored data, or None when they aren't linked
+    def find_link(self, index=int, other=int):
+        start = self.mo_Distances.indptr[index]
+        end = self.mo_Distances.indptr[index + 1]
+
+        position = start + np.searchsorted(self.mo_Distances.indices[start:end], other)
+
+        if position < end and self.mo_Distances.indices[position] == other:
+            return int(position)
+
+        return None
+
+    # Checks if the nodes are within the communication range of each other
+    def are_linked(self, index=int, other=int):
+        return self.find_link(index, other) is not None
+
+    # Returns the length of the link between the nodes, or None when they aren't linked
+    def get_distance(self, index=int, other=int):
+        position = self.find_link(index, other)
+
+        if position is None:
+            return None
+
+        return float(self.mo_Distances.data[position])
+
+    # Returns the energy of sending a packet over the link between the nodes, or None when they aren't linked
+    def get_cost(self, index=int, other=int):
+        position = self.find_link(index, other)
+
+        if position is None:
+            return None
+
+        return float(self.mo_Costs.data[position])
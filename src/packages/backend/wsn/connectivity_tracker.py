@@ -0,0 +1,168 @@
+################################################################
+# Connectivity of the living nodes with the base station over  #
+# the communication links. A breadth first search tree from    #
+# the base station is kept, so the death of a node, that no    #
+# other reachable node is routed through, is handled at once.  #
+# The tree is searched again only when such a node dies, and   #
+# then only once for all of the deaths of the round            #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# Arrays of the links and the tree
+import numpy as np
+
+# Compressed rows storage of the links
+from scipy.sparse import csr_matrix
+
+# Searching the sparse graph
+from scipy.sparse.csgraph import breadth_first_order
+
+
+#####################
+# Object definition #
+#####################
+
+
+class ConnectivityTracker:
+    # Takes the sparse matrix of the links between the nodes, the indices of the nodes linked with the base station,
+    # optionally the mask of the living nodes, all of them by default, and the profiler counting the searches
+    def __init__(self, graph, base_links, alive=None, profiler=None):
+        #############
+        # Variables #
+        #############
+
+        size = graph.shape[0]
+
+        # The base station is stored as the last node of the links
+        self.mv_Base = size
+
+        # The links of the nodes, with the links of the base station appended as the last row.
+        # The search doesn't follow the direction of the links, so they're stored only once for the base station
+        base_links = np.asarray(base_links, dtype=graph.indices.dtype)
+
+        self.mo_Links = csr_matrix(
+            (
+                np.concatenate((graph.data, np.ones(len(base_links)))),
+                np.concatenate((graph.indices, base_links)),
+                np.append(graph.indptr, graph.indptr[-1] + len(base_links)),
+            ),
+            shape=(size + 1, size + 1),
+        )
+
+        # The row of every stored link, used for dropping the links of the dead nodes
+        self.ma_LinkRows = np.repeat(
+            np.arange(size + 1, dtype=np.intp), np.diff(self.mo_Links.indptr)
+        )
+
+        # The living nodes, the base station is always alive
+        self.ma_Alive = np.ones(size + 1, dtype=bool)
+
+        if alive is not None:
+            self.ma_Alive[:size] = alive
+
+        # The nodes, that can reach the base station, their parents in the search tree
+        # and the amount of the reachable nodes routed through them
+        self.ma_Connected = np.zeros(size + 1, dtype=bool)
+        self.ma_Parents = np.full(size + 1, -1, dtype=np.intp)
+        self.ma_Children = np.zeros(size + 1, dtype=np.intp)
+
+        # The profiler counting the searches, none by default
+        self.mo_Profiler = profiler
+
+        self.recalculate()
+
+    ##############################
+    # Member methods definitions #
+    ##############################
+
+    # Searches the links of the living nodes from the base station again
+    def recalculate(self):
+        if self.mo_Profiler is not None:
+            self.mo_Profiler.count("connectivity_searches")
+
+        # Only the links between the living nodes are kept
+        alive_links = (
+            self.ma_Alive[self.ma_LinkRows] & self.ma_Alive[self.mo_Links.indices]
+        )
+
+        links = csr_matrix(
+            (
+                self.mo_Links.data[alive_links],
+                self.mo_Links.indices[alive_links],
+                np.concatenate(
+                    (
+                        [0],
+                        np.cumsum(
+                            np.bincount(
+                                self.ma_LinkRows[alive_links],
+                                minlength=len(self.ma_Alive),
+                            )
+                        ),
+                    )
+                ),
+            ),
+            shape=self.mo_Links.shape,
+        )
+
+        order, parents = breadth_first_order(
+            links, self.mv_Base, directed=False, return_predecessors=True
+        )
+
+        self.ma_Connected[:] = False
+        self.ma_Connected[order] = True
+
+        self.ma_Parents[:] = -1
+        self.ma_Parents[order[1:]] = parents[order[1:]]
+
+        self.ma_Children = np.bincount(
+            self.ma_Parents[order[1:]], minlength=len(self.ma_Alive)
+        )
+
+    # Removes the dead nodes, returns the indices of the living nodes, that can no longer reach the base station
+    def remove(self, indices):
+        indices = np.asarray(indices, dtype=np.intp)
+        indices = indices[self.ma_Alive[indices]]
+
+        if len(indices) == 0:
+            return indices
+
+        self.ma_Alive[indices] = False
+
+        # The reachable dead nodes leave the search tree
+        connected = indices[self.ma_Connected[indices]]
+        self.ma_Connected[connected] = False
+        np.subtract.at(self.ma_Children, self.ma_Parents[connected], 1)
+        self.ma_Parents[connected] = -1
+
+        # Nothing else is cut off, when none of the living reachable nodes was routed through the dead ones
+        if not np.any(self.ma_Children[connected] > 0):
+            return np.empty(0, dtype=np.intp)
+
+        connected_before = self.ma_Connected.copy()
+
+        self.recalculate()
+
+        return np.flatnonzero(connected_before & ~self.ma_Connected)
+
+    # Checks if the node is alive and can't reach the base station
+    def is_cut_off(self, index=int):
+        return bool(self.ma_Alive[index] and not self.ma_Connected[index])
+
+    # Returns the indices of the living nodes, that can't reach the base station
+    def get_cut_off_indices(self):
+        return np.flatnonzero(
+            self.ma_Alive[: self.mv_Base] & ~self.ma_Connected[: self.mv_Base]
+        )
+
+    # Returns the amount of the living nodes, that can't reach the base station
+    def get_cut_off_amount(self):
+        return len(self.get_cut_off_indices())
+
+    # Returns the amount of the nodes, that can reach the base station
+    def get_connected_amount(self):
+        return int(np.count_nonzero(self.ma_Connected[: self.mv_Base]))
@@ -0,0 +1,144 @@
+################################################################
+# Distances between the nodes of a single network layout. The  #
+# nodes never move during a simulation, so the distances to    #
+# the base station are calculated once, and the distances      #
+# between the nodes are calculated on the first request. Only  #
+# the recently used rows are kept, within a memory limit       #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# Arrays of the distances
+import numpy as np
+
+# The least recently used order of the rows
+from collections import OrderedDict
+
+# Sparse storage of the distances within the communication range
+from scipy.sparse import csr_matrix
+
+
+#####################
+# Object definition #
+#####################
+
+
+class DistanceCache:
+    # Takes the array of (x, y) positions of the nodes, the (x, y) position of the base station,
+    # optionally the spatial index over the same positions, used for the sparse distances,
+    # and the memory limit of the kept rows in bytes
+    def __init__(
+        self,
+        positions,
+        base_position,
+        spatial_index=None,
+        max_rows_size=int(64 * 1024 * 1024),
+    ):
+        #############
+        # Variables #
+        #############
+
+        # Positions of the nodes
+        self.ma_Positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+
+        # Position of the base station
+        self.ma_BasePosition = np.asarray(base_position, dtype=np.float64).reshape(2)
+
+        # Spatial index over the positions
+        self.mo_SpatialIndex = spatial_index
+
+        # Distances from every node to the base station
+        self.ma_BaseDistances = self.calculate_distances(self.ma_BasePosition)
+
+        # Rows of the distances from a node to all of the other nodes, by the node index, the least recently used first
+        self.md_Rows = OrderedDict()
+
+        # The amount of the rows fitting in the memory limit, always at least one
+        self.mv_MaxRows = max(1, max_rows_size // max(1, self.ma_Positions.nbytes // 2))
+
+        # Sparse matrices of the distances between the nodes closer than the given range, by the range
+        self.md_SparseDistances = {}
+
+    ##############################
+    # Member methods definitions #
+    ##############################
+
+    # Calculates the distances from a point to every node, the same way the geometry library does for two points
+    def calculate_distances(self, point):
+        differences = self.ma_Positions - point
+
+        return np.sqrt(
+            differences[:, 0] * differences[:, 0] + differences[:, 1] * differences[:, 1]
+        )
+
+    # Returns the amount of nodes in the layout
+    def get_size(self):
+        return len(self.ma_Positions)
+
+    # Returns the distance from a node to the base station
+    def get_base_distance(self, index=int):
+        return float(self.ma_BaseDistances[index])
+
+    # Returns the distances from the chosen nodes to the base station, or from all of them if none given
+    def get_base_distances(self, indices=None):
+        if indices is None:
+            return self.ma_BaseDistances
+
+        return self.ma_BaseDistances[indices]
+
+    # Returns the distances from a node to the chosen nodes, or to all of them if none given.
+    # The whole row of the node is kept, so the node asked about most often should be the first one.
+    # The least recently used rows are dropped, when there are more of them than the memory limit allows
+    def get_distances(self, index=int, indices=None):
+        row = self.md_Rows.get(index)
+
+        if row is None:
+            row = self.calculate_distances(self.ma_Positions[index])
+            self.md_Rows[index] = row
+
+            if len(self.md_Rows) > self.mv_MaxRows:
+                self.md_Rows.popitem(last=False)
+        else:
+            self.md_Rows.move_to_end(index)
+
+        if indices is None:
+            return row
+
+        return row[indices]
+
+    # Drops all of the kept rows, eg. when the nodes asking about the distances change
+    def clear_rows(self):
+        self.md_Rows.clear()
+
+    # Returns the distance between two nodes, the row of the first one is kept
+    def get_distance(self, index=int, other=int):
+        return float(self.get_distances(index)[other])
+
+    # Returns the sparse matrix of the distances between all of the nodes closer than the range to each other,
+    # calculated once for every range
+    def get_sparse_distances(self, max_distance=float):
+        matrix = self.md_SparseDistances.get(max_distance)
+
+        if matrix is None:
+            size = self.get_size()
+
+            if self.mo_SpatialIndex is None or self.mo_SpatialIndex.mo_Tree is None:
+                matrix = csr_matrix((size, size), dtype=np.float64)
+            else:
+                tree = self.mo_SpatialIndex.mo_Tree
+
+                matrix = tree.sparse_distance_matrix(
+                    tree, max_distance, output_type="coo_matrix"
+                ).tocsr()
+
+                # A node is not its own neighbour
+                matrix.setdiag(0)
+                matrix.eliminate_zeros()
+
+            self.md_SparseDistances[max_distance] = matrix
+
+        return matrix
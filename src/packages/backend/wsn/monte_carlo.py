@@ -0,0 +1,162 @@
+#################################################################
+# Monte Carlo runner for the repeated simulations. Every        #
+# repetition is an independent random layout, so the runs are   #
+# spread across a pool of processes, each one with its own     #
+# seeded random stream, and their results are gathered in order #
+#################################################################
+
+
+############
+# Includes #
+############
+
+
+# The simulated network, the workers don't need the Qt adapter
+from .simulation_core import SimulationCore
+
+# Random streams for the workers
+import numpy as np
+
+# Process pool for the runs
+from concurrent.futures import ProcessPoolExecutor
+
+# Fresh interpreters for the workers, forking a process with a running Qt application is unsafe
+import multiprocessing
+
+# The amount of cores
+import os
+
+
+#############
+# Functions #
+#############
+
+
+# Runs a single simulation of the algorithm with the given index in a worker process.
+# Returns the algorithm index, the (FND, HND, LND) rounds and the coverage delta data
+def run_single_simulation(algorithm, settings, seed_sequence):
+    # Every run has its own random stream, spawned from the batch seed
+    network = SimulationCore(
+        node_amount=settings["node_amount"],
+        battery_capacity=settings["battery_capacity"],
+        height=settings["height"],
+        width=settings["width"],
+        minimum_coverage=settings["minimum_coverage"],
+        seed=seed_sequence,
+    )
+    network.mv_MaxIteration = settings["max_iteration"]
+    network.mb_FastForward = settings.get("fast_forward", network.mb_FastForward)
+    network.mb_GeometricIoU = settings.get("geometric_iou", network.mb_GeometricIoU)
+    network.mb_EventStepping = settings.get(
+        "event_stepping", network.mb_EventStepping
+    )
+    network.set_connectivity_tracking(settings.get("track_connectivity", False))
+
+    # Collecting the coverage deltas the same way the window does
+    coverage_data = []
+    network.add_observer("coverage_delta_data_naive", coverage_data.append)
+    network.add_observer("coverage_delta_data_pso", coverage_data.append)
+
+    network.set_algorithm(algorithm)
+    network.initiate_network()
+    network.run_simulation()
+
+    return (
+        algorithm,
+        (network.mv_FND, network.mv_HND, network.mv_LND),
+        coverage_data,
+    )
+
+
+# Builds the (algorithm index, repetition, seed sequence) jobs of the repetitions of every algorithm, ordered by
+# the repetition, then by the algorithm. The seed can be a number or a SeedSequence, every job gets its own child
+def build_jobs(algorithms, repetitions, seed=None):
+    jobs = [
+        (algorithm, repetition)
+        for repetition in range(repetitions)
+        for algorithm in algorithms
+    ]
+
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    # Independent random streams for every run
+    seed_sequences = seed.spawn(len(jobs))
+
+    return [
+        (algorithm, repetition, seed_sequence)
+        for (algorithm, repetition), seed_sequence in zip(jobs, seed_sequences)
+    ]
+
+
+#####################
+# Object definition #
+#####################
+
+
+class MonteCarloRunner:
+    # Takes the maximum amount of worker processes, all of the cores by default,
+    # and optionally the cache of the results, only the runs missing from it are simulated
+    def __init__(self, processes=None, cache=None):
+        #############
+        # Variables #
+        #############
+
+        self.mv_Processes = processes if processes is not None else os.cpu_count()
+
+        # The result cache, none by default
+        self.mo_Cache = cache
+
+    ##############################
+    # Member methods definitions #
+    ##############################
+
+    # Runs the repetitions of every given algorithm index with the network settings, the seed can be
+    # a number or a SeedSequence. Returns the runs results ordered by the repetition, then by the algorithm
+    def run(self, algorithms, repetitions, settings, seed=None):
+        return self.run_jobs(
+            [
+                (algorithm, settings, seed_sequence)
+                for algorithm, repetition, seed_sequence in build_jobs(
+                    algorithms, repetitions, seed
+                )
+            ]
+        )
+
+    # Runs the (algorithm index, settings, seed sequence) jobs across the processes, returns the results in order
+    def run_jobs(self, jobs):
+        results = [None] * len(jobs)
+        keys = [None] * len(jobs)
+
+        # Taking the already known results from the cache
+        if self.mo_Cache is not None:
+            for i in range(len(jobs)):
+                keys[i] = self.mo_Cache.get_key(*jobs[i])
+                results[i] = self.mo_Cache.get(keys[i])
+
+        missing = [i for i in range(len(jobs)) if results[i] is None]
+
+        if len(missing) == 0:
+            return results
+
+        algorithms, settings, seed_sequences = zip(*[jobs[i] for i in missing])
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.mv_Processes, len(missing)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            for i, result in zip(
+                missing,
+                executor.map(
+                    run_single_simulation, algorithms, settings, seed_sequences
+                ),
+            ):
+                results[i] = result
+
+                if self.mo_Cache is not None:
+                    self.mo_Cache.put(keys[i], result)
+
+        if self.mo_Cache is not None:
+            self.mo_Cache.evict()
+
+        return results
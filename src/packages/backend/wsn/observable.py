@@ -0,0 +1,37 @@
+################################################################
+# Observers of the events. The simulation core and the queue   #
+# of the simulations pass their events to the registered       #
+# callbacks the same way, without depending on the Qt          #
+################################################################
+
+
+#####################
+# Object definition #
+#####################
+
+
+class Observable:
+    # The classes using the observers create their own md_Observers dictionary in the constructor,
+    # with the lists of the callbacks by the event name
+
+    ##############################
+    # Member methods definitions #
+    ##############################
+
+    # Registers a callback, that is called with the event data every time the event happens
+    def add_observer(self, event=str, callback=None):
+        self.md_Observers.setdefault(event, []).append(callback)
+
+    # Unregisters a callback from the event
+    def remove_observer(self, event=str, callback=None):
+        if callback in self.md_Observers.get(event, []):
+            self.md_Observers[event].remove(callback)
+
+    # Passes the event data to every callback registered for the event
+    def notify(self, event=str, *data):
+        for callback in self.md_Observers.get(event, ()):
+            callback(*data)
+
+    # Checks if any callback is registered for the event
+    def has_observers(self, event=str):
+        return len(self.md_Observers.get(event, ())) > 0
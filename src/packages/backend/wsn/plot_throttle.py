@@ -0,0 +1,120 @@
+################################################################
+# Throttle of the plot updates. The nodes change many times a  #
+# second during a simulation, so the changes are only marked,  #
+# and published at most a set amount of times per second, or   #
+# every set amount of rounds. Only the nodes that changed      #
+# since the last published snapshot are sent                   #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# Comparing the snapshots
+import numpy as np
+
+# Limiting the rate of the snapshots
+import time
+
+
+#####################
+# Object definition #
+#####################
+
+
+class PlotThrottle:
+    # Takes the maximum amount of snapshots per second and the amount of rounds between them.
+    # When the rounds interval is set, it is used instead of the time limit
+    def __init__(self, max_rate=float(10), round_interval=int(0)):
+        #############
+        # Variables #
+        #############
+
+        # The maximum amount of snapshots per second, not limited when 0
+        self.mv_MaxRate = max_rate
+
+        # The amount of rounds between the snapshots, not used when 0
+        self.mv_RoundInterval = round_interval
+
+        # The time and the round of the last published snapshot
+        self.mv_LastTime = float("-inf")
+        self.mv_LastRound = 0
+
+        # Colours and activity flags of the nodes in the last published snapshot
+        self.ma_Colors = None
+        self.ma_Active = None
+
+        ############
+        # Booleans #
+        ############
+
+        # Set when the nodes have changed since the last snapshot
+        self.mb_Dirty = False
+
+    ##############################
+    # Member methods definitions #
+    ##############################
+
+    # Sets the maximum amount of snapshots per second
+    def set_max_rate(self, max_rate=float):
+        self.mv_MaxRate = max_rate
+
+    # Sets the amount of rounds between the snapshots, 0 turns the rounds interval off
+    def set_round_interval(self, round_interval=int):
+        self.mv_RoundInterval = round_interval
+
+    # Marks the nodes as changed since the last snapshot
+    def mark_dirty(self):
+        self.mb_Dirty = True
+
+    # Checks if there are changes waiting to be published
+    def is_dirty(self):
+        return self.mb_Dirty
+
+    # Checks if a snapshot should be published in the given round
+    def is_due(self, round=int):
+        if not self.mb_Dirty:
+            return False
+
+        # The rounds counted from the start again mean a new run
+        if self.mv_RoundInterval > 0:
+            return (
+                round < self.mv_LastRound
+                or round - self.mv_LastRound >= self.mv_RoundInterval
+            )
+
+        if self.mv_MaxRate <= 0:
+            return True
+
+        return time.monotonic() - self.mv_LastTime >= 1 / self.mv_MaxRate
+
+    # Marks the changes as published without a snapshot, the next snapshot still contains them
+    def mark_published(self, round=int):
+        self.mv_LastTime = time.monotonic()
+        self.mv_LastRound = round
+        self.mb_Dirty = False
+
+    # Stores the full snapshot of the nodes as the last published one
+    def reset(self, colors, active, round=int(0)):
+        self.ma_Colors = np.array(colors, copy=True)
+        self.ma_Active = np.array(active, dtype=bool, copy=True)
+
+        self.mark_published(round)
+
+    # Returns the indices of the nodes, that changed since the last snapshot, and stores the new snapshot.
+    # Returns None, when there is no previous snapshot of the same nodes to compare with
+    def get_changes(self, colors, active, round=int(0)):
+        if self.ma_Colors is None or len(self.ma_Colors) != len(colors):
+            self.reset(colors, active, round)
+            return None
+
+        changed = np.flatnonzero((self.ma_Colors != colors) | (self.ma_Active != active))
+
+        self.ma_Colors[changed] = colors[changed]
+        self.ma_Active[changed] = active[changed]
+
+        self.mark_published(round)
+
+        return changed
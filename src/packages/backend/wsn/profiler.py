@@ -0,0 +1,113 @@
+################################################################
+# Profiler of the simulations. Sums the time spent in every    #
+# phase of the algorithms and counts the chosen operations, so #
+# the slow parts of a run can be found. When it's disabled the #
+# timers are never read and nothing is stored, so it can stay  #
+# in the code of the algorithms at all times                   #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# Measuring the time of the phases
+import time
+
+# Saving the reports
+import json
+
+
+#####################
+# Object definition #
+#####################
+
+
+class Profiler:
+    # Takes the flag telling if the profiling is on from the start
+    def __init__(self, enabled=False):
+        #############
+        # Variables #
+        #############
+
+        # The profiling flag, nothing is measured without it
+        self.mb_Enabled = enabled
+
+        # The amount of measurements and their total time in seconds, by the phase name
+        self.md_Phases = {}
+
+        # The counted operations, by the counter name
+        self.md_Counters = {}
+
+    ##############################
+    # Member methods definitions #
+    ##############################
+
+    # Turns the profiling on
+    def enable(self):
+        self.mb_Enabled = True
+
+    # Turns the profiling off, the collected data is kept
+    def disable(self):
+        self.mb_Enabled = False
+
+    # Checks if the profiling is on
+    def is_enabled(self):
+        return self.mb_Enabled
+
+    # Removes all of the collected data
+    def reset(self):
+        self.md_Phases.clear()
+        self.md_Counters.clear()
+
+    # Starts measuring a phase, returns the starting time to be passed to stop, or None when disabled
+    def start(self):
+        if not self.mb_Enabled:
+            return None
+
+        return time.perf_counter()
+
+    # Adds the time, that has passed since the start, to the phase
+    def stop(self, phase=str, started=None):
+        if started is None:
+            return
+
+        elapsed = time.perf_counter() - started
+
+        measurement = self.md_Phases.get(phase)
+
+        if measurement is None:
+            self.md_Phases[phase] = [1, elapsed]
+        else:
+            measurement[0] += 1
+            measurement[1] += elapsed
+
+    # Adds the amount to the counter
+    def count(self, counter=str, amount=int(1)):
+        if self.mb_Enabled:
+            self.md_Counters[counter] = self.md_Counters.get(counter, 0) + amount
+
+    # Returns the report of the collected data, the time of a phase includes the phases measured inside of it
+    def get_report(self):
+        return {
+            "phases": {
+                phase: {
+                    "calls": calls,
+                    "total": total,
+                    "mean": total / calls,
+                }
+                for phase, (calls, total) in sorted(self.md_Phases.items())
+            },
+            "counters": dict(sorted(self.md_Counters.items())),
+        }
+
+    # Writes the report to a json file, along with the optional information about the run
+    def save_report(self, path=str, run=None):
+        report = self.get_report()
+
+        if run is not None:
+            report["run"] = run
+
+        with open(path, "w") as file:
+            json.dump(report, file, indent=4)
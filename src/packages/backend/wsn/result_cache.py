@@ -0,0 +1,192 @@
+################################################################
+# On disk cache of the simulations results. Every run is keyed #
+# by a hash of its whole configuration, so the same settings,  #
+# energy model and random stream are never simulated twice.    #
+# The cache is bounded in size, the least recently used        #
+# results are removed first                                    #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# The energy model constants are a part of the configuration
+from ..node_components import SOC
+
+# Hashing the configurations
+import hashlib
+
+# Storing the results
+import json
+
+# Files management
+import os
+
+
+#####################
+# Object definition #
+#####################
+
+
+class ResultCache:
+    # Version of the cached results, has to be increased whenever their format or meaning changes.
+    # The changes in the code of the simulation are covered by the hash of its sources
+    mv_Version = 3
+
+    # Takes the directory of the cache and its maximum size in bytes
+    def __init__(self, directory=str, max_size=int(64 * 1024 * 1024)):
+        #############
+        # Variables #
+        #############
+
+        # Directory with one file per cached run
+        self.mv_Directory = directory
+
+        # The size limit of all of the files together
+        self.mv_MaxSize = max_size
+
+        # Statistics of the cache usage
+        self.mv_Hits = 0
+        self.mv_Misses = 0
+
+        # The hash of the simulation code, the results of the other versions of the code are never used
+        self.mv_SourceHash = self.calculate_source_hash()
+
+        os.makedirs(self.mv_Directory, exist_ok=True)
+
+    ##############################
+    # Member methods definitions #
+    ##############################
+
+    # Hashes the sources of the backend packages, the simulation, the nodes and their components,
+    # in the same order on every system
+    def calculate_source_hash(self):
+        backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        digest = hashlib.sha256()
+
+        for directory, directories, files in os.walk(backend):
+            directories.sort()
+
+            for name in sorted(files):
+                if not name.endswith(".py"):
+                    continue
+
+                path = os.path.join(directory, name)
+
+                relative_path = os.path.relpath(path, backend).replace(os.sep, "/")
+                digest.update(relative_path.encode())
+
+                with open(path, "rb") as file:
+                    digest.update(file.read())
+
+        return digest.hexdigest()
+
+    # Returns the constants of the energy model used by the nodes
+    def get_energy_constants(self):
+        soc = SOC()
+
+        return {
+            "sensing": soc.get_sensing_consumption(),
+            "antenna": soc.get_antenna_consumption(),
+            "amplifier_low": soc.get_low_power_amplifier_consumption(),
+            "amplifier_high": soc.get_high_power_amplifier_consumption(),
+            "data_packet_size": soc.get_data_packet_size(),
+            "status_message_size": soc.get_status_message_size(),
+        }
+
+    # Returns the hash of the run configuration, the algorithm index, the network settings and the random stream
+    def get_key(self, algorithm, settings, seed_sequence):
+        configuration = {
+            "version": self.mv_Version,
+            "source": self.mv_SourceHash,
+            "algorithm": algorithm,
+            "settings": settings,
+            "energy": self.get_energy_constants(),
+            "seed": [
+                str(seed_sequence.entropy),
+                list(seed_sequence.spawn_key),
+                seed_sequence.pool_size,
+            ],
+        }
+
+        return hashlib.sha256(
+            json.dumps(configuration, sort_keys=True).encode()
+        ).hexdigest()
+
+    # Returns the path of the file of the given key
+    def get_path(self, key):
+        return os.path.join(self.mv_Directory, key + ".json")
+
+    # Returns the cached (algorithm, rounds, coverage data) result or None, if the run isn't cached
+    def get(self, key):
+        path = self.get_path(key)
+
+        try:
+            with open(path) as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            self.mv_Misses += 1
+            return None
+
+        # Marking the result as recently used
+        os.utime(path)
+
+        self.mv_Hits += 1
+
+        return (
+            data["algorithm"],
+            tuple(data["rounds"]),
+            [tuple(item) for item in data["coverage"]],
+        )
+
+    # Stores the result of a run, the size limit is enforced later with evict
+    def put(self, key, result):
+        algorithm, rounds, coverage = result
+
+        path = self.get_path(key)
+        temporary_path = path + "." + str(os.getpid()) + ".tmp"
+
+        # Writing to a temporary file first, so other processes never read a partial result
+        with open(temporary_path, "w") as file:
+            json.dump(
+                {
+                    "algorithm": algorithm,
+                    "rounds": list(rounds),
+                    "coverage": [list(item) for item in coverage],
+                },
+                file,
+            )
+
+        os.replace(temporary_path, path)
+
+    # Removes the least recently used results until the cache fits in its size limit
+    def evict(self):
+        entries = []
+        size = 0
+
+        for entry in os.scandir(self.mv_Directory):
+            if entry.name.endswith(".json"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.path, stat.st_size))
+                size += stat.st_size
+
+        entries.sort()
+
+        for modified, path, file_size in entries:
+            if size <= self.mv_MaxSize:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+            size -= file_size
+
+    # Removes all of the cached results
+    def clear(self):
+        for entry in os.scandir(self.mv_Directory):
+            if entry.name.endswith(".json"):
+                os.remove(entry.path)
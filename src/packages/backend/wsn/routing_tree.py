@@ -0,0 +1,90 @@
+################################################################
+# Shortest path tree of the routes to a single root node. One  #
+# search from the root over the sparse graph of the links      #
+# gives the parent of every node, the ordered hops of any node #
+# are then read by following the parents up to the root        #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# Arrays of the parents and the costs
+import numpy as np
+
+# Searching the sparse graph
+from scipy.sparse.csgraph import dijkstra
+
+
+#####################
+# Object definition #
+#####################
+
+
+class RoutingTree:
+    # Takes the sparse matrix of the links weights between the nodes and the index of the root.
+    # The links are used in both directions. When unweighted, every link counts as one hop,
+    # so the tree is the one of a breadth first search
+    def __init__(self, graph, root=int, unweighted=False):
+        #############
+        # Variables #
+        #############
+
+        # The index of the root node
+        self.mv_Root = root
+
+        # The cost of the cheapest route from the root to every node and the parent of every node on that route.
+        # The unreachable nodes have an infinite cost, they and the root have a negative parent
+        self.ma_Costs, self.ma_Parents = dijkstra(
+            graph,
+            directed=False,
+            indices=root,
+            return_predecessors=True,
+            unweighted=unweighted,
+        )
+
+    ##############################
+    # Member methods definitions #
+    ##############################
+
+    # Returns the index of the root node
+    def get_root(self):
+        return self.mv_Root
+
+    # Checks if there is any route from the node to the root
+    def is_reachable(self, index=int):
+        return bool(np.isfinite(self.ma_Costs[index]))
+
+    # Returns the cost of the cheapest route from the node to the root
+    def get_cost(self, index=int):
+        return float(self.ma_Costs[index])
+
+    # Returns the next hop of the node on its way to the root, or None for the root and the unreachable nodes
+    def get_parent(self, index=int):
+        parent = self.ma_Parents[index]
+
+        if parent < 0:
+            return None
+
+        return int(parent)
+
+    # Returns the ordered hops from the node to the root, the next hop first and the root last.
+    # The root has no hops, None is returned for the unreachable nodes
+    def get_path(self, index=int):
+        if not self.is_reachable(index):
+            return None
+
+        path = []
+        parent = self.ma_Parents[index]
+
+        while parent >= 0:
+            path.append(int(parent))
+            parent = self.ma_Parents[parent]
+
+        return path
+
+    # Returns the ordered hops of all of the nodes, by the node index
+    def get_paths(self):
+        return [self.get_path(index) for index in range(len(self.ma_Parents))]
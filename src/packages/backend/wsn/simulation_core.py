@@ -0,0 +1,2541 @@
+###################################################
+# Simulation core of the sensoric network. It     #
+# contains all of the nodes and the approaches to #
+# the WSN coverage problem, a naive one and the   #
+# Particle Swarm Optimisation. It has no GUI      #
+# dependencies, the events of the simulation are  #
+# passed to the registered observers callbacks    #
+###################################################
+
+
+############
+# Includes #
+############
+
+
+# For enabling the network functions
+from .. import wsn_nodes as components
+
+# For passing the simulation events to the observers
+from .observable import Observable
+
+# For the neighbourhood and area queries over the nodes
+from .spatial_index import SpatialIndex
+
+# For the distances between the nodes, calculated once per layout
+from .distance_cache import DistanceCache
+
+# For the links between the nodes within the communication range
+from .communication_graph import CommunicationGraph
+
+# For the shortest routes of all of the nodes to the sink
+from .routing_tree import RoutingTree
+
+# For finding the nodes cut off from the base station
+from .connectivity_tracker import ConnectivityTracker
+
+# For measuring the phases of the simulations
+from .profiler import Profiler
+
+# For limiting the amount of the plot updates
+from .plot_throttle import PlotThrottle
+
+# For the array backed network state and the random streams
+import numpy as np
+
+# For linking the base station with the graph of the routes
+from scipy.sparse import csr_matrix
+
+# For the calculations
+import math
+
+# Geographical functionality
+import shapely
+
+# Threading support
+import threading
+
+# Messages about the progress of the simulations
+import logging
+
+
+#######################################
+
+
+# The progress messages are shown only when the application sets up the logging, eg. the window does
+logger = logging.getLogger(__name__)
+
+
+# Mutex with the same interface as the QMutex, so the core can be used both with and without Qt
+class Mutex:
+    def __init__(self):
+        # The lock itself
+        self.mo_Lock = threading.Lock()
+
+        # Identifier of the thread holding the lock, None when it's free
+        self.mv_Owner = None
+
+    # Blocks until the mutex is acquired
+    def lock(self):
+        self.mo_Lock.acquire()
+        self.mv_Owner = threading.get_ident()
+
+    # Tries to acquire the mutex without blocking, returns whether it succeeded
+    def tryLock(self):
+        if not self.mo_Lock.acquire(blocking=False):
+            return False
+
+        self.mv_Owner = threading.get_ident()
+        return True
+
+    # Releases the mutex, only the thread holding it can unlock it
+    def unlock(self):
+        if self.mv_Owner != threading.get_ident():
+            raise RuntimeError("The mutex isn't held by the current thread")
+
+        self.mv_Owner = None
+        self.mo_Lock.release()
+
+
+# Swarm of particles for the PSO algorithm, the state of every particle is kept in arrays indexed by the particle number
+class Swarm:
+    # Fixed set of the attributes, there is no per object dictionary
+    __slots__ = (
+        "ma_Positions",
+        "ma_Velocities",
+        "ma_Radii",
+        "mv_GBestIndex",
+        "mv_GBestFitness",
+        "ma_Areas",
+    )
+
+    # Takes the initial (x, y) positions, the initial velocities and the radii of the particles
+    def __init__(self, positions, velocities, radii):
+        #############
+        # Variables #
+        #############
+
+        # Current positions of the particles, one (x, z) row per particle
+        self.ma_Positions = np.array(positions, dtype=np.float64).reshape(-1, 2)
+
+        # Current x and z velocities of the particles
+        self.ma_Velocities = np.array(velocities, dtype=np.float64).reshape(-1, 2)
+
+        # Candidate CH circular area radii
+        self.ma_Radii = np.array(radii, dtype=np.float64).reshape(-1)
+
+        # Index of the particle, that is the global best. The global best follows the particle as it moves
+        self.mv_GBestIndex = None
+
+        # Fitness value of the global best, None when it has to be calculated again
+        self.mv_GBestFitness = None
+
+        # Circular areas of the particles, built only when needed
+        self.ma_Areas = None
+
+    ##############################
+    # Member methods definitions #
+    ##############################
+
+    # Gets the amount of particles
+    def get_size(self):
+        return len(self.ma_Radii)
+
+    # Gets the position of a particle
+    def get_position(self, index):
+        return self.ma_Positions[index]
+
+    # Gets the radius of a particle
+    def get_radius(self, index):
+        return float(self.ma_Radii[index])
+
+    # Gets the personal best position of a particle. Every particle is its own personal best,
+    # so it's the current position of the particle
+    def get_pbest_position(self, index):
+        return self.ma_Positions[index]
+
+    # Gets the personal best radius of a particle, the current one as with the position
+    def get_pbest_radius(self, index):
+        return float(self.ma_Radii[index])
+
+    # Gets the current position of the global best particle
+    def get_gbest_position(self):
+        return self.ma_Positions[self.mv_GBestIndex]
+
+    # Gets the current radius of the global best particle
+    def get_gbest_radius(self):
+        return float(self.ma_Radii[self.mv_GBestIndex])
+
+    # Gets the index of the global best particle
+    def get_gbest_index(self):
+        return self.mv_GBestIndex
+
+    # Gets the fitness value of the global best, None when it has to be calculated again
+    def get_gbest_fitness(self):
+        return self.mv_GBestFitness
+
+    # Gets the circular areas of all of the particles
+    def get_areas(self):
+        if self.ma_Areas is None:
+            self.ma_Areas = shapely.buffer(shapely.points(self.ma_Positions), self.ma_Radii)
+
+        return self.ma_Areas
+
+    # Makes a particle the global best, along with its fitness
+    def set_gbest(self, index, fitness=None):
+        self.mv_GBestIndex = index
+        self.mv_GBestFitness = fitness
+
+    # Sets the fitness value of the global best, None when it has to be calculated again
+    def set_gbest_fitness(self, fitness):
+        self.mv_GBestFitness = fitness
+
+    # Checks if the circular areas of two particles overlap, the same way as the IoU does
+    def are_overlapping(self, index, other):
+        return np.hypot(
+            self.ma_Positions[index, 0] - self.ma_Positions[other, 0],
+            self.ma_Positions[index, 1] - self.ma_Positions[other, 1],
+        ) <= (self.ma_Radii[other] + self.ma_Radii[index])
+
+    # Updates the velocity of a particle with the current personal and global bests
+    def update_velocity(self, index, w, c1, c2, r1, r2):
+        velocity = self.ma_Velocities[index]
+
+        self.ma_Velocities[index] = (
+            w * velocity
+            + c1 * r1 * (self.get_pbest_position(index) - velocity)
+            + c2 * r2 * (self.get_gbest_position() - velocity)
+        )
+
+    # Reverses the velocity, that would take the particle out of the area, then moves the particle.
+    # The circular area of the particle is rebuilt along with its radius
+    def update_position(self, index, width, height):
+        position = self.ma_Positions[index]
+        velocity = self.ma_Velocities[index]
+
+        bounds = np.array((width, height), dtype=np.float64)
+
+        # Reflecting from the left and the bottom borders
+        velocity[(position + velocity < 0) & (velocity < 0)] *= -1
+
+        # Reflecting from the right and the top borders
+        velocity[(position + velocity > bounds) & (velocity > 0)] *= -1
+
+        position += velocity
+
+    # Scales the radius of a particle with its distance from the base station, limited by the maximum radius
+    def update_radius(self, index, base_x, base_z, dis_max, radius_min, radius_max):
+        position = self.ma_Positions[index]
+
+        distance = np.hypot(position[0] - base_x, position[1] - base_z)
+
+        self.ma_Radii[index] = min(
+            distance / dis_max * (radius_max - radius_min) + radius_min, radius_max
+        )
+
+        if self.ma_Areas is not None:
+            self.ma_Areas[index] = shapely.Point(position).buffer(self.ma_Radii[index])
+
+
+# The simulation core with all of the network's funcitonality, it runs without any GUI framework
+class SimulationCore(Observable):
+    #######################
+    # Methods definitions #
+    #######################
+
+    # A constructor. Takes the amount of nodes,
+    # battery capacity, lower left and upper right point of the area covered by sensors as params.
+    # The seed of the random stream can be a number or a SeedSequence, a random one is used if none given
+    def __init__(
+        self,
+        node_amount=int(10),
+        battery_capacity=int(50),
+        height=int(200),
+        width=int(200),
+        minimum_coverage=int(70),
+        seed=None,
+    ):
+        #####################
+        # Threading support #
+        #####################
+
+        # Mutex object for securing the memory changes, every network has its own
+        self.mutex = self.create_mutex()
+
+        #############
+        # Observers #
+        #############
+
+        # Callbacks registered for the simulation events, by the event name eg. "fnd_naive"
+        self.md_Observers = {}
+
+        ##################
+        # Random streams #
+        ##################
+
+        # The seed, that the network's random stream and its child streams are derived from
+        self.mo_SeedSequence = None
+
+        # The random stream used for the layouts and the PSO
+        self.mo_Random = None
+
+        self.set_seed(seed)
+
+        ###############################
+        # Approaches choice variables #
+        ###############################
+
+        # List containing the names of the implemented approaches to improving the lifetime of a WSN
+        self.ml_Algorithms = ["Naiwny", "PSO"]
+
+        # Runtime speed x times faster than real
+        self.ml_RuntimeSpeed = ["100", "500", "1000", "10000"]
+
+        #####################
+        # Network variables #
+        #####################
+
+        # Setting a list of points temporarily, in order to create a polygon
+        self.ml_AreaBounds = [
+            shapely.Point(0, 0),
+            shapely.Point(width, 0),
+            shapely.Point(width, height),
+            shapely.Point(0, height),
+        ]
+
+        # Contains the area polygon
+        self.mv_AreaPolygon = shapely.Polygon([[p.x, p.y] for p in self.ml_AreaBounds])
+
+        # Contains the width of the area
+        self.mv_Width = width
+
+        # Contains the height of the area
+        self.mv_Height = height
+
+        # The amount of the nodes
+        self.mv_NodeAmount = node_amount
+
+        # Active nodes amount
+        self.mv_ActiveNodes = 0
+
+        # The minimum percentile value of the area that the WSN has to cover
+        self.mv_MinimumCoverage = minimum_coverage
+
+        # The current value that the network covers
+        self.mv_CurrentCoverage = None
+
+        # Cell capacity of the nodes
+        self.mv_BatteryCapacity = battery_capacity
+
+        ######################
+        # Nodes, Groups etc. #
+        ######################
+
+        # Contains the base station
+        self.mv_BaseStation = components.Node(
+            battery_capacity,
+            self.mv_AreaPolygon.point_on_surface().coords[:][0][0],
+            self.mv_AreaPolygon.point_on_surface().coords[:][0][1],
+        )
+
+        # List of all of the sinks that are currently used in any of the solutions
+        self.ml_SinkNodes = []
+
+        # Array backed state of all of the standard nodes, the rounds are simulated on it
+        self.mo_State = components.NetworkState(0, battery_capacity)
+
+        # List of all of the standard nodes excluding the sink nodes, views of the state above
+        self.ml_Nodes = []
+
+        # Spatial index over the nodes positions, rebuilt with every layout
+        self.mo_SpatialIndex = SpatialIndex(self.mo_State.ma_Positions)
+
+        # Distances between the nodes and to the base station, rebuilt with every layout
+        self.mo_DistanceCache = DistanceCache(self.mo_State.ma_Positions, (0, 0))
+
+        # Links between the nodes within the communication range, built on the first use for every layout
+        self.mo_CommunicationGraph = None
+
+        # Possibly used for algorithms using grouping as an optimisation
+        self.ml_Clusters = []
+
+        #
+        self.ml_NodeToBaseNode = set()
+
+        #
+        self.ml_ClusterHeads = set()
+
+        ######################
+        # Simulation results #
+        ######################
+
+        # Marks the round in which first node dies
+        self.mv_FND = 0
+
+        # Marks the round in which half of the node is dead
+        self.mv_HND = 0
+
+        # Marks the round in which the last node dies,
+        # after which the coverage drops below threshold
+        self.mv_LND = 0
+
+        # The amount of the living nodes, that can no longer reach the base station over the communication links
+        self.mv_CutOffNodes = 0
+
+        #################
+        # Miscellaneous #
+        #################
+
+        # Max iterations of the PSO algorithm, should be 2500
+        self.mv_MaxIteration = 100
+
+        # Runs the naive algorithm by computing the nodes death rounds instead of iterating every round
+        self.mb_FastForward = True
+
+        # Calculates the IoU on the buffered polygons instead of the circles centres and radii, kept as a reference
+        self.mb_GeometricIoU = False
+
+        # Skips the PSO steady state rounds in which no node dies and the routes stay the same
+        self.mb_EventStepping = True
+
+        # Stops simulating the nodes cut off from the base station, off by default as the links are costly to build
+        self.mb_TrackConnectivity = False
+
+        # The connectivity of the living nodes with the base station during a run, when it's tracked
+        self.mo_Connectivity = None
+
+        # Measures the phases of the runs, there is none when the profiling is off and its calls are skipped
+        self.mo_Profiler = None
+
+        # Limits the plot updates during the runs to 10 per second
+        self.mo_PlotThrottle = PlotThrottle(10)
+
+        # Currently used algorithm
+        self.mv_CurrentAlgorithm = self.ml_Algorithms[0]
+
+        # Stores the plot data
+        self.ml_xAxisPlotData = []
+        self.ml_yAxisPlotData = []
+        self.ml_ColorPlotData = []
+
+        ############
+        # Booleans #
+        ############
+
+        # Activated after every call on "Collect data" on the nodes
+        self.mb_DataCollectionRequestSent = False
+
+        # Activated if all of the nodes properties are set
+        self.mb_EssentialPropertiesSet = False
+
+        # Activated if the nodes are initialised
+        self.mb_NodesInitialised = False
+
+        # Activated after the initialisation of the nodes, by that I mean:
+        # location has been assigned and parameters like cell capacity are correct
+        self.mb_Ready = False
+
+        # Activated if a valid lists of neighbours has been created for every node
+        self.mb_NeighboursAssigned = False
+
+        # Activated if a node raises an exception concerning the low battery level of a particular node
+        self.mb_LayoutShuffleNeeded = False
+
+        #
+        self.mb_SizeChanged = False
+
+        #
+        self.mb_BatteryCapacity = False
+
+        #
+        self.mb_CoverageUnderThreshold = False
+
+        #
+        self.mb_FirstNodeDied = False
+        self.mb_HalfNodesDies = False
+        self.mb_LastNodeDied = False
+
+        # Emitting the si_runtime_detailsgnals to the main app
+        self.notify("algorithms_list", self.ml_Algorithms)
+
+    ##############################
+    # Member methods definitions #
+    ##############################
+
+    #####################
+    # Threading support #
+    #####################
+
+    # Creates the mutex of the network, the adapters of the GUI frameworks can use their own one
+    def create_mutex(self):
+        return Mutex()
+
+    ##################
+    # Random streams #
+    ##################
+
+    # Restarts the random stream of the network from the given seed, a number or a SeedSequence
+    def set_seed(self, seed=None):
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+
+        self.mo_SeedSequence = seed
+        self.mo_Random = np.random.default_rng(seed)
+
+    # Returns the seed of the network's random stream
+    def get_seed(self):
+        return self.mo_SeedSequence
+
+    # Returns the given amount of independent child seeds, eg. for the parallel repetitions
+    def spawn_seeds(self, amount=int):
+        self.mutex.lock()
+
+        seeds = self.mo_SeedSequence.spawn(amount)
+
+        self.mutex.unlock()
+
+        return seeds
+
+    # Sends the settings of the network along with a new child seed, so a batch of runs can be started from
+    # another thread without touching the network there
+    def get_batch_settings(self):
+        self.notify("batch_settings", self.get_settings(), self.spawn_seeds(1)[0])
+
+    #####################
+    # Setters / Getters #
+    #####################
+
+    # Sets the height of the networks area
+    def set_height(self, height=int):
+        self.mutex.lock()
+        # Setting the height
+        self.mv_Height = height
+
+        # Deactivating the ready flag
+        self.mb_Ready = False
+        self.mb_NodesInitialised = False
+
+        # Recreating the Area bounds and the polygon
+        self.ml_AreaBounds = [
+            shapely.Point(0, 0),
+            shapely.Point(self.mv_Width, 0),
+            shapely.Point(self.mv_Width, height),
+            shapely.Point(0, height),
+        ]
+        self.mv_AreaPolygon = shapely.Polygon([[p.x, p.y] for p in self.ml_AreaBounds])
+
+        # After changing the dimensions I have to reinitiate the network partly
+        for node in self.ml_Nodes:
+            node.clear()
+
+        self.mutex.unlock()
+        self.mutex.lock()
+
+        self.ml_SinkNodes.clear()
+        self.ml_Nodes.clear()
+        self.ml_Clusters.clear()
+
+        self.mutex.unlock()
+
+        self.initiate_network()
+
+        self.notify("fnd_naive", 0)
+        self.notify("hnd_naive", 0)
+        self.notify("lnd_naive", 0)
+        self.notify("fnd_pso", 0)
+        self.notify("hnd_pso", 0)
+        self.notify("lnd_pso", 0)
+
+        self.calculate_plot_data()
+
+    # Sets the width of the networks area
+    def set_width(self, width=int):
+        self.mutex.lock()
+        # Setting the width
+        self.mv_Width = width
+
+        # Deactivating the ready flag
+        self.mb_Ready = False
+        self.mb_NodesInitialised = False
+
+        # Recreating the Area bounds and the polygon
+        self.ml_AreaBounds = [
+            shapely.Point(0, 0),
+            shapely.Point(width, 0),
+            shapely.Point(width, self.mv_Height),
+            shapely.Point(0, self.mv_Height),
+        ]
+        self.mv_AreaPolygon = shapely.Polygon([[p.x, p.y] for p in self.ml_AreaBounds])
+
+        # After changing the dimensions I have to reinitiate the network partly
+        for node in self.ml_Nodes:
+            node.clear()
+
+        self.mutex.unlock()
+
+        self.mutex.lock()
+
+        self.ml_SinkNodes.clear()
+        self.ml_Nodes.clear()
+        self.ml_Clusters.clear()
+
+        self.mutex.unlock()
+
+        self.initiate_network()
+
+        self.notify("fnd_naive", 0)
+        self.notify("hnd_naive", 0)
+        self.notify("lnd_naive", 0)
+        self.notify("fnd_pso", 0)
+        self.notify("hnd_pso", 0)
+        self.notify("lnd_pso", 0)
+
+        self.calculate_plot_data()
+
+    # Changes both the height and the width of the area
+    def set_area_dimensions(self, height=int, width=int):
+        self.mutex.lock()
+        # Setting the height
+        self.mv_Width = width
+
+        # Setting the height
+        self.mv_Height = height
+
+        # Deactivating the ready flag
+        self.mb_Ready = False
+        self.mb_NodesInitialised = False
+
+        # Setting a list of points temporarily, in order to create a polygon
+        self.ml_AreaBounds = [
+            shapely.Point(0, 0),
+            shapely.Point(width, 0),
+            shapely.Point(width, height),
+            shapely.Point(0, height),
+        ]
+
+        # Creating a polygon out of the points from above
+        self.mv_AreaPolygon = shapely.Polygon([[p.x, p.y] for p in self.ml_AreaBounds])
+
+        # After changing the dimensions I have to reinitiate the network partly
+        for node in self.ml_Nodes:
+            node.clear()
+
+        self.mutex.unlock()
+
+        self.mutex.lock()
+
+        self.ml_SinkNodes.clear()
+        self.ml_Nodes.clear()
+        self.ml_Clusters.clear()
+
+        self.mutex.unlock()
+
+        self.initiate_network()
+
+    # Sets the nodes amount
+    def set_node_amount(self, amount):
+        self.mutex.lock()
+
+        self.mv_NodeAmount = amount
+
+        # Deactivating the ready flag
+        self.mb_Ready = False
+        self.mb_NodesInitialised = False
+
+        # After changing the dimensions I have to reinitiate the network partly
+        for node in self.ml_Nodes:
+            node.clear()
+
+        self.ml_SinkNodes.clear()
+        self.ml_Nodes.clear()
+        self.ml_Clusters.clear()
+
+        self.mutex.unlock()
+
+        self.initiate_network()
+
+        self.notify("fnd_naive", 0)
+        self.notify("hnd_naive", 0)
+        self.notify("lnd_naive", 0)
+        self.notify("fnd_pso", 0)
+        self.notify("hnd_pso", 0)
+        self.notify("lnd_pso", 0)
+
+        self.calculate_plot_data()
+
+    # Sets the battery capacity in mAH
+    def set_node_battery_capacity(self, capacity):
+        self.mutex.lock()
+        self.mv_BatteryCapacity = capacity
+        self.mutex.unlock()
+
+        self.mo_State.set_battery_capacity(self.mv_BatteryCapacity)
+
+    # Changes the minimum coverage value
+    def set_minimum_coverage_value(self, percent_of_area=int):
+        self.mutex.lock()
+        self.mv_MinimumCoverage = percent_of_area
+        self.mutex.unlock()
+
+    # Sets the current algorithm
+    def set_algorithm(self, index=int):
+        self.mutex.lock()
+        self.mv_CurrentAlgorithm = self.ml_Algorithms[index]
+        logger.info("Algorithm changed to:" + self.ml_Algorithms[index])
+        self.mutex.unlock()
+
+    # Setting a sink node
+    def set_sink_node(self, node_number=int):
+        self.mutex.lock()
+
+        sink = id(self.ml_Nodes[node_number])
+
+        self.ml_SinkNodes.append(sink)
+
+        for node in self.ml_Nodes:
+            node.set_sink_node(self.ml_Nodes[node_number])
+
+        self.mutex.unlock()
+
+    #
+    def get_height(self):
+        self.notify("height", self.mv_Height)
+        # return str(self.mv_Height)
+
+    #
+    def get_width(self):
+        self.notify("width", self.mv_Width)
+        # return str(self.mv_Width)
+
+    #
+    def get_node_amount(self):
+        self.notify("node_amount", self.mv_NodeAmount)
+        # return str(self.mv_NodeAmount)
+
+    #
+    def get_node_battery_capacity(self):
+        self.notify("node_battery_capacity", str(self.mv_BatteryCapacity))
+        # return str(self.mv_BatteryCapacity)
+
+    def get_minimum_coverage_value(self):
+        self.notify("minimum_coverage", str(self.mv_MinimumCoverage))
+        # return str(self.mv_MinimumCoverage)
+
+    def get_current_algorithm(self):
+        self.notify("current_algorithm", str(self.mv_CurrentAlgorithm))
+        # return str(self.mv_CurrentAlgorithm)
+
+    # Returns the value of rounds that a simulation has passed
+    def get_rounds(self):
+        # 0 - first node died
+        # 1 - half nodes died
+        # 2 - last node died
+        # self.notify("rounds", [str(self.mv_FND), str(self.mv_HND), str(self.mv_LND)])
+        return [str(self.mv_FND), str(self.mv_HND), str(self.mv_LND)]
+
+    # Returns the parameters needed for recreating this network, eg. in another process
+    def get_settings(self):
+        self.mutex.lock()
+
+        settings = {
+            "node_amount": self.mv_NodeAmount,
+            "battery_capacity": self.mv_BatteryCapacity,
+            "height": self.mv_Height,
+            "width": self.mv_Width,
+            "minimum_coverage": self.mv_MinimumCoverage,
+            "max_iteration": self.mv_MaxIteration,
+            "fast_forward": self.mb_FastForward,
+            "geometric_iou": self.mb_GeometricIoU,
+            "event_stepping": self.mb_EventStepping,
+            "track_connectivity": self.mb_TrackConnectivity,
+        }
+
+        self.mutex.unlock()
+
+        return settings
+
+    # Turns the tracking of the nodes cut off from the base station on or off
+    def set_connectivity_tracking(self, enabled=bool):
+        self.mb_TrackConnectivity = enabled
+
+    # Turns the profiling of the runs on or off, turning it off drops the collected data
+    def set_profiling(self, enabled=bool):
+        if not enabled:
+            self.mo_Profiler = None
+        elif self.mo_Profiler is None:
+            self.mo_Profiler = Profiler(True)
+
+    # Returns the profiler of the runs, an empty one when the profiling is off
+    def get_profiler(self):
+        if self.mo_Profiler is None:
+            return Profiler()
+
+        return self.mo_Profiler
+
+    # Returns the profiling report of the last run, along with the run's algorithm and settings
+    def get_profile_report(self):
+        report = self.get_profiler().get_report()
+        report["run"] = {"algorithm": self.mv_CurrentAlgorithm, **self.get_settings()}
+
+        return report
+
+    # Writes the profiling report of the last run to a json file
+    def save_profile_report(self, path=str):
+        self.get_profiler().save_report(
+            path, {"algorithm": self.mv_CurrentAlgorithm, **self.get_settings()}
+        )
+
+    #
+    def get_algorithms_list(self):
+        self.notify("algorithms_list", self.ml_Algorithms)
+        # return self.ml_Algorithms
+
+    #
+    def get_plot_data(self):
+        self.notify(
+            "plot_data",
+            [self.ml_xAxisPlotData, self.ml_yAxisPlotData, self.ml_ColorPlotData],
+        )
+        # return [self.ml_xAxisPlotData, self.ml_yAxisPlotData, self.ml_ColorPlotData]
+
+    #########################
+    # Network setup methods #
+    #########################
+
+    # Initialises the network with stored parameters, random = uniform distribution for nodes placement
+    def initiate_network(self):
+        started = None
+
+        # Every layout starts a new run, with a new profile
+        if self.mo_Profiler is not None:
+            self.mo_Profiler.reset()
+            started = self.mo_Profiler.start()
+
+        # Placing the nodes in random points taken from the area that shall be covered, all of them at once
+        positions = self.mo_Random.uniform(
+            (0.0, 0.0), (self.mv_Width, self.mv_Height), (self.mv_NodeAmount, 2)
+        )
+
+        # Creating the nodes locations in bulk, the sensing areas are only created when needed
+        locations = shapely.points(positions)
+
+        self.mutex.lock()
+
+        # Creating the state, that stores the sensors data
+        self.mo_State = components.NetworkState(
+            self.mv_NodeAmount, self.mv_BatteryCapacity
+        )
+        self.mo_State.set_positions(positions)
+
+        # Creating the base station
+        self.mv_BaseStation = components.Node(
+            self.mv_BatteryCapacity,
+            self.mv_AreaPolygon.point_on_surface().coords[:][0][0],
+            self.mv_AreaPolygon.point_on_surface().coords[:][0][1],
+        )
+
+        # Activating the correct flag on the node
+        self.mv_BaseStation.activate_base_station_flag()
+
+        # Creating the views of the nodes for the object based routines, with the base station set across them
+        self.ml_Nodes = [
+            components.Node(
+                state=self.mo_State,
+                index=i,
+                location=locations[i],
+                base_station=self.mv_BaseStation,
+            )
+            for i in range(self.mv_NodeAmount)
+        ]
+
+        self.mo_State.deactivate()
+
+        # Indexing the new layout for the neighbourhood queries
+        self.mo_SpatialIndex = SpatialIndex(
+            self.mo_State.ma_Positions, self.mo_Profiler
+        )
+
+        # The old distances are no longer valid
+        self.mo_DistanceCache = DistanceCache(
+            self.mo_State.ma_Positions,
+            self.mv_BaseStation.get_coordinates(),
+            self.mo_SpatialIndex,
+        )
+
+        # The links of the new layout are built on their first use
+        self.mo_CommunicationGraph = None
+
+        # Activating the flag indicating that the network is ready for a simulation
+        self.mb_Ready = True
+
+        self.mutex.unlock()
+
+        if self.mo_Profiler is not None:
+            self.mo_Profiler.stop("layout", started)
+
+        self.calculate_plot_data()
+
+    # Calculates the current coverage of the network
+    def calculate_coverage(self):
+        # It is a value of active nodes to total amount of nodes
+        return (self.mv_ActiveNodes * 100) / self.mv_NodeAmount
+
+    # Returns the distance between two nodes of the network, the base station included, from the layout's cache.
+    # The row of the first node is kept in the cache, so the node asked about most often should go first
+    def get_distance(self, node, other):
+        if other is self.mv_BaseStation:
+            node, other = other, node
+
+        if node is self.mv_BaseStation:
+            if other is self.mv_BaseStation:
+                return 0.0
+
+            return self.mo_DistanceCache.get_base_distance(other.mv_Index)
+
+        return self.mo_DistanceCache.get_distance(node.mv_Index, other.mv_Index)
+
+    # Returns the links between the nodes within their communication range, built in bulk on the first use
+    def get_communication_graph(self):
+        if self.mo_CommunicationGraph is None:
+            started = None
+
+            if self.mo_Profiler is not None:
+                started = self.mo_Profiler.start()
+
+            communication_range = max(
+                (node.get_communication_range() for node in self.ml_Nodes),
+                default=components.Node.mv_DefaultCommunicationRange,
+            )
+
+            self.mo_CommunicationGraph = CommunicationGraph(
+                self.mo_DistanceCache, communication_range, self.mo_State.mo_SOC
+            )
+
+            if self.mo_Profiler is not None:
+                self.mo_Profiler.stop("communication_graph", started)
+
+        return self.mo_CommunicationGraph
+
+    # Returns the amount of the nodes within the communication range of the node, the links are built when needed.
+    # The neighbours list of the node is a separate one, filled by the neighbour seeking of the algorithms
+    def get_communication_neighbours_amount(self, node):
+        return self.get_communication_graph().get_neighbours_amount(node.mv_Index)
+
+    # Starts tracking which of the living nodes can reach the base station over the communication links,
+    # when it's turned on. The nodes, that can't reach it from the start, are cut off at once
+    def start_connectivity_tracking(self):
+        self.mo_Connectivity = None
+        self.mv_CutOffNodes = 0
+
+        if not self.mb_TrackConnectivity:
+            return
+
+        started = None
+
+        if self.mo_Profiler is not None:
+            started = self.mo_Profiler.start()
+
+        graph = self.get_communication_graph()
+
+        # The nodes within the communication range of the base station are linked with it
+        base_links = np.flatnonzero(
+            self.mo_DistanceCache.get_base_distances() <= graph.get_range()
+        )
+
+        self.mo_Connectivity = ConnectivityTracker(
+            graph.get_matrix(),
+            base_links,
+            self.mo_State.get_charge_percentage_left() >= 1,
+            self.mo_Profiler,
+        )
+
+        self.cut_off_nodes(self.mo_Connectivity.get_cut_off_indices())
+
+        if self.mo_Profiler is not None:
+            self.mo_Profiler.stop("connectivity", started)
+
+        self.notify("cut_off_nodes", self.mv_CutOffNodes)
+
+    # Removes the dead nodes from the tracked connectivity and stops simulating the nodes cut off by their deaths.
+    # Returns the indices of the nodes cut off in this round, the amount of all of them is sent every round
+    def update_connectivity(self, dead):
+        if self.mo_Connectivity is None:
+            return np.empty(0, dtype=np.intp)
+
+        started = None
+
+        if self.mo_Profiler is not None:
+            started = self.mo_Profiler.start()
+
+        cut_off = self.mo_Connectivity.remove(dead)
+        self.cut_off_nodes(cut_off)
+
+        if self.mo_Profiler is not None:
+            self.mo_Profiler.stop("connectivity", started)
+
+        self.notify("cut_off_nodes", self.mv_CutOffNodes)
+
+        return cut_off
+
+    # Deactivates the nodes, that can no longer reach the base station, they aren't simulated any further
+    def cut_off_nodes(self, indices):
+        if len(indices) == 0:
+            return
+
+        self.mutex.lock()
+
+        self.mv_ActiveNodes -= int(np.count_nonzero(self.mo_State.ma_Active[indices]))
+        self.mo_State.deactivate(indices)
+        self.mv_CutOffNodes += len(indices)
+
+        self.mutex.unlock()
+
+        self.request_plot_update()
+
+    # Checks if the node can no longer reach the base station
+    def is_cut_off(self, node):
+        return self.mo_Connectivity is not None and self.mo_Connectivity.is_cut_off(
+            node.mv_Index
+        )
+
+    # Calculates the energy needed for sending a packet over each of the given distances
+    def calculate_transmission_consumption(self, distances, packet_size=None):
+        if packet_size is None:
+            packet_size = self.mo_State.mo_SOC.get_data_packet_size()
+
+        return self.mo_State.mo_SOC.calculate_transmission_consumption_batch(
+            packet_size, distances
+        )
+
+    ###################################
+    # Naive routing sollution methods #
+    ###################################
+
+    # Builds the tree of the shortest routes from every node to the root node over the communication graph,
+    # or over the links not longer than the given distance. The links are weighted with the "distance",
+    # the transmission "energy" or the "hops". The root is a node or the base station, which isn't one of
+    # the nodes, so it's the extra vertex after them, linked with the nodes within the range
+    def build_routing_tree(self, root, weight="distance", max_distance=None):
+        if max_distance is None:
+            graph = self.get_communication_graph()
+            links = graph.get_matrix(weight)
+            max_distance = graph.get_range()
+        else:
+            links = self.mo_DistanceCache.get_sparse_distances(max_distance)
+
+            if weight == "energy":
+                links = links.copy()
+                links.data = self.calculate_transmission_consumption(links.data)
+
+        size = len(self.ml_Nodes)
+        base_vertex = size
+
+        # The base station takes part in the routes only when they lead to it
+        base_links = np.empty(0, dtype=np.intp)
+        base_costs = np.empty(0)
+
+        if root is self.mv_BaseStation:
+            base_distances = self.mo_DistanceCache.get_base_distances()
+            base_links = np.flatnonzero(base_distances <= max_distance)
+            base_costs = base_distances[base_links]
+
+            if weight == "energy":
+                base_costs = self.calculate_transmission_consumption(base_costs)
+
+        links = links.tocoo()
+
+        graph = csr_matrix(
+            (
+                np.concatenate((links.data, base_costs)),
+                (
+                    np.concatenate((links.row, base_links)),
+                    np.concatenate(
+                        (links.col, np.full(len(base_links), base_vertex))
+                    ),
+                ),
+            ),
+            shape=(size + 1, size + 1),
+        )
+
+        if root is self.mv_BaseStation:
+            return RoutingTree(graph, base_vertex, unweighted=weight == "hops")
+
+        return RoutingTree(graph, root.mv_Index, unweighted=weight == "hops")
+
+    # Returns the nodes of the hops of a route, the vertex after the nodes is the base station
+    def get_route_nodes(self, path):
+        return [
+            self.mv_BaseStation if index == len(self.ml_Nodes) else self.ml_Nodes[index]
+            for index in path
+        ]
+
+    # Sets the ordered hops to the root in every node, that can reach it over the communication links,
+    # the other nodes have no path. Returns the routing tree
+    def establish_routes(self, root, weight="distance"):
+        tree = self.build_routing_tree(root, weight)
+
+        for node, path in zip(self.ml_Nodes, tree.get_paths()):
+            node.clear_path()
+
+            if path is not None and len(path) > 0:
+                node.set_path(self.get_route_nodes(path))
+
+        return tree
+
+    def naive_algorithm(self):
+        #####################################
+        # Nodes setup, searching for a sink #
+        #####################################
+
+        # Activating all of the nodes
+        for node in self.ml_Nodes:
+            node.activate()
+            self.mv_ActiveNodes += 1
+
+        # Contains a circle in which a sink has to be found
+        possible_sink_location = self.mv_AreaPolygon.point_on_surface().buffer(50)
+
+        # Current lowest distance from the middle point
+        lowest_distance = None
+        sink = None
+
+        # Searching for the best sink location in the area near the middle
+        for index in self.mo_SpatialIndex.query_polygon(
+            possible_sink_location, contains=True
+        ):
+            node = self.ml_Nodes[index]
+
+            # Calculating the distance between middle of the area and a node inside the possible sink span
+            temp = shapely.distance(
+                self.mv_AreaPolygon.point_on_surface(), node.get_localization()
+            )
+
+            if lowest_distance == None:
+                lowest_distance = temp
+                sink = node
+            else:
+                if temp < lowest_distance:
+                    lowest_distance = temp
+                    sink = node
+
+        # Adding sink nodes
+        for node in self.ml_Nodes:
+            # Setting the sink node in the other nodes
+            node.add_sink_node(sink)
+
+            if id(node) == id(sink):
+                node.mb_Sink = True
+
+        # A single search from the sink over the communication links gives the ordered route of every node,
+        # the next hop first
+        self.establish_routes(sink)
+
+        while self.calculate_coverage() > self.mv_MinimumCoverage:
+            transfer_done = False
+            logger.info(self.mv_ActiveNodes)
+
+            for node in self.ml_Nodes:
+                if node.is_active() and len(node.ml_Path) > 0:
+                    # The next hop is always linked with the node
+                    node.transmit_data(int(self.get_distance(node, node.ml_Path[0])))
+                    self.calculate_plot_data()
+                    if len(node.ml_Path) > 1:
+                        for element in node.ml_Path:
+                            if element.is_active():
+                                if id(element) != id(sink):
+                                    element.aggregate_data(
+                                        int(self.get_distance(node, element))
+                                    )
+                                    self.calculate_plot_data()
+                                else:
+                                    element.receive_data()
+                                    self.calculate_plot_data()
+                                transfer_done = True
+                            else:
+                                node.deactivate()
+                else:
+                    continue
+
+            if not transfer_done:
+                logger.info("Out!")
+                break
+
+            for node in self.ml_Nodes:
+                if node.get_battery_level() < 5 and node.is_active():
+                    self.mv_ActiveNodes -= 1
+                    node.deactivate()
+
+            if self.mv_ActiveNodes == 0:
+                logger.info("Out?")
+                break
+
+    # Iterative naive algorithm
+    def naive_algorithm_new(self):
+        if not self.mb_Ready:
+            self.initiate_network()
+
+        #####################################
+        # Nodes setup, searching for a sink #
+        #####################################
+
+        self.mutex.lock()
+
+        self.mo_State.activate()
+        self.mv_ActiveNodes += self.mo_State.mv_NodeAmount
+
+        self.mutex.unlock()
+
+        self.mutex.lock()
+        self.mv_LND = 0
+        self.mutex.unlock()
+
+        # The nodes, that can't reach the base station, are not simulated
+        self.start_connectivity_tracking()
+
+        # Every node sends the same packet straight to the base station, so the round cost of a node never changes
+        round_consumption = self.calculate_transmission_consumption(
+            self.mo_DistanceCache.get_base_distances()
+        )
+
+        # The charge the nodes start the simulation with, the energy left is always counted from it
+        initial_capacity = self.mo_State.ma_CurrentCapacity.copy()
+
+        logger.info("Running Naive Simulation")
+
+        started = None
+
+        if self.mo_Profiler is not None:
+            started = self.mo_Profiler.start()
+
+        if self.mb_FastForward:
+            self.naive_fast_forward(initial_capacity, round_consumption)
+        else:
+            while self.calculate_coverage() > self.mv_MinimumCoverage:
+                # The active nodes transmit the data to the base station
+                self.mo_State.mo_SOC.drain_energy_batch(
+                    self.mo_State.ma_CurrentCapacity,
+                    initial_capacity,
+                    round_consumption,
+                    self.mv_LND + 1,
+                    self.mo_State.ma_Active,
+                )
+
+                levels = self.mo_State.get_battery_levels()
+
+                dead = np.flatnonzero((levels < 1) & self.mo_State.ma_Active)
+
+                for index in dead:
+                    self.naive_node_died(index)
+
+                self.update_connectivity(dead)
+
+                self.notify("active_nodes", self.mv_ActiveNodes)
+                self.mv_LND += 1
+
+        if self.mo_Profiler is not None:
+            self.mo_Profiler.stop("naive_rounds", started)
+
+        # Publishing the changes held back by the throttle
+        self.publish_plot_update()
+
+        self.notify("lnd_naive", self.mv_LND)
+        self.mb_LastNodeDied = True
+        self.notify("simulation_finished", True)
+        self.cleanup_after_simulation()
+
+    # Computes the rounds in which the nodes die in a closed form and replays only those rounds.
+    # Gives the same statistics and signals as the round by round loop of the naive algorithm,
+    # the amounts of the nodes of the skipped rounds are sent only when they are observed
+    def naive_fast_forward(self, initial_capacity, round_consumption):
+        # The loop round, in which the battery level of the node drops bellow 1%
+        death_rounds = (
+            self.mo_State.mo_SOC.calculate_rounds_until_level_batch(
+                initial_capacity,
+                self.mo_State.ma_DesignedCapacity,
+                round_consumption,
+                1,
+            )
+            - 1
+        )
+
+        # Sorting the deaths by the round, the nodes dying in the same round keep the loop order
+        order = np.lexsort((np.arange(self.mo_State.mv_NodeAmount), death_rounds))
+        order = order[np.isfinite(death_rounds[order])]
+
+        # The round after which the nodes stop using the energy, the nodes cut off from the start never use it
+        stop_rounds = death_rounds + 1
+        stop_rounds[~self.mo_State.ma_Active] = 0
+
+        position = 0
+
+        while (
+            self.calculate_coverage() > self.mv_MinimumCoverage
+            and position < len(order)
+        ):
+            # Skipping the rounds in which nothing happens
+            self.notify_skipped_rounds(int(death_rounds[order[position]]))
+            self.mv_LND = int(death_rounds[order[position]])
+
+            dead = []
+
+            while (
+                position < len(order) and death_rounds[order[position]] == self.mv_LND
+            ):
+                # The cut off nodes are no longer simulated, so they don't die
+                if self.mo_State.ma_Active[order[position]]:
+                    self.naive_node_died(order[position])
+                    dead.append(order[position])
+
+                position += 1
+
+            stop_rounds[self.update_connectivity(dead)] = self.mv_LND + 1
+
+            self.notify("active_nodes", self.mv_ActiveNodes)
+            self.mv_LND += 1
+
+        # Leaving the charge of the nodes as it would be after the loop
+        self.mo_State.mo_SOC.drain_energy_batch(
+            self.mo_State.ma_CurrentCapacity,
+            initial_capacity,
+            round_consumption,
+            np.minimum(stop_rounds, self.mv_LND),
+        )
+        self.mo_State.get_battery_levels()
+
+    # Sends the amounts of the nodes of every round up to the given one, in which nothing has changed, the same way
+    # as the round by round loop does. The rounds are only counted, when there is nobody to send them to
+    def notify_skipped_rounds(self, last_round=int):
+        if not (
+            self.has_observers("cut_off_nodes") or self.has_observers("active_nodes")
+        ):
+            return
+
+        for _ in range(self.mv_LND, last_round):
+            if self.mo_Connectivity is not None:
+                self.notify("cut_off_nodes", self.mv_CutOffNodes)
+
+            self.notify("active_nodes", self.mv_ActiveNodes)
+
+    # Deactivates the node, that has run out of energy and updates the naive algorithm statistics
+    def naive_node_died(self, index):
+        self.mo_State.deactivate(index)
+        self.mv_ActiveNodes -= 1
+
+        #
+        # TODO: Add the code responsible for creating the coverage plot
+        #
+
+        # Those two values have to be used in order to create said plot
+        self.notify(
+            "coverage_delta_data_naive", (self.mv_CurrentCoverage, self.mv_LND)
+        )
+
+        # The cut off nodes are still alive
+        if (
+            not self.mb_FirstNodeDied
+            and self.mv_ActiveNodes + self.mv_CutOffNodes == self.mv_NodeAmount - 1
+        ):
+            self.mutex.lock()
+            self.mv_FND = self.mv_LND
+            self.mutex.unlock()
+            self.notify("fnd_naive", self.mv_LND)
+            self.mutex.lock()
+            self.mb_FirstNodeDied = True
+            self.mutex.unlock()
+
+        if (
+            not self.mb_HalfNodesDies
+            and self.mv_ActiveNodes + self.mv_CutOffNodes
+            < self.mv_NodeAmount
+            - (
+                self.mv_NodeAmount
+                - (
+                    int(
+                        float(self.mv_MinimumCoverage / 100)
+                        * float(self.mv_NodeAmount)
+                    )
+                )
+            )
+            / 2
+        ):
+            self.mutex.lock()
+            self.mv_HND = self.mv_LND
+            self.mutex.unlock()
+            self.notify("hnd_naive", self.mv_LND)
+            self.mutex.lock()
+            self.mb_HalfNodesDies = True
+            self.mutex.unlock()
+        self.request_plot_update()
+
+    ###############################################
+    # Particle Swarm Optimisation routing methods #
+    ###############################################
+
+    #
+    def calculate_optimal_clasters_amount(
+        self, radius_start, radius_max, area, dist_max, h_value
+    ):
+        a = area
+        R = radius_start
+        d_m = dist_max
+        r = 0
+        c = 0
+
+        while a > 0:
+            a -= math.pi * (math.pow((2 * R + r), 2) - pow(r, 2))
+            c += ((math.pi * pow(((2 * R) + r), 2)) - (math.pi * pow(r, 2))) / (
+                math.pi * pow(R, 2)
+            )
+            r += 2 * R
+            R = (r * (radius_max - radius_start) + radius_start * dist_max) / (
+                dist_max - radius_max + radius_start
+            )
+
+        c *= h_value
+
+        return c
+
+    # Calculate nodes contained inside the CH candidate circle area
+    def amount_of_nodes_in_area(self, area):
+        # The amount of particles contained
+        amount_contained = 0
+
+        # Calculating the number of nodes that are contained withing the area of the CH candidate
+        amount_contained += len(self.mo_SpatialIndex.query_polygon(area))
+
+        return amount_contained
+
+    # Returns a mask of the state rows of given nodes, the masks are returned as they are
+    def get_nodes_mask(self, nodes):
+        if isinstance(nodes, np.ndarray):
+            return nodes
+
+        mask = np.zeros(self.mo_State.mv_NodeAmount, dtype=bool)
+        mask[[node.mv_Index for node in nodes]] = True
+
+        return mask
+
+    # Calculates the amount of nodes that intersect and compares over universal set(total nodes amount).
+    # The particle with the exclude index is the one compared, so it is skipped in the swarm
+    def IoU(self, position, radius, swarm, active_nodes, exclude=None):
+        if self.mo_Profiler is not None:
+            self.mo_Profiler.count("iou")
+
+        if self.mb_GeometricIoU:
+            return self.geometric_IoU(position, radius, swarm, active_nodes, exclude)
+
+        active_nodes = self.get_nodes_mask(active_nodes)
+
+        # The active nodes inside of the compared circle
+        nodes = self.mo_SpatialIndex.query_radius(position[0], position[1], radius)
+        nodes = nodes[active_nodes[nodes]]
+
+        # The other circles, that are close enough to overlap with the compared one
+        centres = swarm.ma_Positions
+        radii = swarm.ma_Radii
+
+        overlapping = np.hypot(
+            centres[:, 0] - position[0], centres[:, 1] - position[1]
+        ) <= (radius + radii)
+
+        if exclude is not None:
+            overlapping[exclude] = False
+
+        if len(nodes) == 0 or not overlapping.any():
+            return 0
+
+        # A node is in the intersection, when it is also inside of at least one of the other circles
+        distances = np.hypot(
+            self.mo_State.ma_Positions[nodes, 0][:, np.newaxis]
+            - centres[overlapping, 0],
+            self.mo_State.ma_Positions[nodes, 1][:, np.newaxis]
+            - centres[overlapping, 1],
+        )
+
+        particles_in_intersections = np.count_nonzero(
+            (distances <= radii[overlapping]).any(axis=1)
+        )
+
+        # Returning the value
+        return particles_in_intersections / np.count_nonzero(active_nodes)
+
+    # The IoU calculated on the buffered circles polygons, their intersections and the union of those
+    def geometric_IoU(self, position, radius, swarm, active_nodes, exclude=None):
+        # The polygon that I will check for nodes in intersection between a second circle
+        point = shapely.Point(position)
+        area = point.buffer(radius)
+
+        # Contains all of the particles found in the intersections
+        particles_in_intersections = set()
+
+        # Circular areas of the other particles, that overlap with this one
+        areas = swarm.get_areas()
+        overlapping = shapely.intersects(area, areas)
+
+        if exclude is not None:
+            overlapping[exclude] = False
+
+        intersections = list(shapely.intersection(area, areas[overlapping]))
+
+        if self.mo_Profiler is not None:
+            self.mo_Profiler.count("shapely_intersects", len(areas))
+            self.mo_Profiler.count("shapely_intersections", len(intersections))
+
+        if len(intersections) == 0:
+            return 0
+        elif len(intersections) == 1:
+            intersection = intersections[0]
+        else:
+            intersection = shapely.union_all(intersections)
+
+        active_nodes = self.get_nodes_mask(active_nodes)
+
+        for index in self.mo_SpatialIndex.query_polygon(intersection):
+            if active_nodes[index]:
+                particles_in_intersections.add(index)
+
+        # Returning the value
+        return len(particles_in_intersections) / np.count_nonzero(active_nodes)
+
+    # Calculates and updates the velocity, position and radius of a particle
+    def update_particle(
+        self, swarm, index, iteration, dis_max, radius_min, radius_max
+    ):
+        # Constants
+        w_max = 0.9
+        w_min = 0.4
+
+        # The pBest acceleration bias
+        c1 = 1
+        # The gBest acceleration bias
+        c2 = 2
+
+        # Random values from (0,1)
+        r1 = self.mo_Random.uniform(0, 1)
+        r2 = self.mo_Random.uniform(0, 1)
+
+        # The values cant be equal to 0
+        while r1 == 0:
+            r1 = self.mo_Random.uniform(0, 1)
+
+        while r2 == 0:
+            r2 = self.mo_Random.uniform(0, 1)
+
+        # Calculating the inertia value
+        w = w_max - (w_max - w_min) / (self.mv_MaxIteration/10) * iteration
+
+        self.mutex.lock()
+
+        swarm.update_velocity(index, w, c1, c2, r1, r2)
+
+        # The particle bounces off of the area borders
+        swarm.update_position(index, self.mv_Width, self.mv_Height)
+
+        # Calculating and setting the particle radius
+        swarm.update_radius(
+            index,
+            self.mv_BaseStation.get_localization().x,
+            self.mv_BaseStation.get_localization().y,
+            dis_max,
+            radius_min,
+            radius_max,
+        )
+
+        self.mutex.unlock()
+
+    # Moves every particle in turn and compares it with the global best, which the following particles
+    # then move towards. Returns the indices of the particles, that became the global best
+    # The personal best of every particle is the particle itself, so it never has to be compared
+    def move_particles(
+        self, swarm, iteration, node_mask, dis_max, radius_min, radius_max
+    ):
+        gbest_indices = []
+
+        for j in range(swarm.get_size()):
+            gbest = swarm.get_gbest_index()
+
+            # The gbest fitness depends on the other particles through the IoU, so it changes,
+            # when the moved particle overlaps with the gbest before or after the move
+            overlapping = swarm.are_overlapping(j, gbest)
+
+            # Updating the velocity, the position and the radius of the particle
+            self.update_particle(swarm, j, iteration, dis_max, radius_min, radius_max)
+
+            if j == gbest or overlapping or swarm.are_overlapping(j, gbest):
+                swarm.set_gbest_fitness(None)
+
+            # Calculating fitness values
+            fitness_population = self.Fitness(
+                swarm.get_position(j), swarm.get_radius(j), swarm, node_mask, j
+            )
+
+            if swarm.get_gbest_fitness() is None:
+                swarm.set_gbest_fitness(
+                    self.Fitness(
+                        swarm.get_gbest_position(),
+                        swarm.get_gbest_radius(),
+                        swarm,
+                        node_mask,
+                        gbest,
+                    )
+                )
+
+            if fitness_population < swarm.get_gbest_fitness():
+                self.mutex.lock()
+                swarm.set_gbest(j, fitness_population)
+                self.mutex.unlock()
+
+                gbest_indices.append(j)
+
+        return gbest_indices
+
+    # Calculates the fitness parameter without IoT
+    def fitness(self, position, radius):
+        if self.mo_Profiler is not None:
+            self.mo_Profiler.count("fitness")
+
+        # Area of the circular area
+        point = shapely.Point(position)
+        area = point.buffer(radius)
+
+        # The amount of particles contained
+        amount_contained = self.amount_of_nodes_in_area(area)
+
+        # Calculating the ideal amount of particles possible for this network
+        amount_max_possible = area.area * (
+            self.mv_NodeAmount / self.mv_AreaPolygon.area
+        )
+
+        # Calculating the fitness value
+        fitness_value = math.fabs(amount_contained - amount_max_possible)
+
+        # Returning the calculated value
+        return fitness_value
+
+    # Calculates the fitness parameter with IoT
+    def Fitness(self, position, radius, swarm, nodes_active, exclude=None):
+        if self.mo_Profiler is not None:
+            self.mo_Profiler.count("population_fitness")
+
+        point = shapely.Point(position)
+        area = point.buffer(radius)
+
+        # Assuming that alpha = 0.9
+        alpha = 0.9
+
+        # IoU value
+        iou = self.IoU(position, radius, swarm, nodes_active, exclude)
+
+        # Checking if calculating global Fitness is the right choice here
+        if iou == 0:
+            # Returning the value without the
+            return alpha * (self.amount_of_nodes_in_area(area) / self.mv_NodeAmount) + (
+                1 - alpha
+            ) / (0.0001 / np.count_nonzero(self.get_nodes_mask(nodes_active)))
+        else:
+            # Returning the value
+            return alpha * (self.amount_of_nodes_in_area(area) / self.mv_NodeAmount) + (
+                1 - alpha
+            ) / (iou)
+
+    #
+    def Weight(self, node, nodes_active, area):
+        if self.mo_Profiler is not None:
+            self.mo_Profiler.count("weight")
+
+        weight_1 = 0.8
+        weight_2 = 0.05
+        weight_3 = 0.15
+
+        minimum_distance = 100000
+        nodes_in_range = 0
+
+        nodes_active = self.get_nodes_mask(nodes_active)
+
+        # The active nodes inside of the area
+        in_range = self.mo_SpatialIndex.query_polygon(area)
+        in_range = in_range[nodes_active[in_range]]
+
+        if len(in_range) > 0:
+            nodes_in_range = len(in_range)
+            minimum_distance = min(
+                minimum_distance,
+                self.mo_DistanceCache.get_base_distances(in_range).min(),
+            )
+
+        weight = (
+            weight_1 * (node.get_battery_level() / 100)
+            + weight_2 * (nodes_in_range / np.count_nonzero(nodes_active))
+            + weight_3
+            * (minimum_distance / self.get_distance(node, self.mv_BaseStation))
+        )
+
+        return weight
+
+    # Calculates the weight of the next hop candidate
+    def hop_weight(self, node, candidate_node):
+        if self.mo_Profiler is not None:
+            self.mo_Profiler.count("hop_weight")
+
+        u1 = 0.35
+        u2 = 0.45
+        u3 = 0.2
+
+        d0 = self.mv_BaseStation.get_amplifier_threshold_distance()
+
+        dj = self.get_distance(node, candidate_node)
+
+        Ej = candidate_node.get_battery_level()
+
+        dv = math.fabs(
+            (
+                (
+                    self.mv_BaseStation.get_localization().coords[:][0][1]
+                    - node.get_localization().coords[:][0][1]
+                )
+                * candidate_node.get_localization().coords[:][0][0]
+            )
+            + (
+                (
+                    node.get_localization().coords[:][0][0]
+                    - self.mv_BaseStation.get_localization().coords[:][0][0]
+                )
+                * candidate_node.get_localization().coords[:][0][1]
+            )
+            + (
+                self.mv_BaseStation.get_localization().coords[:][0][0]
+                * node.get_localization().coords[:][0][1]
+            )
+            - (
+                self.mv_BaseStation.get_localization().coords[:][0][1]
+                * node.get_localization().coords[:][0][0]
+            )
+        ) / math.sqrt(
+            pow(
+                (
+                    self.mv_BaseStation.get_localization().coords[:][0][1]
+                    - node.get_localization().coords[:][0][1]
+                ),
+                2,
+            )
+            + pow(
+                (
+                    node.get_localization().coords[:][0][0]
+                    - self.mv_BaseStation.get_localization().coords[:][0][0]
+                ),
+                2,
+            )
+        )
+
+        return u1 * (dv / d0) + u2 * (dj / d0) + u3 * (Ej)
+
+    # The setup phase of the PSO algorithm
+    def pso_setup(self):
+        ###############
+        # Setup phase #
+        ###############
+
+        setup_started = None
+
+        if self.mo_Profiler is not None:
+            setup_started = self.mo_Profiler.start()
+
+        self.mutex.lock()
+
+        self.mv_ActiveNodes = 0
+        self.ml_ClusterHeads.clear()
+        self.ml_NodeToBaseNode.clear()
+        for cluster in self.ml_Clusters:
+            cluster.clear()
+        self.ml_Clusters.clear()
+
+        self.mutex.unlock()
+
+        # The distances rows of the old cluster heads are no longer needed
+        self.mo_DistanceCache.clear_rows()
+
+        # Stores the iterations value
+        total_iterations = 0
+
+        # Calculating the max distance from the base node to a node
+        dis_max = max(
+            [
+                self.mo_DistanceCache.get_base_distance(node.mv_Index)
+                for node in self.ml_Nodes
+                if node.get_battery_level() > 2
+            ]
+        )
+
+        # Calculating the maximum radius of a cluster candidate area
+        radius_max = self.mv_BaseStation.get_amplifier_threshold_distance() / 2
+
+        # Calculating the minimum radius of a cluster cadidate area
+        radius_min = math.sqrt(
+            self.mv_AreaPolygon.area / (math.pi * self.mv_NodeAmount)
+        )
+
+        # Calculating the ideal value of circular areas for this network
+        C = self.calculate_optimal_clasters_amount(
+            radius_start=radius_min,
+            radius_max=math.sqrt(self.mv_AreaPolygon.area/(math.pi*self.mv_NodeAmount)),
+            dist_max=dis_max,
+            area=self.mv_AreaPolygon.area,
+            h_value=2.5,
+        )
+
+        # Initial positions and radii of the particles
+        positions = []
+        radii = []
+
+        node_set = set()
+
+        # Creating the particles with inital positions taken from node's positions
+        for node in self.ml_Nodes:
+            node.deactivate()
+
+            if node.get_battery_level() > 1 and not self.is_cut_off(node):
+                # Temporary variable for storing the current distance from base station
+                dis = self.mo_DistanceCache.get_base_distance(node.mv_Index)
+
+                positions.append(self.mo_State.ma_Positions[node.mv_Index])
+                radii.append(dis / dis_max * (radius_max - radius_min) + radius_min)
+
+                # Adding to the nodes_list
+                node_set.add(node)
+
+        # The initial velocities of all of the particles, the same one is used in both of the axes
+        velocities = self.mo_Random.uniform(-50, 50, len(positions))
+
+        self.mutex.lock()
+
+        # Creating the swarm, every particle is its own personal best
+        swarm = Swarm(positions, np.column_stack((velocities, velocities)), radii)
+
+        # Setting the gbest across particles
+        if swarm.get_size() > 0:
+            swarm.set_gbest(0)
+
+        self.mutex.unlock()
+
+        # The same set of nodes as a mask of the state rows for the area queries
+        node_mask = self.get_nodes_mask(node_set)
+
+        # List containing the indices of the particles, that were the gbest. Their current areas
+        # enable the searching of appropriate ch nodes later
+        gbest_values = []
+
+        # Repeating the pso algorithm for a set amount of iterations
+        for i in range(self.mv_MaxIteration):
+            started = None
+
+            if self.mo_Profiler is not None:
+                started = self.mo_Profiler.start()
+
+            # Iterating through the particles
+            for index in self.move_particles(
+                swarm, i, node_mask, dis_max, radius_min, radius_max
+            ):
+                if index not in gbest_values:
+                    gbest_values.append(index)
+
+            if self.mo_Profiler is not None:
+                self.mo_Profiler.stop("particles_fitness", started)
+
+            started = None
+
+            if self.mo_Profiler is not None:
+                started = self.mo_Profiler.start()
+
+            # List for storing the candidates for ch areas after discarding some weak options
+            ch_area_candidates = []
+
+            # Discarding values that don't meet the criteria
+            for index in gbest_values:
+                position = swarm.get_position(index)
+                radius = swarm.get_radius(index)
+
+                # If the ratio of intersected nodes to all nodes is to0 high, discards the candidate
+                if self.IoU(position, radius, swarm, node_mask, index) < 0.75:
+                    ch_area_candidates.append((position, radius))
+
+            if self.mo_Profiler is not None:
+                self.mo_Profiler.stop("ch_candidates", started)
+
+            started = None
+
+            if self.mo_Profiler is not None:
+                started = self.mo_Profiler.start()
+
+            # Searching for the CH nodes in the CH candidate areas
+            for position, radius in ch_area_candidates:
+                # Calculating the polygon of the candidate area
+                area = shapely.Point(position).buffer(radius)
+
+                # List of from which there will be a CH choosen
+                nodes = set()
+
+                ch = (None, 10000000)
+
+                # Checking for nodes that are inside of the candidate area
+                for index in self.mo_SpatialIndex.query_polygon(area):
+                    node = self.ml_Nodes[index]
+
+                    # If the node is withing the area, it is added to the list
+                    if node_mask[index]:
+                        # Calculating and storing the weight value
+                        temp = self.Weight(node, node_mask, area)
+
+                        # Checking if it is bigger than the other
+                        if temp < ch[1]:
+                            # If yes, the tuple takes this candidate's values
+                            ch = (node, temp)
+
+                # Adding found nodes to the set
+                if ch[0] != None:
+                    self.mutex.lock()
+                    ch[0].activate_cluster_head_flag()
+                    self.ml_ClusterHeads.add(ch[0])
+                    self.mutex.unlock()
+
+            if self.mo_Profiler is not None:
+                self.mo_Profiler.stop("ch_selection", started)
+
+            if len(self.ml_ClusterHeads) >= math.ceil(C):
+                break
+
+            total_iterations += 1
+
+        ###############################
+        # Assigning nodes to clusters #
+        ###############################
+
+        started = None
+
+        if self.mo_Profiler is not None:
+            started = self.mo_Profiler.start()
+
+        # Adding the cluster heads to the clusters lists
+        for ch in self.ml_ClusterHeads:
+            if not ch.is_active():
+                self.mutex.lock()
+                # Activating the boolean inside every CH for easy recognition
+                ch.activate()
+                self.mv_ActiveNodes += 1
+                ch.activate_cluster_head_flag()
+
+                self.ml_Clusters.append([ch])
+                self.mutex.unlock()
+
+        # Checking which nodes are closer than d0 to the base station
+        free_nodes = node_set.difference(self.ml_ClusterHeads)
+
+        # Adding nodes to the clusters
+        for node in free_nodes:
+            if not node.is_active() and not node.is_battery_low():
+                # Tuple made out of energy value and cluster index
+                temp = (100000, None)
+
+                for j in range(len(self.ml_Clusters)):
+                    # Calculating the distance between the node and the cluster head
+                    if id(node) != id(self.ml_Clusters[j][0]):
+                        distance = self.get_distance(self.ml_Clusters[j][0], node)
+
+                        power_draw = (
+                            self.mv_BaseStation.calculate_transmission_consumption(
+                                distance=distance,
+                                packet_size=self.mv_BaseStation.get_data_packet_size(),
+                            )
+                        )
+
+                        if temp[0] - power_draw > 0:
+                            updated = (power_draw, j)
+                            temp = updated
+
+                if (
+                    temp[1] != None
+                    and (not node.is_active())
+                    and (not node.is_cluster_head())
+                ):
+                    node.activate()
+                    self.mv_ActiveNodes += 1
+                    self.ml_Clusters[temp[1]].append(node)
+
+                self.request_plot_update()
+
+        # The cluster members energy usage stays the same until the next setup
+        self.ma_ClusterConsumption = self.calculate_cluster_consumption()
+
+        if self.mo_Profiler is not None:
+            self.mo_Profiler.stop("cluster_assignment", started)
+            self.mo_Profiler.stop("pso_setup", setup_started)
+
+    # Calculates the energy that the clusters members use per round for sending the data to their cluster heads
+    def calculate_cluster_consumption(self):
+        consumption = np.zeros(self.mo_State.mv_NodeAmount, dtype=np.float64)
+
+        for cluster in self.ml_Clusters:
+            if cluster[0].is_active():
+                members = np.array([node.mv_Index for node in cluster], dtype=np.intp)
+
+                distances = self.mo_DistanceCache.get_distances(
+                    cluster[0].mv_Index, members
+                )
+
+                np.add.at(
+                    consumption,
+                    members,
+                    self.calculate_transmission_consumption(distances),
+                )
+
+        return consumption
+
+    # Calculates the energy used in a single steady state round by the nodes and by the base station
+    def calculate_round_consumption(self):
+        # The nodes that send the data in this round and the distances they send it over
+        senders = []
+        distances = []
+
+        # The direct communicating nodes go first
+        for node in self.ml_NodeToBaseNode:
+            senders.append(node)
+            distances.append(self.get_distance(node, self.mv_BaseStation))
+
+        # Then the clusters send the data to the base node via their calculated path
+        for ch in self.ml_Clusters:
+            path = ch[0].get_path()
+
+            if len(path) > 0:
+                # Sending the data_packets from the ch to the first hop
+                senders.append(ch[0])
+                distances.append(self.get_distance(ch[0], path[0]))
+
+                # Then the data is sent through other hops
+                for i in range(len(path) - 1):
+                    senders.append(path[i])
+                    distances.append(self.get_distance(ch[0], path[i + 1]))
+
+        # Calculating all of the transmissions at once
+        transmissions = self.calculate_transmission_consumption(distances)
+
+        # The hops can also be the base station, which is not a part of the nodes state
+        in_state = np.array(
+            [sender.mo_State is self.mo_State for sender in senders], dtype=bool
+        )
+        indices = np.array(
+            [sender.mv_Index for sender in senders], dtype=np.intp
+        )
+
+        consumption = self.ma_ClusterConsumption.copy()
+        np.add.at(consumption, indices[in_state], transmissions[in_state])
+
+        return consumption, float(transmissions[~in_state].sum())
+
+    # The setup + steady phase of pso
+    def pso_algorithm(self):
+        if not self.mb_Ready:
+            self.initiate_network()
+
+        # The nodes, that can't reach the base station, are left out of the clusters
+        self.start_connectivity_tracking()
+
+        self.pso_setup()
+
+        ################
+        # Steady state #
+        ################
+
+        self.mv_LND = 0
+
+        # The energy usage stays the same through a phase, the charges are counted from its beginning
+        phase_capacity = None
+        phase_base_station_capacity = None
+        phase_consumption = None
+        phase_base_station_consumption = None
+        phase_rounds = 0
+
+        logger.info("Running PSO Simulation")
+
+        while self.calculate_coverage() > self.mv_MinimumCoverage:
+            if len(self.ml_ClusterHeads) == 0:
+                break
+
+            # Creating the routes of the cluster heads, a dead cluster head needs a new setup
+            reshuffle = not self.establish_cluster_head_paths()
+
+            if reshuffle:
+                self.pso_setup()
+                reshuffle = False
+                continue
+
+            #############################
+            # Proceeding with the round #
+            #############################
+
+            started = None
+
+            if self.mo_Profiler is not None:
+                started = self.mo_Profiler.start()
+
+            # The clusters collect the data and send it to the base node via their calculated path
+            consumption, base_station_consumption = self.calculate_round_consumption()
+
+            # Starting a new phase if the energy usage has changed since the last round
+            if (
+                phase_consumption is None
+                or base_station_consumption != phase_base_station_consumption
+                or not np.array_equal(consumption, phase_consumption)
+            ):
+                phase_capacity = self.mo_State.ma_CurrentCapacity.copy()
+                phase_base_station_capacity = (
+                    self.mv_BaseStation.mo_State.ma_CurrentCapacity.copy()
+                )
+                phase_consumption = consumption
+                phase_base_station_consumption = base_station_consumption
+                phase_rounds = 0
+
+            # The amount of rounds simulated at once, more than one only if nothing but the charges changes in them
+            rounds = 1
+
+            if self.mb_EventStepping:
+                rounds = self.calculate_rounds_until_event(
+                    phase_capacity,
+                    phase_consumption,
+                    phase_base_station_capacity,
+                    phase_base_station_consumption,
+                    phase_rounds,
+                )
+
+            # The deaths are registered in the last of the skipped rounds
+            phase_rounds += rounds
+            self.mv_LND += rounds - 1
+
+            self.mo_State.mo_SOC.drain_energy_batch(
+                self.mo_State.ma_CurrentCapacity,
+                phase_capacity,
+                phase_consumption,
+                phase_rounds,
+            )
+            self.mo_State.mo_SOC.drain_energy_batch(
+                self.mv_BaseStation.mo_State.ma_CurrentCapacity,
+                phase_base_station_capacity,
+                phase_base_station_consumption,
+                phase_rounds,
+            )
+
+            if self.mo_Profiler is not None:
+                self.mo_Profiler.stop("round_energy", started)
+
+            levels = self.mo_State.get_battery_levels()
+
+            # The depleted nodes have already been marked as low on battery with the levels check
+            dead = np.flatnonzero((levels < 1) & self.mo_State.ma_Active)
+
+            for index in dead:
+                self.pso_node_died(index)
+
+            # The cut off cluster members stop sending their data, a cut off cluster head needs a new setup
+            self.ma_ClusterConsumption[self.update_connectivity(dead)] = 0
+
+            self.notify("active_nodes", self.mv_ActiveNodes)
+            self.mv_LND += 1
+
+        ########################################
+
+        # Publishing the changes held back by the throttle
+        self.publish_plot_update()
+
+        self.mb_LastNodeDied = True
+        self.notify("lnd_pso", self.mv_LND)
+        self.notify("simulation_finished", True)
+        self.cleanup_after_simulation()
+
+    # Creates the routes from the cluster heads to the base station, over the other cluster heads if there is any need.
+    # Returns false, when one of the cluster heads is dead and the clusters have to be set up again
+    def establish_cluster_head_paths(self):
+        started = None
+
+        if self.mo_Profiler is not None:
+            started = self.mo_Profiler.start()
+
+        # Becomes false, when one of the cluster heads is dead
+        established = True
+
+        # If there is any need - creating the multihop route for the cluster heads over other cluster heads
+        for head in self.ml_ClusterHeads:
+            if head.is_active():
+                head.clear_path()
+
+                # Checking if a node needs multihop
+                if (
+                    self.get_distance(head, self.mv_BaseStation)
+                    > self.mv_BaseStation.get_amplifier_threshold_distance()
+                ):
+                    hops_left = self.ml_ClusterHeads.copy()
+
+                    hops_left.add(self.mv_BaseStation)
+                    hops_left.remove(head)
+
+                    while not head.is_path_estabilished():
+                        next_hop_tuple = (None, None)
+                        found_head = False
+                        for hop in hops_left:
+                            value = self.hop_weight(head, hop)
+
+                            # If the temporal tuple is empty
+                            if next_hop_tuple[1] is None:
+                                temp = (hop, value)
+                                next_hop_tuple = temp
+                                continue
+
+                            if value < next_hop_tuple[1]:
+                                temp = (hop, value)
+                                next_hop_tuple = temp
+                                if id(hop) == id(self.mv_BaseStation):
+                                    head.add_to_path(hop)
+                                    found_head = True
+                                    break
+
+                        if found_head:
+                            break
+
+                        head.add_to_path(next_hop_tuple[0])
+                        hops_left.remove(next_hop_tuple[0])
+
+                    # Adding to the paths estabilished index
+                    head.activate_multihop_flag()
+                else:
+                    head.add_to_path(self.mv_BaseStation)
+            else:
+                established = False
+
+        if self.mo_Profiler is not None:
+            self.mo_Profiler.stop("multi_hop_paths", started)
+
+        return established
+
+    # Deactivates the node, that has run out of energy and updates the PSO algorithm statistics
+    def pso_node_died(self, index):
+        self.mo_State.deactivate(index)
+        self.mv_ActiveNodes -= 1
+
+        #
+        # TODO: Those two will be used to create the second plot
+        #
+
+        self.notify("coverage_delta_data_pso", (self.mv_CurrentCoverage, self.mv_LND))
+
+        # Checking for the algorithm statistics
+        # The cut off nodes are still alive
+        if (
+            not self.mb_FirstNodeDied
+            and self.mv_ActiveNodes + self.mv_CutOffNodes == self.mv_NodeAmount - 1
+        ):
+            self.mv_FND = self.mv_LND
+            self.notify("fnd_pso", self.mv_LND)
+            self.mb_FirstNodeDied = True
+
+        if (
+            not self.mb_HalfNodesDies
+            and self.mv_ActiveNodes + self.mv_CutOffNodes
+            < self.mv_NodeAmount
+            - (
+                self.mv_NodeAmount
+                - (
+                    int(
+                        float(self.mv_MinimumCoverage / 100)
+                        * float(self.mv_NodeAmount)
+                    )
+                )
+            )
+            / 2
+        ):
+            self.mv_HND = self.mv_LND
+            self.notify("hnd_pso", self.mv_LND)
+            self.mb_HalfNodesDies = True
+
+        self.request_plot_update()
+
+    # Calculates how many rounds of the current phase can be simulated at once. That is until the next
+    # node dies, or until the multihop routes of the cluster heads could change
+    def calculate_rounds_until_event(
+        self,
+        phase_capacity,
+        phase_consumption,
+        phase_base_station_capacity,
+        phase_base_station_consumption,
+        phase_rounds,
+    ):
+        active = self.mo_State.ma_Active
+
+        # The phase round, in which the next active node drops bellow 1%
+        death_rounds = (
+            self.mo_State.mo_SOC.calculate_rounds_until_level_batch(
+                phase_capacity[active],
+                self.mo_State.ma_DesignedCapacity[active],
+                phase_consumption[active],
+                1,
+            )
+        )
+
+        if len(death_rounds) == 0 or not np.isfinite(death_rounds.min()):
+            return 1
+
+        rounds = int(death_rounds.min()) - phase_rounds
+
+        # The routes are chosen at the beginning of every round, so they have to stay the same until the last one
+        return self.calculate_rounds_until_route_change(
+            phase_capacity,
+            phase_consumption,
+            phase_base_station_capacity,
+            phase_base_station_consumption,
+            phase_rounds,
+            rounds,
+        )
+
+    # Limits the amount of rounds, so that no two hop weights of a multihop cluster head swap their order
+    # in the skipped rounds. Close to a swap the rounds go one by one, just like without the event stepping
+    def calculate_rounds_until_route_change(
+        self,
+        phase_capacity,
+        phase_consumption,
+        phase_base_station_capacity,
+        phase_base_station_consumption,
+        phase_rounds,
+        rounds,
+    ):
+        # The weights closer to each other than this could be swapped by the rounding errors
+        tolerance = 1e-9
+
+        # The same weights as in the hop_weight method
+        u1 = 0.35
+        u2 = 0.45
+        u3 = 0.2
+
+        d0 = self.mv_BaseStation.get_amplifier_threshold_distance()
+
+        base_station = np.array(
+            [
+                self.mv_BaseStation.get_localization().x,
+                self.mv_BaseStation.get_localization().y,
+            ]
+        )
+
+        # The hop candidates are all of the cluster heads and the base station, which is the last one
+        heads = np.array(
+            [head.mv_Index for head in self.ml_ClusterHeads if head.is_active()],
+            dtype=np.intp,
+        )
+        positions = np.vstack((self.mo_State.ma_Positions[heads], base_station))
+        designed = np.append(
+            self.mo_State.ma_DesignedCapacity[heads],
+            self.mv_BaseStation.mo_State.ma_DesignedCapacity,
+        )
+        capacity = np.append(phase_capacity[heads], phase_base_station_capacity)
+        consumption = np.append(phase_consumption[heads], phase_base_station_consumption)
+
+        # The candidates and the part of their hop weight that does not depend on the charge, for every multihop head
+        routes = []
+
+        for i in range(len(heads)):
+            head = positions[i]
+
+            if np.hypot(*(head - base_station)) <= d0:
+                continue
+
+            candidates = np.delete(np.arange(len(positions)), i)
+
+            dv = np.abs(
+                (base_station[1] - head[1]) * positions[candidates, 0]
+                + (head[0] - base_station[0]) * positions[candidates, 1]
+                + base_station[0] * head[1]
+                - base_station[1] * head[0]
+            ) / np.hypot(base_station[1] - head[1], head[0] - base_station[0])
+
+            dj = np.hypot(
+                positions[candidates, 0] - head[0], positions[candidates, 1] - head[1]
+            )
+
+            routes.append((candidates, u1 * (dv / d0) + u2 * (dj / d0)))
+
+        # The differences between the weights of every pair of the head's candidates at the given phase round
+        def weight_differences(candidates, constant, phase_round):
+            weights = constant + u3 * (
+                (capacity[candidates] - consumption[candidates] * phase_round)
+                * 100
+                / designed[candidates]
+            )
+
+            return (weights[:, None] - weights[None, :])[
+                np.triu_indices(len(candidates), 1)
+            ]
+
+        for candidates, constant in routes:
+            differences = weight_differences(candidates, constant, phase_rounds)
+
+            if (np.abs(differences) <= 2 * tolerance).any():
+                return 1
+
+            # The rate at which the differences change every round
+            slopes = -u3 * consumption[candidates] * 100 / designed[candidates]
+            change = (slopes[:, None] - slopes[None, :])[
+                np.triu_indices(len(candidates), 1)
+            ]
+
+            # The pairs that are getting closer can only be skipped until they are about to swap
+            approaching = np.sign(differences) * change < 0
+
+            if approaching.any():
+                limit = np.floor(
+                    (np.abs(differences[approaching]) - 2 * tolerance)
+                    / np.abs(change[approaching])
+                ).min()
+
+                rounds = int(max(1, min(rounds, limit + 1)))
+
+        # Making sure, that no weights have swapped by the last skipped round
+        for candidates, constant in routes:
+            if rounds == 1:
+                break
+
+            first = weight_differences(candidates, constant, phase_rounds)
+            last = weight_differences(candidates, constant, phase_rounds + rounds - 1)
+
+            if (np.sign(first) != np.sign(last)).any() or (
+                np.abs(last) <= tolerance
+            ).any():
+                rounds = 1
+
+        return rounds
+
+    ####################
+    # Plotting methods #
+    ####################
+
+    def calculate_plot_data(self):
+        started = None
+
+        if self.mo_Profiler is not None:
+            started = self.mo_Profiler.start()
+
+        if self.mb_Ready:
+            # Clearing the old data
+            self.ml_xAxisPlotData.clear()
+            self.ml_yAxisPlotData.clear()
+            self.ml_ColorPlotData.clear()
+
+            # Appending the coordinates and the colours of the nodes to the lists
+            self.ml_xAxisPlotData.extend(self.mo_State.ma_Positions[:, 0].tolist())
+            self.ml_yAxisPlotData.extend(self.mo_State.ma_Positions[:, 1].tolist())
+            self.ml_ColorPlotData.extend(self.mo_State.ma_Color.tolist())
+
+            # Adding the base station to the list
+            self.ml_xAxisPlotData.append(
+                self.mv_BaseStation.get_localization().coords[:][0][0]
+            )
+            self.ml_yAxisPlotData.append(
+                self.mv_BaseStation.get_localization().coords[:][0][1]
+            )
+            self.ml_ColorPlotData.append(self.mv_BaseStation.get_colour())
+
+            # The full data is the new starting point of the changes
+            self.mo_PlotThrottle.reset(*self.get_plot_state(), self.mv_LND)
+
+            self.notify(
+                "update_plot",
+                [self.ml_xAxisPlotData, self.ml_yAxisPlotData, self.ml_ColorPlotData],
+            )
+
+        if self.mo_Profiler is not None:
+            self.mo_Profiler.stop("plot_data", started)
+
+    # Sets the maximum amount of the plot updates per second, or the amount of rounds between them if given
+    def set_plot_update_rate(self, max_rate=float(10), round_interval=int(0)):
+        self.mo_PlotThrottle.set_max_rate(max_rate)
+        self.mo_PlotThrottle.set_round_interval(round_interval)
+
+    # Returns the colours and the activity flags of the plotted nodes, the base station is the last one
+    def get_plot_state(self):
+        colors = np.append(self.mo_State.ma_Color, self.mv_BaseStation.get_colour())
+        active = np.append(self.mo_State.ma_Active, self.mv_BaseStation.is_active())
+
+        return colors, active
+
+    # Marks the plot as changed, the changes are published only when the throttle allows it
+    def request_plot_update(self):
+        self.mo_PlotThrottle.mark_dirty()
+
+        if self.mo_PlotThrottle.is_due(self.mv_LND):
+            self.publish_plot_update()
+
+    # Publishes the changes of the plot since the last update as [indices, colours, activity flags] of
+    # the changed nodes. The observers of the whole plot data get all of the nodes instead
+    def publish_plot_update(self):
+        if not self.mb_Ready or not self.mo_PlotThrottle.is_dirty():
+            return
+
+        started = None
+
+        if self.mo_Profiler is not None:
+            started = self.mo_Profiler.start()
+
+        if self.has_observers("update_plot_delta"):
+            colors, active = self.get_plot_state()
+            changed = self.mo_PlotThrottle.get_changes(colors, active, self.mv_LND)
+
+            if changed is None:
+                self.calculate_plot_data()
+            elif len(changed) > 0:
+                self.notify(
+                    "update_plot_delta",
+                    [
+                        changed.tolist(),
+                        colors[changed].tolist(),
+                        active[changed].tolist(),
+                    ],
+                )
+        elif self.has_observers("update_plot"):
+            self.calculate_plot_data()
+        else:
+            # Nobody is drawing the plot, the changes are only marked as handled
+            self.mo_PlotThrottle.mark_published(self.mv_LND)
+
+        if self.mo_Profiler is not None:
+            self.mo_Profiler.stop("plot_update", started)
+
+    def run_simulation(self):
+        if self.mv_CurrentAlgorithm == self.ml_Algorithms[0]:
+            self.naive_algorithm_new()
+        else:
+            self.pso_algorithm()
+
+    def cleanup_after_simulation(self):
+        # Cleaning the statistcs
+        self.mb_LastNodeDied = False
+        self.mb_HalfNodesDies = False
+        self.mb_FirstNodeDied = False
+
+        # Clearing every node that has been used out of data
+        for node in self.ml_Nodes:
+            node.clear()
+
+        self.mo_State.set_battery_capacity(self.mv_BatteryCapacity)
+        self.mo_State.reset()
+
+        # Setting active nodes count to 0
+        self.mv_ActiveNodes = 0
+
+        self.mo_Connectivity = None
+
+        # Clearing all of the lists and variables of data
+        self.ml_ClusterHeads.clear()
+        self.ml_Clusters.clear()
+        self.ml_SinkNodes.clear()
+        self.ml_Nodes.clear()
+
+        if self.mv_BaseStation != None:
+            self.mv_BaseStation.clear()
+
+        # Setting base station to none
+        self.mv_BaseStation = None
+
+        self.mb_Ready = False
\ No newline at end of file
@@ -0,0 +1,199 @@
+################################################################
+# Queue of the simulation jobs. The batches of (algorithm,     #
+# repetition) runs are submitted to a pool of processes and    #
+# return at once, the finished jobs are collected by polling,  #
+# so the caller's event loop never waits for the simulations.  #
+# The jobs of all of the algorithms share the pool, so they    #
+# run concurrently                                             #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# The simulation of a single run in a worker process and the jobs of the repetitions
+from .monte_carlo import run_single_simulation, build_jobs
+
+# Passing the jobs events to the observers
+from .observable import Observable
+
+# Process pool for the runs
+from concurrent.futures import ProcessPoolExecutor
+
+# The pool, that lost a worker, can't run any more jobs
+from concurrent.futures.process import BrokenProcessPool
+
+# Fresh interpreters for the workers, forking a process with a running Qt application is unsafe
+import multiprocessing
+
+# The amount of cores
+import os
+
+
+#############
+# Functions #
+#############
+
+
+# Runs a single simulation in a worker process, the result is taken from the cache or stored in it when there is one,
+# so the caller never waits for the cache files
+def run_cached_simulation(algorithm, settings, seed_sequence, cache=None):
+    if cache is None:
+        return run_single_simulation(algorithm, settings, seed_sequence)
+
+    key = cache.get_key(algorithm, settings, seed_sequence)
+    result = cache.get(key)
+
+    if result is None:
+        result = run_single_simulation(algorithm, settings, seed_sequence)
+        cache.put(key, result)
+
+    return result
+
+
+#####################
+# Object definition #
+#####################
+
+
+class SimulationQueue(Observable):
+    # Takes the maximum amount of worker processes, all of the cores by default,
+    # and optionally the cache of the results, the workers take the cached jobs results without simulating them.
+    # The events are passed to the observers only from the poll method, in the thread calling it:
+    # "job_finished" (batch, algorithm, repetition, result), "job_failed" (batch, algorithm, repetition, exception),
+    # "batch_progress" (batch, finished, total) and "batch_finished" (batch, results ordered by the repetition,
+    # then by the algorithm). The failed and the cancelled jobs have no results, but the batch still finishes
+    def __init__(self, processes=None, cache=None):
+        #############
+        # Variables #
+        #############
+
+        self.mv_Processes = processes if processes is not None else os.cpu_count()
+
+        # The result cache, none by default
+        self.mo_Cache = cache
+
+        # The pool of the workers, started with the first submitted job and kept for the next batches
+        self.mo_Executor = None
+
+        # The identifier of the next submitted batch
+        self.mv_NextBatch = 0
+
+        # The batches waiting for their jobs, by the identifier. Every batch is a dictionary
+        # with the jobs descriptions, the results, the amount of the reported jobs and the futures
+        self.md_Batches = {}
+
+        # The callbacks of the events, by the event name
+        self.md_Observers = {}
+
+    ##############################
+    # Member methods definitions #
+    ##############################
+
+    # Returns the pool of the workers, starting it if there is none
+    def get_executor(self):
+        if self.mo_Executor is None:
+            self.mo_Executor = ProcessPoolExecutor(
+                max_workers=self.mv_Processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        return self.mo_Executor
+
+    # Submits the repetitions of every given algorithm index with the network settings and returns the batch
+    # identifier at once. The seed can be a number or a SeedSequence, the runs streams are spawned from it
+    # the same way as in the Monte Carlo runner, so both give the same results for the same seed
+    def submit(self, algorithms, repetitions, settings, seed=None):
+        jobs = build_jobs(algorithms, repetitions, seed)
+
+        batch = self.mv_NextBatch
+        self.mv_NextBatch += 1
+
+        self.md_Batches[batch] = {
+            "jobs": jobs,
+            "results": [None] * len(jobs),
+            "reported": 0,
+            "futures": {},
+        }
+
+        for i in range(len(jobs)):
+            algorithm, repetition, seed_sequence = jobs[i]
+
+            self.md_Batches[batch]["futures"][i] = self.get_executor().submit(
+                run_cached_simulation, algorithm, settings, seed_sequence, self.mo_Cache
+            )
+
+        return batch
+
+    # Collects the finished jobs and notifies the observers about them, never waits for the running ones.
+    # Returns True while there are any jobs left
+    def poll(self):
+        for batch in list(self.md_Batches):
+            data = self.md_Batches[batch]
+            total = len(data["jobs"])
+
+            for i, future in sorted(data["futures"].items()):
+                if not future.done():
+                    continue
+
+                del data["futures"][i]
+
+                if future.cancelled():
+                    continue
+
+                data["reported"] += 1
+
+                algorithm, repetition, seed_sequence = data["jobs"][i]
+
+                # The exception of a worker is passed on as an event, so the batch still finishes
+                exception = future.exception()
+
+                if exception is None:
+                    data["results"][i] = future.result()
+
+                    self.notify(
+                        "job_finished", batch, algorithm, repetition, data["results"][i]
+                    )
+                else:
+                    # The broken pool is replaced with a new one for the next jobs
+                    if isinstance(exception, BrokenProcessPool):
+                        self.mo_Executor = None
+
+                    self.notify("job_failed", batch, algorithm, repetition, exception)
+
+                self.notify("batch_progress", batch, data["reported"], total)
+
+            if len(data["futures"]) == 0:
+                del self.md_Batches[batch]
+
+                # The size limit of the cache is enforced by a worker too
+                if self.mo_Cache is not None:
+                    self.get_executor().submit(self.mo_Cache.evict)
+
+                self.notify("batch_finished", batch, data["results"])
+
+        return self.is_busy()
+
+    # Checks if any of the submitted batches is not finished yet
+    def is_busy(self):
+        return len(self.md_Batches) > 0
+
+    # Cancels the jobs of the batch, that haven't started yet, the batch finishes with the already done ones
+    def cancel(self, batch=int):
+        data = self.md_Batches.get(batch)
+
+        if data is None:
+            return
+
+        for future in data["futures"].values():
+            future.cancel()
+
+    # Stops the pool of the workers, the waiting jobs are dropped
+    def shutdown(self):
+        if self.mo_Executor is not None:
+            self.mo_Executor.shutdown(wait=False, cancel_futures=True)
+            self.mo_Executor = None
+
+        self.md_Batches.clear()
@@ -0,0 +1,102 @@
+###############################################################
+# Spatial index over the nodes positions. Built once for a    #
+# network layout, answers which nodes are within a radius or  #
+# inside of a polygon without checking every node one by one. #
+###############################################################
+
+
+############
+# Includes #
+############
+
+
+# Arrays of the positions
+import numpy as np
+
+# KD-tree for the neighbourhood queries
+from scipy.spatial import cKDTree
+
+# Exact point in polygon tests
+import shapely
+
+
+#####################
+# Object definition #
+#####################
+
+
+class SpatialIndex:
+    # Takes the array of (x, y) positions of the nodes and optionally the profiler counting the geometry tests
+    def __init__(self, positions, profiler=None):
+        #############
+        # Variables #
+        #############
+
+        # Positions of the indexed nodes
+        self.ma_Positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+
+        # Profiler of the simulation, if there is one
+        self.mo_Profiler = profiler
+
+        # The tree itself, there is nothing to build for an empty layout
+        self.mo_Tree = None
+
+        if len(self.ma_Positions) > 0:
+            self.mo_Tree = cKDTree(self.ma_Positions)
+
+    ##############################
+    # Member methods definitions #
+    ##############################
+
+    # Returns the amount of indexed nodes
+    def get_size(self):
+        return len(self.ma_Positions)
+
+    # Returns the sorted indices of the nodes within the radius from the point
+    def query_radius(self, x=float, y=float, radius=float):
+        if self.mo_Tree is None:
+            return np.empty(0, dtype=np.intp)
+
+        return np.asarray(
+            self.mo_Tree.query_ball_point((x, y), radius, return_sorted=True),
+            dtype=np.intp,
+        )
+
+    # Returns the sorted indices of the nodes intersecting the polygon, or strictly inside of it if contains is set
+    def query_polygon(self, polygon, contains=False):
+        if self.mo_Tree is None or polygon is None or polygon.is_empty:
+            return np.empty(0, dtype=np.intp)
+
+        # The circle around the polygon's bounding box limits the exact checks to the close nodes
+        min_x, min_y, max_x, max_y = polygon.bounds
+
+        candidates = self.query_radius(
+            (min_x + max_x) / 2,
+            (min_y + max_y) / 2,
+            np.hypot(max_x - min_x, max_y - min_y) / 2 * (1 + 1e-9),
+        )
+
+        if len(candidates) == 0:
+            return candidates
+
+        if self.mo_Profiler is not None:
+            self.mo_Profiler.count("shapely_polygon_queries")
+            self.mo_Profiler.count("shapely_point_tests", len(candidates))
+
+        # Preparing the polygon speeds up the tests for many points
+        shapely.prepare(polygon)
+
+        if contains:
+            inside = shapely.contains_xy(
+                polygon,
+                self.ma_Positions[candidates, 0],
+                self.ma_Positions[candidates, 1],
+            )
+        else:
+            inside = shapely.intersects_xy(
+                polygon,
+                self.ma_Positions[candidates, 0],
+                self.ma_Positions[candidates, 1],
+            )
+
+        return candidates[inside]
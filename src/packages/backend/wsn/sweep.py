@@ -0,0 +1,132 @@
+##################################################################
+# Parameter sweep over the network settings. A grid of values    #
+# for every setting is expanded into the configurations, each of #
+# them is simulated the given amount of times with every chosen  #
+# algorithm, and all of the runs end up in one results table     #
+##################################################################
+
+
+############
+# Includes #
+############
+
+
+# The runs are spread across the processes
+from .monte_carlo import MonteCarloRunner
+
+# Random streams for the repetitions
+import numpy as np
+
+# Expanding the grid
+import itertools
+
+# Writing the results table
+import csv
+
+
+#####################
+# Object definition #
+#####################
+
+
+class ParameterSweep:
+    # Settings, that can be swept over, in the order of the grid expansion
+    ml_Parameters = [
+        "node_amount",
+        "width",
+        "height",
+        "battery_capacity",
+        "minimum_coverage",
+        "max_iteration",
+    ]
+
+    # Names of the algorithms accepted in the sweeps, by the algorithm index
+    md_AlgorithmNames = {"naive": 0, "naiwny": 0, "pso": 1}
+
+    # Columns of the results table
+    ml_Columns = ml_Parameters + [
+        "algorithm",
+        "repetition",
+        "fnd",
+        "hnd",
+        "lnd",
+        "coverage_events",
+    ]
+
+    # Takes the dictionary of the values lists for the parameters, the algorithms names, the amount of repetitions
+    # and the seed of the random streams
+    def __init__(self, grid=dict, algorithms=list, repetitions=int(1), seed=None):
+        #############
+        # Variables #
+        #############
+
+        # Values of every parameter
+        self.md_Grid = {
+            parameter: list(grid[parameter]) for parameter in self.ml_Parameters
+        }
+
+        # The algorithms indices
+        self.ml_Algorithms = [
+            self.md_AlgorithmNames[name.lower()] for name in algorithms
+        ]
+
+        # The amount of runs of every configuration and algorithm
+        self.mv_Repetitions = repetitions
+
+        # The seed of the random streams of the repetitions
+        self.mv_Seed = seed
+
+    ##############################
+    # Member methods definitions #
+    ##############################
+
+    # Returns the settings of every configuration in the grid
+    def get_configurations(self):
+        return [
+            dict(zip(self.ml_Parameters, values))
+            for values in itertools.product(
+                *[self.md_Grid[parameter] for parameter in self.ml_Parameters]
+            )
+        ]
+
+    # Returns the amount of the simulations in the sweep
+    def get_runs_amount(self):
+        return (
+            len(self.get_configurations())
+            * len(self.ml_Algorithms)
+            * self.mv_Repetitions
+        )
+
+    # Runs the whole sweep with the runner and returns the rows of the results table.
+    # The n-th repetition uses the same random stream in every configuration, so the configurations
+    # and the algorithms are compared on the same layouts wherever the layouts can be the same
+    def run(self, runner=None):
+        if runner is None:
+            runner = MonteCarloRunner()
+
+        seed_sequences = np.random.SeedSequence(self.mv_Seed).spawn(
+            self.mv_Repetitions
+        )
+
+        jobs = []
+        rows = []
+
+        for settings in self.get_configurations():
+            for repetition in range(self.mv_Repetitions):
+                for algorithm in self.ml_Algorithms:
+                    jobs.append((algorithm, settings, seed_sequences[repetition]))
+                    rows.append(dict(settings, repetition=repetition))
+
+        for row, (algorithm, rounds, coverage) in zip(rows, runner.run_jobs(jobs)):
+            row["algorithm"] = ["naive", "pso"][algorithm]
+            row["fnd"], row["hnd"], row["lnd"] = rounds
+            row["coverage_events"] = len(coverage)
+
+        return rows
+
+    # Writes the rows of the results table to a csv file
+    def save_results(self, rows, path=str):
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=self.ml_Columns)
+            writer.writeheader()
+            writer.writerows(rows)
@@ -1 +1,2 @@
+from .network_state import *
 from .node import *
@@ -0,0 +1,155 @@
+##############################################################
+# Array backed state of the whole sensoric network. Instead  #
+# of every node owning its own SOC, EMU and Battery objects, #
+# the positions, charges and flags of all of the nodes are   #
+# stored in contiguous numpy arrays, indexed by node number. #
+# The Node objects are only thin views into this state       #
+##############################################################
+
+# ma - member array
+
+############
+# Includes #
+############
+
+
+# Contiguous arrays for the nodes data
+import numpy as np
+
+# The energy consumption model shared by all of the nodes
+from ..node_components import SOC
+
+
+#####################
+# Object definition #
+#####################
+
+
+class NetworkState:
+    # Colours used for plotting the nodes in given states
+    mv_DefaultColor = 80
+    mv_ClusterHeadColor = 40
+    mv_BaseStationColor = 0
+
+    # Takes the amount of nodes and their battery capacity in J
+    def __init__(self, node_amount=int(0), battery_capacity=int(1)):
+        ###########
+        # Objects #
+        ###########
+
+        # Single energy consumption model for the whole network, the constants are the same for every node
+        self.mo_SOC = SOC(battery_capacity)
+
+        #############
+        # Variables #
+        #############
+
+        # The amount of nodes stored in the state
+        self.mv_NodeAmount = node_amount
+
+        # Nodes coordinates, one (x, y) row per node
+        self.ma_Positions = np.zeros((node_amount, 2), dtype=np.float64)
+
+        # Designed and current charge of the nodes cells in J
+        self.ma_DesignedCapacity = np.full(node_amount, battery_capacity, dtype=np.float64)
+        self.ma_CurrentCapacity = self.ma_DesignedCapacity.copy()
+
+        # Plotting colours of the nodes
+        self.ma_Color = np.full(node_amount, self.mv_DefaultColor, dtype=np.int16)
+
+        ############
+        # Booleans #
+        ############
+
+        self.ma_Active = np.zeros(node_amount, dtype=bool)
+        self.ma_ClusterHead = np.zeros(node_amount, dtype=bool)
+        self.ma_LowBattery = np.zeros(node_amount, dtype=bool)
+        self.ma_BaseStation = np.zeros(node_amount, dtype=bool)
+        self.ma_MultiHop = np.zeros(node_amount, dtype=bool)
+        self.ma_PathEstabilished = np.zeros(node_amount, dtype=bool)
+
+    ##############################
+    # Member methods definitions #
+    ##############################
+
+    # Sets the coordinates of all of the nodes at once
+    def set_positions(self, positions):
+        self.ma_Positions = np.ascontiguousarray(positions, dtype=np.float64).reshape(
+            self.mv_NodeAmount, 2
+        )
+
+    # Sets the battery capacity of chosen nodes, or every node if none given, and recharges them
+    def set_battery_capacity(self, capacity, indices=None):
+        if indices is None:
+            indices = slice(None)
+
+        self.ma_DesignedCapacity[indices] = capacity
+        self.ma_CurrentCapacity[indices] = self.ma_DesignedCapacity[indices]
+
+    # Returns the percent of charge left in the chosen nodes cells
+    def get_charge_percentage_left(self, indices=None):
+        if indices is None:
+            indices = slice(None)
+
+        return (
+            self.ma_CurrentCapacity[indices] * 100 / self.ma_DesignedCapacity[indices]
+        )
+
+    # Gets the battery levels of all of the nodes and marks the ones bellow 2% as low on battery
+    def get_battery_levels(self):
+        levels = self.get_charge_percentage_left()
+
+        self.ma_LowBattery |= levels < 2
+
+        return levels
+
+    # Discharges the chosen nodes cells by the given amounts
+    def subtract_energy(self, amount, indices=None):
+        if indices is None:
+            indices = slice(None)
+
+        self.ma_CurrentCapacity[indices] -= amount
+
+    # Returns the distances from the nodes to a given point
+    def distances_from(self, x=float, y=float):
+        return np.hypot(self.ma_Positions[:, 0] - x, self.ma_Positions[:, 1] - y)
+
+    # Returns the indices of the active nodes
+    def get_active_indices(self):
+        return np.flatnonzero(self.ma_Active)
+
+    #########################
+    # Boolean flags methods #
+    #########################
+
+    # Activates the chosen nodes
+    def activate(self, indices=None):
+        if indices is None:
+            indices = slice(None)
+
+        self.ma_Active[indices] = True
+
+    # Deactivates the chosen nodes and clears all of theirs flags
+    def deactivate(self, indices=None):
+        if indices is None:
+            indices = slice(None)
+
+        self.ma_Active[indices] = False
+        self.clear_flags(indices)
+
+    # Clears the role flags of the chosen nodes, mirrors Node.clear_flags
+    def clear_flags(self, indices=None):
+        if indices is None:
+            indices = slice(None)
+
+        self.ma_BaseStation[indices] = False
+        self.ma_MultiHop[indices] = False
+        self.ma_PathEstabilished[indices] = False
+        self.ma_ClusterHead[indices] = False
+        self.ma_Color[indices] = self.mv_DefaultColor
+
+    # Brings the nodes back to the state from before a simulation
+    def reset(self):
+        self.deactivate()
+        self.ma_LowBattery[:] = False
+        self.ma_CurrentCapacity[:] = self.ma_DesignedCapacity
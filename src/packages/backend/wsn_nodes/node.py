@@ -14,12 +14,15 @@
 # Geographical Points, areas and other usefull calculations
 import shapely
 
-# The module containing energy consumption and calculation related components
-from ..node_components import SOC
+# The array backed state, that the node is a view of
+from .network_state import NetworkState
 
 # Used mainly for the sleep
 import time
 
+# Distances without the geometry objects
+import math
+
 
 #####################
 # Object definition #
@@ -27,34 +30,82 @@ import time
 
 
 class Node:
+    # The sensing range of a node in meters, unless changed
+    mv_DefaultSensingRange = 5
+
+    # The communication range of a node in meters, unless changed
+    mv_DefaultCommunicationRange = 25
+
+    # Fixed set of the attributes, there is no per object dictionary, as there can be 100k nodes in a layout
+    __slots__ = (
+        "mo_State",
+        "mv_Index",
+        "mo_SOC",
+        "mv_Location",
+        "mv_SensingRange",
+        "mv_SensingArea",
+        "mv_CommunicationRange",
+        "ml_AdjacentNodes",
+        "mv_BaseStation",
+        "mv_SinkNode",
+        "mb_Sink",
+        "ml_Path",
+        "mv_BatteryLowThreshold",
+    )
+
     ###################################
     # Base object methods definitions #
     ###################################
 
-    # Initialises the node with needed data, ie. its battery capacity, location, and possibly id
-    def __init__(self, battery_capacity=int(100), x=int(0), y=int(0)):
+    # Initialises the node with needed data, ie. its battery capacity, location, and possibly id.
+    # When a network state and an index are given, the node is only a view of that state's row.
+    # The location Point and the base station can be given, when they are created in bulk
+    def __init__(
+        self,
+        battery_capacity=int(100),
+        x=int(0),
+        y=int(0),
+        state=None,
+        index=int(0),
+        location=None,
+        base_station=None,
+    ):
         ###########
         # Objects #
         ###########
 
-        # Initialising the SOC functionality and setting the battery capacity
-        self.mo_SOC = SOC(battery_capacity)
+        # A standalone node keeps its data in a single row state of its own
+        if state is None:
+            state = NetworkState(1, battery_capacity)
+            state.ma_Positions[index] = (x, y)
+
+        # The state that stores this node's position, charge and flags
+        self.mo_State = state
+
+        # The row of this node in the state arrays
+        self.mv_Index = index
+
+        # The SOC functionality is shared through the state, as it only holds the consumption constants
+        self.mo_SOC = state.mo_SOC
 
         #####################
         # Node Localisation #
         #####################
 
         # A point that contains the coordinates of this sensor node
-        self.mv_Location = shapely.Point(x, y)
+        if location is None:
+            location = shapely.Point(state.ma_Positions[index])
+
+        self.mv_Location = location
 
-        # Contains the sensing range of a node in meters, defaults to 2 meters
-        self.mv_SensingRange = 5
+        # Contains the sensing range of a node in meters, defaults to 5 meters
+        self.mv_SensingRange = self.mv_DefaultSensingRange
 
-        # Contains the area that the node can access
-        self.mv_SensingArea = self.mv_Location.buffer(self.mv_SensingRange)
+        # Contains the area that the node can access, the polygon is created on the first use
+        self.mv_SensingArea = None
 
         # Contains the communication range value
-        self.mv_CommunicationRange = 25
+        self.mv_CommunicationRange = self.mv_DefaultCommunicationRange
 
         ###########################
         # Other nodes information #
@@ -64,13 +115,16 @@ class Node:
         self.ml_AdjacentNodes = []
 
         # Base station
-        self.mv_BaseStation = None
+        self.mv_BaseStation = base_station
 
         # Sink node
         self.mv_SinkNode = None
 
-        # Basic path to sink node
-        self.ml_Path = set()
+        # Set when this node is the sink of the network
+        self.mb_Sink = False
+
+        # Basic path to sink node, the set is only created when the first hop is added
+        self.ml_Path = ()
 
         ###########################
         # Node settings variables #
@@ -79,50 +133,15 @@ class Node:
         # The threshold at which node indicates low battery level warning
         self.mv_BatteryLowThreshold = 2
 
-        #################
-        # Miscellaneous #
-        #################
-
-        # For the plotting of the color
-        self.mv_Color = 80
-
-        ############
-        # Booleans #
-        ############
-
-        # Activated when the multi hop route to the base station has been estabilished
-        self.mb_PathEstabilished = False
-
-        # Activated if it needs multi hop communication
-        self.mb_MultiHop = False
-
-        # Activated only if this node is a Base Node
-        self.mb_BaseStation = False
-
-        # Activated only if this node is a sink
-        self.mb_ClusterHead = False
-
-        # Activated only if this node is an aggregating node
-        self.mb_Aggregating = False
-
-        # Activated only if this node is the sensing node
-        self.mb_Sensing = False
-
-        # Set only if the battery level reaches 20%, so as the network can try and deal with this situation
-        self.mb_LowBattery = False
-
-        #
-        self.mb_Active = False
-
-    # Clears up after the node just to be sure
-    def __del__(self):
-        self.clear()
+    # Hashes the node by its row in the state, so that the sets of nodes keep the same order between the runs
+    def __hash__(self):
+        return self.mv_Index
 
     # Clears all of the copy containing lists
     def clear(self):
         # Cleaning the nodes stored in the other nodes list
         self.ml_AdjacentNodes.clear()
-        self.ml_Path.clear()
+        self.ml_Path = ()
         self.deactivate_base_station_flag()
         self.deactivate_multihop_flag()
         self.deactivate_path_estabilished_flag()
@@ -135,7 +154,7 @@ class Node:
         self.deactivate_cluster_head_flag()
 
     def clear_path(self):
-        self.ml_Path.clear()
+        self.ml_Path = ()
         self.deactivate_path_estabilished_flag()
 
     #########################
@@ -144,80 +163,80 @@ class Node:
 
     # Activates the node status flag
     def activate(self):
-        self.mb_Active = True
+        self.mo_State.ma_Active[self.mv_Index] = True
 
     # Deactivates the node status flag
     def deactivate(self):
         # Deactivates the main flag
-        self.mb_Active = False
+        self.mo_State.ma_Active[self.mv_Index] = False
 
         # Clears all of the flags
         self.clear_flags()
 
     # Checks the node status flag
     def is_active(self):
-        return self.mb_Active
+        return bool(self.mo_State.ma_Active[self.mv_Index])
 
     # Activates the base station flag
     def activate_base_station_flag(self):
-        self.mb_BaseStation = True
-        self.mv_Color = 0
+        self.mo_State.ma_BaseStation[self.mv_Index] = True
+        self.mo_State.ma_Color[self.mv_Index] = NetworkState.mv_BaseStationColor
 
     # Deactivates the base station flag
     def deactivate_base_station_flag(self):
-        self.mb_BaseStation = False
-        self.mv_Color = 80
+        self.mo_State.ma_BaseStation[self.mv_Index] = False
+        self.mo_State.ma_Color[self.mv_Index] = NetworkState.mv_DefaultColor
 
     # Returns the value of the base station flag
     def is_base_station(self):
-        return self.mb_BaseStation
+        return bool(self.mo_State.ma_BaseStation[self.mv_Index])
 
     # Activates the cluster head flag
     def activate_cluster_head_flag(self):
-        self.mb_ClusterHead = True
-        self.mv_Color = 40
+        self.mo_State.ma_ClusterHead[self.mv_Index] = True
+        self.mo_State.ma_Color[self.mv_Index] = NetworkState.mv_ClusterHeadColor
 
     # Deactivates the cluster head flag
     def deactivate_cluster_head_flag(self):
-        self.mb_ClusterHead = False
-        self.mv_Color = 80
+        self.mo_State.ma_ClusterHead[self.mv_Index] = False
+        self.mo_State.ma_Color[self.mv_Index] = NetworkState.mv_DefaultColor
 
     # Returns the cluster head flag value
     def is_cluster_head(self):
-        return self.mb_ClusterHead
+        return bool(self.mo_State.ma_ClusterHead[self.mv_Index])
 
     # Activates the multihop flag
     def activate_multihop_flag(self):
-        self.mb_MultiHop = True
+        self.mo_State.ma_MultiHop[self.mv_Index] = True
 
     # Deactivates the multihop flag
     def deactivate_multihop_flag(self):
-        self.mb_MultiHop = False
+        self.mo_State.ma_MultiHop[self.mv_Index] = False
 
     # Returns the multihop flag value
     def is_multihop(self):
-        return self.mb_MultiHop
+        return bool(self.mo_State.ma_MultiHop[self.mv_Index])
 
     # Activates the path estabilished flag when there is a path to sink/base estabilished
     def activate_path_estabilished_flag(self):
-        self.mb_PathEstabilished = True
+        self.mo_State.ma_PathEstabilished[self.mv_Index] = True
 
     # Deactivates the path estabilished flag
     def deactivate_path_estabilished_flag(self):
-        self.mb_PathEstabilished = False
+        self.mo_State.ma_PathEstabilished[self.mv_Index] = False
 
     # Returns the flag value
     def is_path_estabilished(self):
-        return self.mb_PathEstabilished
+        return bool(self.mo_State.ma_PathEstabilished[self.mv_Index])
 
     def activate_battery_low_flag(self):
-        self.mb_LowBattery = True
+        self.mo_State.ma_LowBattery[self.mv_Index] = True
 
     def deactivate_battery_low_flag(self):
-        self.mb_LowBattery = False
+        self.mo_State.ma_LowBattery[self.mv_Index] = False
 
     def is_battery_low(self):
-        return self.mb_LowBattery
+        return bool(self.mo_State.ma_LowBattery[self.mv_Index])
 
     #####################
     # Setters / Getters #
@@ -230,18 +249,31 @@ class Node:
     # Sets the battery size
     def set_battery_capacity(self, capacity):
         # A little shortcut
-        self.mo_SOC.set_battery_capacity(capacity)
+        self.mo_State.set_battery_capacity(capacity, self.mv_Index)
 
     # Sets the node colour
     def set_colour(self, colour):
-        self.mv_Color = colour
+        self.mo_State.ma_Color[self.mv_Index] = colour
+
+    # Gets the node colour
+    def get_colour(self):
+        return int(self.mo_State.ma_Color[self.mv_Index])
 
     # Localizes the node in the environment, a simulation of an gps module
     def set_localization(self, x=int, y=int):
         # Setting the device localisation
+        self.mo_State.ma_Positions[self.mv_Index] = (x, y)
         self.mv_Location = shapely.Point(x, y)
 
-        self.mv_SensingArea = self.mv_Location.buffer(self.mv_SensingRange)
+        # The old sensing area is no longer valid
+        self.mv_SensingArea = None
+
+    # Sets the sensing range of the node in meters
+    def set_sensing_range(self, sensing_range=float):
+        self.mv_SensingRange = sensing_range
+
+        # The old sensing area is no longer valid
+        self.mv_SensingArea = None
 
     # Gets the amplifier power mode distance threshold
     def get_amplifier_threshold_distance(self):
@@ -274,14 +306,21 @@ class Node:
     def get_sensing_range(self):
         return self.mv_SensingRange
 
-    # Gets the area of range
+    # Gets the area of range, creating it when it's needed for the first time
     def get_sensing_range_area(self):
+        if self.mv_SensingArea is None:
+            self.mv_SensingArea = self.mv_Location.buffer(self.mv_SensingRange)
+
         return self.mv_SensingArea
 
+    # Gets the (x, y) coordinates of the node
+    def get_coordinates(self):
+        return self.mo_State.ma_Positions[self.mv_Index]
+
     # Gets the current battery level of this device
     def get_battery_level(self):
         # Getting the cell's current capacity
-        level = self.mo_SOC.get_charge_percentage_left()
+        level = float(self.mo_State.get_charge_percentage_left(self.mv_Index))
 
         # Activating the battery critical flag if bellow 2%
         if level < 2:
@@ -321,14 +360,25 @@ class Node:
 
     # Sets the id of a sink node
     def add_sink_node(self, sink=None):
-        self.ml_SinkNode = sink
+        self.mv_SinkNode = sink
 
     # Adds a node which has to be visited in order to reach the Sink
     def add_to_path(self, node):
         if id(node) == id(self.mv_BaseStation):
             self.activate_path_estabilished_flag()
+
+        if not self.ml_Path:
+            self.ml_Path = set()
+
         self.ml_Path.add(node)
 
+    # Sets the ordered hops, which have to be visited in order to reach the Sink, the next hop first
+    def set_path(self, hops):
+        self.ml_Path = tuple(hops)
+
+        if len(self.ml_Path) > 0 and id(self.ml_Path[-1]) == id(self.mv_BaseStation):
+            self.activate_path_estabilished_flag()
+
     # Adding a node to the neighbours list
     def add_to_neighbours_list(self, node):
         self.ml_AdjacentNodes.append(node)
@@ -338,11 +388,22 @@ class Node:
         # Calculating the distance from a point
         return shapely.distance(self.mv_Location, point)
 
+    # Calculates the distance to another node straight from the coordinates, no geometry is needed
+    def distance_to_node(self, node):
+        x, y = self.get_coordinates()
+        other_x, other_y = node.get_coordinates()
+
+        return math.hypot(x - other_x, y - other_y)
+
+    # Checks whether the other node is within the sensing range of this node
+    def is_in_sensing_range(self, node):
+        return self.distance_to_node(node) < self.mv_SensingRange
+
     # Searches for the neighbours ( A simulation of neighbour seeking protocol used in internet network)
     # Simulated with the use of the main wsn map, that contains the
     def find_neighbours(self, nodes_list=list):
         for node in nodes_list:
-            if self.distance_from(node.get_localisation()) < self.mv_SensingRange:
+            if self.is_in_sensing_range(node):
                 self.add_neighbour(id(node))
 
     # Adds the neighbour to the list of neighbours after validation
@@ -356,22 +417,46 @@ class Node:
     # Simulates data collection
     def collect_data(self):
         # Sends the signal to SOC to take care of data collection and energy management
-        self.mo_SOC.sense_data()
+        self.mo_State.subtract_energy(
+            self.mo_SOC.get_sensing_consumption(), self.mv_Index
+        )
 
     # Receives the data packet
     def receive_data(self):
-        self.mo_SOC.receive_data()
+        self.mo_State.subtract_energy(
+            self.mo_SOC.calculate_receiver_consumption(
+                self.mo_SOC.get_data_packet_size()
+            ),
+            self.mv_Index,
+        )
 
     def aggregate_and_send_data(self, distance=float, amount_of_data_packets=int):
-        self.mo_SOC.aggregate_and_send_data(distance, amount_of_data_packets)
+        self.mo_State.subtract_energy(
+            self.mo_SOC.calculate_transmission_consumption(
+                amount_of_data_packets * self.mo_SOC.get_data_packet_size(), distance
+            ),
+            self.mv_Index,
+        )
 
     # Transmits the data packet
     def transmit_data(self, distance=float):
         # Informs the SOC that It has to follow through the transmission procedures
-        self.mo_SOC.send_data(distance)
+        self.mo_State.subtract_energy(
+            self.mo_SOC.calculate_transmission_consumption(
+                self.mo_SOC.get_data_packet_size(), distance
+            ),
+            self.mv_Index,
+        )
 
     def transmit_status(self, distance=float):
-        self.mo_SOC.send_status(distance)
+        self.mo_State.subtract_energy(
+            self.mo_SOC.calculate_transmission_consumption(
+                self.mo_SOC.get_status_message_size(), distance
+            ),
+            self.mv_Index,
+        )
 
+    # Receives the data packet of another node and sends it further along with its own one
     def aggregate_data(self, distance=float):
-        self.mo_SOC.aggregate_data(distance)
+        self.receive_data()
+        self.aggregate_and_send_data(distance, 2)
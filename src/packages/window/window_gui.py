@@ -56,6 +56,12 @@ class Canvas(FigureCanvasQTAgg):
         self.m_Plots = None
         self.m_Figure = Figure(figsize=(width, height), dpi=dpi)
 
+        # The scatter of the nodes, kept between the updates, only its data changes
+        self.m_Scatter = None
+
+        # The rendered figure without the nodes, the changed nodes are drawn over it
+        self.m_Background = None
+
         #########
         # Setup #
         #########
@@ -66,11 +72,46 @@ class Canvas(FigureCanvasQTAgg):
         # Changing the layout to tight
         self.m_Figure.tight_layout()
 
+        # Every full redraw, also after resizing or zooming, renders a new background
+        self.mpl_connect("draw_event", self.onDraw)
+
     def addSinglePlot(self):
         self.m_Plots = self.m_Figure.subplots()
 
+    # Sets the nodes positions and colours, the scatter is created only the first time
     def createAreaPlot(self, x, y, color):
-        self.m_Plots.scatter(x, y, s=50, c=color, cmap="Set1")
+        offsets = np.column_stack((x, y))
+
+        if self.m_Scatter is None:
+            # The animated scatter is left out of the full redraws and drawn over the background instead
+            self.m_Scatter = self.m_Plots.scatter(
+                x, y, s=50, c=color, cmap="Set1", animated=True
+            )
+        else:
+            self.m_Scatter.set_offsets(offsets)
+            self.m_Scatter.set_array(np.asarray(color))
+            self.m_Scatter.autoscale()
+
+            # The limits of the axes follow the new positions
+            self.m_Plots.ignore_existing_data_limits = True
+            self.m_Plots.update_datalim(offsets)
+            self.m_Plots.autoscale_view()
+
+        # The background doesn't match the new limits anymore
+        self.m_Background = None
+
+    # Changes the colours of the chosen nodes and repaints only the nodes over the background
+    def updateAreaColors(self, indices, colors):
+        if self.m_Scatter is None:
+            return
+
+        array = np.array(self.m_Scatter.get_array())
+        array[indices] = colors
+
+        self.m_Scatter.set_array(array)
+        self.m_Scatter.autoscale()
+
+        self.blitAxes()
 
     def clearCanvas(self):
         # Checking if there are more than one plots on the canvas
@@ -80,13 +121,37 @@ class Canvas(FigureCanvasQTAgg):
         # Clearing the figure of any plots
         self.m_Figure.clear()
 
+        self.m_Scatter = None
+        self.m_Background = None
+
     def clearAxes(self):
         for plot in self.m_Figure.get_axes():
             plot.clear()
 
+        self.m_Scatter = None
+        self.m_Background = None
+
+    # Redraws the whole figure
     def updateAxes(self):
         self.draw()
 
+    # Repaints the nodes over the stored background, the whole figure is redrawn only if there is no background
+    def blitAxes(self):
+        if self.m_Background is None:
+            self.updateAxes()
+            return
+
+        self.restore_region(self.m_Background)
+        self.m_Plots.draw_artist(self.m_Scatter)
+        self.blit(self.m_Plots.bbox)
+
+    # Stores the background after a full redraw and draws the nodes over it
+    def onDraw(self, event):
+        self.m_Background = self.copy_from_bbox(self.m_Plots.bbox)
+
+        if self.m_Scatter is not None:
+            self.m_Plots.draw_artist(self.m_Scatter)
+
 
 # GUI class, implements the functionality from the backend
 class Window(QMainWindow):
@@ -125,6 +190,9 @@ class Window(QMainWindow):
         # Current active nodes
         self.m_ActiveNodes = 0
 
+        # Current nodes cut off from the base station
+        self.m_CutOffNodes = 0
+
         self.m_SimulationRoundFinished = False
 
         self.m_CurrentAlgorithm = str()
@@ -144,6 +212,26 @@ class Window(QMainWindow):
         # Data collector and plotter object
         self.m_DataCollector = DataCollector()
 
+        # Runs the repeated and the compared simulations in parallel processes, without blocking the window
+        self.m_SimulationQueue = network.SimulationQueue()
+        self.m_SimulationQueue.add_observer("job_finished", self.show_job_results)
+        self.m_SimulationQueue.add_observer("job_failed", self.show_job_failure)
+        self.m_SimulationQueue.add_observer("batch_progress", self.show_batch_progress)
+        self.m_SimulationQueue.add_observer(
+            "batch_finished", self.collect_batch_results
+        )
+
+        # Collects the finished jobs of the queue from the window's event loop
+        self.m_QueueTimer = QTimer(self)
+        self.m_QueueTimer.setInterval(100)
+        self.m_QueueTimer.timeout.connect(self.poll_simulation_queue)
+
+        # Set while a simulation started from the window hasn't finished yet
+        self.m_SimulationRunning = False
+
+        # The algorithms indices of the batch waiting for the network settings
+        self.m_BatchAlgorithms = []
+
         # The backend, that the window will visualise
         self.backend = network.SensoricNetwork(
             node_amount=50, battery_capacity=1, width=200, height=200
@@ -272,6 +360,15 @@ class Window(QMainWindow):
             "Porównaj wykresy pokrycia:", self.to_compare_coverage_checkbox
         )
 
+        self.track_connectivity_checkbox = QCheckBox()
+        self.track_connectivity_checkbox.setStatusTip(
+            "Stops simulating the nodes, that can't reach the base station over the communication links"
+        )
+        self.track_connectivity_checkbox.toggled.connect(self.set_connectivity_tracking)
+        self.repetition_amount_layout.addRow(
+            "Pomijaj odcięte sensory:", self.track_connectivity_checkbox
+        )
+
         self.to_compare_runtime_stats_checkbox = QCheckBox()
         self.to_compare_runtime_stats_checkbox.toggled.connect(
             self.to_compare_runtime_stats
@@ -380,6 +477,10 @@ class Window(QMainWindow):
 
         self.active_nodes = QLabel()
 
+        # Displays the amount of the nodes cut off from the base station
+        self.cut_off_nodes = QLabel()
+        self.cut_off_nodes.setText("0")
+
         # Adding the labels to the layout
         self.runtime_info_layout.addWidget(self.naive_label)
         self.runtime_info_layout.addRow("FND:", self.naive_fnd)
@@ -391,6 +492,7 @@ class Window(QMainWindow):
         self.runtime_info_layout.addRow("LND:", self.pso_lnd)
         self.runtime_info_layout.addWidget(self.active_nodes_amount_label)
         self.runtime_info_layout.addRow("Aktywne sensory:", self.active_nodes)
+        self.runtime_info_layout.addRow("Odcięte sensory:", self.cut_off_nodes)
 
         #######################################################
         # Adding created layouts to the outer settings layout #
@@ -441,6 +543,7 @@ class Window(QMainWindow):
         )
 
         self.backend.signal_update_plot.connect(self.draw_plot)
+        self.backend.signal_update_plot_delta.connect(self.draw_plot_changes)
 
         self.backend.signal_send_fnd_naive.connect(self.set_fnd_naive)
         self.backend.signal_send_hnd_naive.connect(self.set_hnd_naive)
@@ -460,6 +563,8 @@ class Window(QMainWindow):
             self.set_simulation_finished
         )
         self.backend.signal_send_active_nodes.connect(self.set_active_nodes)
+        self.backend.signal_send_batch_settings.connect(self.submit_batch)
+        self.backend.signal_send_cut_off_nodes.connect(self.set_cut_off_nodes)
 
         ####################################
         # Emitting signals to get the data #
@@ -554,49 +659,49 @@ class Window(QMainWindow):
     def set_current_algorithm(self, name=str):
         if self.backend.mutex.tryLock():
             self.m_CurrentAlgorithm = name
-        self.backend.mutex.unlock()
+            self.backend.mutex.unlock()
 
     def set_node_amount(self, name=int):
         if self.backend.mutex.tryLock():
             self.m_NodeAmount = name
-        self.backend.mutex.unlock()
+            self.backend.mutex.unlock()
         self.m_DataCollector.set_nodes_amount(name)
         self.nodes_amount_box.setText(str(self.m_NodeAmount))
 
     def set_fnd_naive(self, value=int):
         if self.backend.mutex.tryLock():
             self.m_NaiveRoundData[0] = value
-        self.backend.mutex.unlock()
+            self.backend.mutex.unlock()
         self.naive_fnd.setText(str(self.m_NaiveRoundData[0]))
 
     def set_hnd_naive(self, value=int):
         if self.backend.mutex.tryLock():
             self.m_NaiveRoundData[1] = copy(value)
-        self.backend.mutex.unlock()
+            self.backend.mutex.unlock()
         self.naive_hnd.setText(str(self.m_NaiveRoundData[1]))
 
     def set_lnd_naive(self, value=int):
         if self.backend.mutex.tryLock():
             self.m_NaiveRoundData[2] = copy(value)
-        self.backend.mutex.unlock()
+            self.backend.mutex.unlock()
         self.naive_lnd.setText(str(self.m_NaiveRoundData[2]))
 
     def set_fnd_pso(self, value=int):
         if self.backend.mutex.tryLock():
             self.m_psoRoundData[0] = copy(value)
-        self.backend.mutex.unlock()
+            self.backend.mutex.unlock()
         self.pso_fnd.setText(str(self.m_psoRoundData[0]))
 
     def set_hnd_pso(self, value=int):
         if self.backend.mutex.tryLock():
             self.m_psoRoundData[1] = copy(value)
-        self.backend.mutex.unlock()
+            self.backend.mutex.unlock()
         self.pso_hnd.setText(str(self.m_psoRoundData[1]))
 
     def set_lnd_pso(self, value=int):
         if self.backend.mutex.tryLock():
             self.m_psoRoundData[2] = copy(value)
-        self.backend.mutex.unlock()
+            self.backend.mutex.unlock()
         self.pso_lnd.setText(str(self.m_psoRoundData[2]))
 
     def append_coverage_delta_data_naive(self, data=tuple):
@@ -608,14 +713,28 @@ class Window(QMainWindow):
     def set_simulation_finished(self, value=bool):
         if self.backend.mutex.tryLock():
             self.m_SimulationRoundFinished = copy(value)
-        self.backend.mutex.unlock()
+            self.backend.mutex.unlock()
+
+        # The single simulation runs in the backend thread and reports its end with this signal
+        if self.m_SimulationRunning and self.m_SimulationRoundFinished:
+            self.collect_simulation_results()
 
     def set_active_nodes(self, value=int):
         if self.backend.mutex.tryLock():
             self.m_ActiveNodes = value
-        self.backend.mutex.unlock()
+            self.backend.mutex.unlock()
         self.active_nodes.setText(str(self.m_ActiveNodes))
 
+    def set_cut_off_nodes(self, value=int):
+        if self.backend.mutex.tryLock():
+            self.m_CutOffNodes = value
+            self.backend.mutex.unlock()
+        self.cut_off_nodes.setText(str(self.m_CutOffNodes))
+
+    def set_connectivity_tracking(self, enabled=bool):
+        self.backend.signal_set_connectivity_tracking.emit(enabled)
+        self.m_DataCollector.clear()
+
     def set_repetition(self, index=int):
         self.m_Repeat = int(self.m_RepetitionValues[index])
         self.m_DataCollector.clear()
@@ -634,7 +753,7 @@ class Window(QMainWindow):
     def set_local_height(self, height=int):
         if self.backend.mutex.tryLock():
             self.m_Height = copy(height)
-        self.backend.mutex.unlock()
+            self.backend.mutex.unlock()
         self.select_height_box.setText(str(self.m_Height))
 
         self.m_DataCollector.clear()
@@ -650,7 +769,7 @@ class Window(QMainWindow):
     def set_local_width(self, width=int):
         if self.backend.mutex.tryLock():
             self.m_Width = copy(width)
-        self.backend.mutex.unlock()
+            self.backend.mutex.unlock()
         self.select_width_box.setText(str(self.m_Width))
 
         self.m_DataCollector.clear()
@@ -683,13 +802,10 @@ class Window(QMainWindow):
         self.m_DataCollector.clear()
 
     def draw_plot(self, temp):
-        # Clearing the axes
-        self.area_widget.clearAxes()
-
-        # Getting the data from the thread
+        # Getting the data from the thread, the lists are copied as the changes are applied to them later
         if self.backend.mutex.tryLock():
-            self.m_PlotData = copy(temp)
-        self.backend.mutex.unlock()
+            self.m_PlotData = [copy(item) for item in temp]
+            self.backend.mutex.unlock()
 
         self.area_widget.createAreaPlot(
             self.m_PlotData[0], self.m_PlotData[1], self.m_PlotData[2]
@@ -697,81 +813,134 @@ class Window(QMainWindow):
 
         self.area_widget.updateAxes()
 
-    # Runs the amount of repeated simulations desired
+    # Applies the [indices, colours, activity flags] of the changed nodes to the plot
+    def draw_plot_changes(self, changes):
+        if len(self.m_PlotData) < 3:
+            return
+
+        for index, colour in zip(changes[0], changes[1]):
+            self.m_PlotData[2][index] = colour
+
+        # Only the changed nodes are repainted
+        self.area_widget.updateAreaColors(changes[0], changes[1])
+
+    # Starts the simulations desired and returns at once, the results are collected when they are finished
     def run_simulation(self):
+        if self.m_SimulationRunning:
+            return
+
         self.m_DataCollector.add_rounds_number(int(self.m_Repeat))
         self.backend.signal_get_current_algorithm.emit()
 
-                        # Taking the data from algorithms combobox
+        self.m_SimulationRunning = True
+        self.run_simulation_button.setDisabled(True)
+
+        # The repetitions and the comparisons are independent runs, so they are spread across the processes.
+        # The runs of all of the compared algorithms are queued at once and run concurrently
+        if (
+            self.m_Repeat > 1
+            or self.m_ToCompareCoverage
+            or self.m_ToCompareRuntimeStats
+        ):
+            if self.m_ToCompareCoverage or self.m_ToCompareRuntimeStats:
+                self.m_BatchAlgorithms = list(
+                    range(self.select_algorithm_combo.count())
+                )
+            else:
+                self.m_BatchAlgorithms = [self.select_algorithm_combo.currentIndex()]
+
+            # The backend sends its settings and a seed from its own thread, the batch is submitted then
+            self.backend.signal_get_batch_settings.emit()
+
+        # A single run is simulated in the backend thread, so its progress is shown on the plot
+        else:
+            self.backend.signal_run_simulation.emit()
+
+    # Submits the batch with the network settings and the seed sent by the backend.
+    # The runs streams are children of the backend's one, so the batch can be reproduced from its seed
+    def submit_batch(self, settings, seed):
+        self.m_SimulationQueue.submit(
+            self.m_BatchAlgorithms, self.m_Repeat, settings, seed
+        )
+
+        self.m_QueueTimer.start()
+
+    # Passes the finished jobs of the queue to the window
+    def poll_simulation_queue(self):
+        if not self.m_SimulationQueue.poll():
+            self.m_QueueTimer.stop()
+
+    # Shows the results of a finished run of the queue
+    def show_job_results(self, batch, algorithm, repetition, result):
+        rounds = result[1]
+
+        if algorithm == 0:
+            self.set_fnd_naive(rounds[0])
+            self.set_hnd_naive(rounds[1])
+            self.set_lnd_naive(rounds[2])
+        else:
+            self.set_fnd_pso(rounds[0])
+            self.set_hnd_pso(rounds[1])
+            self.set_lnd_pso(rounds[2])
+
+    # Reports a run of the queue, that failed, the rest of the batch goes on without its results
+    def show_job_failure(self, batch, algorithm, repetition, exception):
+        print(
+            "Simulation "
+            + str(repetition)
+            + " of the algorithm "
+            + str(algorithm)
+            + " failed: "
+            + repr(exception)
+        )
+
+    # Shows the amount of the finished runs of the queue
+    def show_batch_progress(self, batch, finished, total):
+        self.statusBar().showMessage(
+            "Ukończone symulacje: " + str(finished) + "/" + str(total)
+        )
+
+    # Gathers the results of all of the runs of the queue
+    def collect_batch_results(self, batch, results):
+        # The cancelled runs have no results
+        results = [result for result in results if result is not None]
+
+        if self.m_ToPlot or self.m_ToCompareCoverage or self.m_ToCompareRuntimeStats:
+            self.m_DataCollector.add_simulation_results(results)
+
+        self.finish_simulation()
+
+    # Gathers the results of the single run simulated in the backend thread
+    def collect_simulation_results(self):
         algorithms = [
             self.select_algorithm_combo.itemText(i)
             for i in range(self.select_algorithm_combo.count())
         ]
 
-        for amount in range(self.m_Repeat):
-            if not self.m_ToCompareCoverage and not self.m_ToCompareRuntimeStats:
-
-                self.backend.signal_run_simulation.emit()
-
-                print("Zyje")
-
-                while not self.m_SimulationRoundFinished:
-                    sleep(0.15)
-                    print("Attempted an update")
-                    self.backend.calculate_plot_data().emit()
-                    sleep(0.15)
-
-                if self.m_ToPlot:
-                    if self.m_CurrentAlgorithm == algorithms[0]:
-                        self.m_DataCollector.add_naive_round_data(self.m_NaiveRoundData)
-                        self.m_DataCollector.add_naive_coverage_data(
-                            self.m_NaiveCoverageData
-                        )
-                    if self.m_CurrentAlgorithm == algorithms[1]:
-                        self.m_DataCollector.add_pso_round_data(self.m_psoRoundData)
-                        self.m_DataCollector.add_pso_coverage_data(
-                            self.m_PsoCoverageData
-                        )
-
-                self.m_NaiveRoundData = [0, 0, 0]
-                self.m_psoRoundData = [0, 0, 0]
-                print("PSO coverage data len: " + str(len(self.m_PsoCoverageData)))
-                print("Naive coverage data len: " + str(len(self.m_NaiveCoverageData)))
-                self.m_PsoCoverageData.clear()
-                self.m_NaiveCoverageData.clear()
+        if self.m_ToPlot:
+            if self.m_CurrentAlgorithm == algorithms[0]:
+                self.m_DataCollector.add_naive_round_data(self.m_NaiveRoundData)
+                self.m_DataCollector.add_naive_coverage_data(self.m_NaiveCoverageData)
+            if self.m_CurrentAlgorithm == algorithms[1]:
+                self.m_DataCollector.add_pso_round_data(self.m_psoRoundData)
+                self.m_DataCollector.add_pso_coverage_data(self.m_PsoCoverageData)
 
-            else:
-                for index in range(len(algorithms)):
-                    self.set_algorithm(index)
-                    
-                    self.backend.signal_run_simulation.emit()
-
-                    while not self.m_SimulationRoundFinished:
-                        sleep(0.15)
-                        self.backend.calculate_plot_data().emit()
-                        sleep(0.15)
-
-                    # Continues with another round
-                    self.m_SimulationRoundFinished = True
-
-                    if algorithms[index] == algorithms[0]:
-                        self.m_DataCollector.add_naive_round_data(self.m_NaiveRoundData)
-                        self.m_DataCollector.add_naive_coverage_data(
-                            self.m_NaiveCoverageData
-                        )
-                    if algorithms[index] == algorithms[1]:
-                        self.m_DataCollector.add_pso_round_data(self.m_psoRoundData)
-                        self.m_DataCollector.add_pso_coverage_data(
-                            self.m_PsoCoverageData
-                        )
-
-                    self.m_NaiveRoundData = [0, 0, 0]
-                    self.m_psoRoundData = [0, 0, 0]
-                    self.m_PsoCoverageData.clear()
-                    self.m_NaiveCoverageData.clear()
-
-            # Continues with another round
-            self.m_SimulationRoundFinished = False
+        self.m_NaiveRoundData = [0, 0, 0]
+        self.m_psoRoundData = [0, 0, 0]
+        print("PSO coverage data len: " + str(len(self.m_PsoCoverageData)))
+        print("Naive coverage data len: " + str(len(self.m_NaiveCoverageData)))
+        self.m_PsoCoverageData.clear()
+        self.m_NaiveCoverageData.clear()
+
+        # Continues with another round
+        self.m_SimulationRoundFinished = False
+
+        self.finish_simulation()
+
+    # Saves the plots of the finished simulations and lets the user start the next ones
+    def finish_simulation(self):
+        self.m_SimulationRunning = False
+        self.run_simulation_button.setEnabled(True)
 
         # DataCollector has to give back the info whether the naive simulation has been run
         timestr = time.strftime("%Y%m%d-%H%M%S")
@@ -811,4 +980,11 @@ class Window(QMainWindow):
             self.m_DataCollector.save_separate_plot()
             self.m_DataCollector.save_coverage_comparsion_plot()
             self.m_DataCollector.save_runtime_comparsion_plot()
-            self.m_DataCollector.clear()
\ No newline at end of file
+            self.m_DataCollector.clear()
+
+    # Stops the workers of the queue along with the window
+    def closeEvent(self, event):
+        self.m_QueueTimer.stop()
+        self.m_SimulationQueue.shutdown()
+
+        super().closeEvent(event)
@@ -0,0 +1,157 @@
+######################################################
+# Headless batch entry point of the research app.    #
+# Runs a parameter sweep over the network settings   #
+# in parallel processes and writes one results table #
+######################################################
+
+
+###########
+# Imports #
+###########
+
+
+# The sweep and the runner, neither of them needs the Qt
+from packages.backend.wsn import MonteCarloRunner, ParameterSweep, ResultCache
+
+import argparse
+
+
+#############
+# Functions #
+#############
+
+
+# Returns the parser of a comma separated list of values, eg. "50,100,200", for the type of the argument.
+# The wrong values are reported by argparse along with the usage, instead of a traceback
+def list_type(value_type=int, choices=None):
+    def parse_list(text):
+        try:
+            values = [value_type(value) for value in text.split(",") if value != ""]
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                "expected a comma separated list of "
+                + value_type.__name__
+                + " values, got "
+                + repr(text)
+            )
+
+        if len(values) == 0:
+            raise argparse.ArgumentTypeError("expected at least one value")
+
+        if choices is not None:
+            for value in values:
+                if value not in choices:
+                    raise argparse.ArgumentTypeError(
+                        repr(value) + " is not one of " + ", ".join(choices)
+                    )
+
+        return values
+
+    return parse_list
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description="Runs the simulations for every combination of the given settings"
+    )
+
+    parser.add_argument(
+        "--nodes", type=list_type(int), default="50", help="node amounts, eg. 50,100"
+    )
+    parser.add_argument(
+        "--width", type=list_type(int), default="200", help="area widths"
+    )
+    parser.add_argument(
+        "--height", type=list_type(int), default="200", help="area heights"
+    )
+    parser.add_argument(
+        "--battery",
+        type=list_type(float),
+        default="1",
+        help="node battery capacities in J, eg. 0.5,1",
+    )
+    parser.add_argument(
+        "--coverage",
+        type=list_type(int),
+        default="70",
+        help="minimum coverage values in percent",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=list_type(int),
+        default="100",
+        help="max iterations of the PSO algorithm",
+    )
+    parser.add_argument(
+        "--algorithms",
+        type=list_type(str.lower, list(ParameterSweep.md_AlgorithmNames)),
+        default="naive,pso",
+        help="algorithms, naive and/or pso",
+    )
+    parser.add_argument(
+        "--repetitions", type=int, default=1, help="runs of every configuration"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="seed of the runs")
+    parser.add_argument(
+        "--processes", type=int, default=None, help="worker processes, all by default"
+    )
+    parser.add_argument(
+        "--output", default="sweep_results.csv", help="path of the results table"
+    )
+    parser.add_argument(
+        "--cache", default=None, help="directory of the results cache, none by default"
+    )
+    parser.add_argument(
+        "--cache-size", type=int, default=64, help="size limit of the cache in MB"
+    )
+
+    return parser.parse_args()
+
+
+#################
+# Main function #
+#################
+
+
+def main():
+    arguments = parse_arguments()
+
+    sweep = ParameterSweep(
+        grid={
+            "node_amount": arguments.nodes,
+            "width": arguments.width,
+            "height": arguments.height,
+            "battery_capacity": arguments.battery,
+            "minimum_coverage": arguments.coverage,
+            "max_iteration": arguments.iterations,
+        },
+        algorithms=arguments.algorithms,
+        repetitions=arguments.repetitions,
+        seed=arguments.seed,
+    )
+
+    print("Running " + str(sweep.get_runs_amount()) + " simulations")
+
+    # The runs with a seed given are reproducible, so they can be reused from the cache
+    cache = None
+
+    if arguments.cache is not None:
+        cache = ResultCache(arguments.cache, arguments.cache_size * 1024 * 1024)
+
+    rows = sweep.run(MonteCarloRunner(arguments.processes, cache))
+
+    sweep.save_results(rows, arguments.output)
+
+    if cache is not None:
+        print(
+            "Cached runs used: "
+            + str(cache.mv_Hits)
+            + ", simulated: "
+            + str(cache.mv_Misses)
+        )
+
+    print("Results saved to: " + arguments.output)
+
+
+if __name__ == "__main__":
+    main()
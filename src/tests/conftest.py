@@ -0,0 +1,17 @@
+################################################################
+# Configuration of the tests. The packages are imported the    #
+# same way as in the main app, from the src directory          #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# For the import path of the packages
+import os
+import sys
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,34 @@
+################################################################
+# Random layouts of the nodes shared by the checks, with the   #
+# links within the communication range and the distances to    #
+# the base station in the middle of the area                   #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# For the arrays of the layouts
+import numpy as np
+
+# The structures of the layouts
+from packages.backend.wsn import CommunicationGraph, DistanceCache, SpatialIndex
+
+
+#####################
+# Helpers functions #
+#####################
+
+
+# Returns the communication graph of random nodes and the distances of the nodes to the base station
+def build_layout(node_amount=int, communication_range=float, seed=int):
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(0, 200, size=(node_amount, 2))
+    base_position = (100, 100)
+
+    distance_cache = DistanceCache(positions, base_position, SpatialIndex(positions))
+    graph = CommunicationGraph(distance_cache, communication_range)
+
+    return graph, distance_cache.get_base_distances(), positions
@@ -0,0 +1,148 @@
+################################################################
+# Checks of the routes of the cluster heads. The extracted     #
+# establish_cluster_head_paths builds the same routes as the   #
+# loop of the PSO algorithm, that it was taken out of          #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# For the battery levels of the nodes
+import numpy as np
+
+# The tested object
+from packages.backend.wsn import SimulationCore
+
+
+#####################
+# Helpers functions #
+#####################
+
+
+# The routes of the cluster heads built the way the loop of the PSO algorithm did before the extraction.
+# Returns false, when one of the cluster heads is dead
+def establish_reference_paths(network):
+    reshuffle = False
+
+    # If there is any need - creating the multihop route for the cluster heads over other cluster heads
+    for head in network.ml_ClusterHeads:
+        if head.is_active():
+            head.clear_path()
+
+            # Checking if a node needs multihop
+            if (
+                network.get_distance(head, network.mv_BaseStation)
+                > network.mv_BaseStation.get_amplifier_threshold_distance()
+            ):
+                hops_left = network.ml_ClusterHeads.copy()
+
+                hops_left.add(network.mv_BaseStation)
+                hops_left.remove(head)
+
+                while not head.is_path_estabilished():
+                    next_hop_tuple = (None, None)
+                    found_head = False
+                    for hop in hops_left:
+                        value = network.hop_weight(head, hop)
+
+                        # If the temporal tuple is empty
+                        if next_hop_tuple[1] is None:
+                            temp = (hop, value)
+                            next_hop_tuple = temp
+                            continue
+
+                        if value < next_hop_tuple[1]:
+                            temp = (hop, value)
+                            next_hop_tuple = temp
+                            if id(hop) == id(network.mv_BaseStation):
+                                head.add_to_path(hop)
+                                found_head = True
+                                break
+
+                    if found_head:
+                        break
+
+                    head.add_to_path(next_hop_tuple[0])
+                    hops_left.remove(next_hop_tuple[0])
+
+                # Adding to the paths estabilished index
+                head.activate_multihop_flag()
+            else:
+                head.add_to_path(network.mv_BaseStation)
+        else:
+            reshuffle = True
+
+    return not reshuffle
+
+
+# Returns the routes of the cluster heads and their flags, the base station is marked apart from the nodes
+def get_routes(network):
+    return {
+        head.mv_Index: (
+            {
+                "base" if hop is network.mv_BaseStation else hop.mv_Index
+                for hop in head.ml_Path
+            },
+            head.is_multihop(),
+            head.is_path_estabilished(),
+        )
+        for head in network.ml_ClusterHeads
+    }
+
+
+# Checks that both of the ways give the same routes of the cluster heads in the current state of the network
+def check_routes(network):
+    state = network.mo_State
+    paths = {head: head.ml_Path for head in network.ml_ClusterHeads}
+    flags = (state.ma_MultiHop.copy(), state.ma_PathEstabilished.copy())
+
+    established = network.establish_cluster_head_paths()
+    routes = get_routes(network)
+
+    # Both of the ways start from the same routes and flags
+    for head, path in paths.items():
+        head.ml_Path = path
+
+    state.ma_MultiHop[:], state.ma_PathEstabilished[:] = flags
+
+    assert establish_reference_paths(network) == established
+    assert get_routes(network) == routes
+
+    return routes
+
+
+#########
+# Tests #
+#########
+
+
+# The routes are the same right after the setup, with the drained batteries and after a death of a cluster head
+def test_cluster_head_paths_match_pso_loop():
+    network = SimulationCore(node_amount=100, battery_capacity=1, seed=3)
+    network.mv_MaxIteration = 5
+    network.initiate_network()
+    network.start_connectivity_tracking()
+    network.pso_setup()
+
+    routes = check_routes(network)
+
+    # Some of the cluster heads are far from the base station, so they go over the other ones
+    assert any(multihop for _, multihop, _ in routes.values())
+    assert any(len(hops) > 1 for hops, _, _ in routes.values())
+
+    # The hop weights depend on the battery levels
+    rng = np.random.default_rng(1)
+    network.mo_State.ma_CurrentCapacity *= rng.uniform(0.1, 1, size=100)
+
+    check_routes(network)
+
+    # A dead cluster head means a new setup
+    head = next(iter(network.ml_ClusterHeads))
+    network.mo_State.deactivate(head.mv_Index)
+
+    assert not network.establish_cluster_head_paths()
+
+    check_routes(network)
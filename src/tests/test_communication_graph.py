@@ -0,0 +1,45 @@
+################################################################
+# Checks of the communication graph. The links are the pairs   #
+# of the nodes within the communication range, and the own     #
+# neighbours lists of the nodes don't depend on the graph      #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# For the arrays of the layouts
+import numpy as np
+
+# The tested object
+from packages.backend.wsn import SimulationCore
+
+
+#########
+# Tests #
+#########
+
+
+# The amounts of the linked nodes are the ones of a brute force search, the neighbours lists stay the same
+def test_communication_neighbours_match_brute_force():
+    network = SimulationCore(node_amount=150, battery_capacity=1, seed=5)
+    network.initiate_network()
+
+    node = network.ml_Nodes[0]
+    node.add_to_neighbours_list(network.ml_Nodes[1])
+
+    assert node.get_neighbours_amount() == 1
+
+    positions = network.mo_State.ma_Positions
+    distances = np.hypot(*(positions[:, None, :] - positions[None, :, :]).T)
+    within_range = (distances <= node.get_communication_range()) & (distances > 0)
+
+    for other in network.ml_Nodes:
+        assert network.get_communication_neighbours_amount(other) == np.count_nonzero(
+            within_range[other.mv_Index]
+        )
+
+    # Building the graph doesn't change the neighbours list of the node
+    assert node.get_neighbours_amount() == 1
@@ -0,0 +1,109 @@
+################################################################
+# Checks of the nodes cut off from the base station. The       #
+# tracker against the connected components of the living       #
+# nodes, and the amounts sent by the fast forwarded naive      #
+# algorithm against the round by round loop                    #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# For the arrays of the layouts
+import numpy as np
+
+# For the reference connectivity
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+# The tested objects
+from packages.backend.wsn import ConnectivityTracker, SimulationCore
+
+# The shared layouts
+from layouts import build_layout
+
+
+#####################
+# Helpers functions #
+#####################
+
+
+# Returns the living nodes, that aren't in the same connected component as the base station, the last node
+def find_cut_off_nodes(graph, base_links, alive):
+    size = graph.get_size()
+
+    links = graph.get_matrix().toarray() > 0
+    links = np.pad(links, ((0, 1), (0, 1)))
+    links[size, base_links] = True
+    links[base_links, size] = True
+
+    alive = np.append(alive, True)
+    links &= alive[:, None] & alive[None, :]
+
+    _, labels = connected_components(csr_matrix(links), directed=False)
+
+    return np.flatnonzero(alive[:size] & (labels[:size] != labels[size]))
+
+
+# Returns the amounts of the cut off and the active nodes sent in every round of the naive algorithm
+def record_naive_rounds(fast_forward=bool):
+    network = SimulationCore(node_amount=150, battery_capacity=1, seed=3)
+    network.mb_FastForward = fast_forward
+    network.set_connectivity_tracking(True)
+
+    events = []
+
+    network.add_observer("cut_off_nodes", lambda amount: events.append(("cut", amount)))
+    network.add_observer("active_nodes", lambda amount: events.append(("on", amount)))
+
+    network.naive_algorithm_new()
+
+    return events, network.mv_LND
+
+
+#########
+# Tests #
+#########
+
+
+# The nodes cut off by the tracker after every batch of deaths are the ones outside of the base station component
+def test_connectivity_tracker_matches_connected_components():
+    graph, base_distances, _ = build_layout(200, 25, 3)
+    base_links = np.flatnonzero(base_distances <= 25)
+
+    tracker = ConnectivityTracker(graph.get_matrix(), base_links)
+    alive = np.ones(graph.get_size(), dtype=bool)
+    rng = np.random.default_rng(0)
+
+    previous = set(find_cut_off_nodes(graph, base_links, alive))
+    assert set(tracker.get_cut_off_indices()) == previous
+
+    while alive.sum() > 5:
+        dead = rng.choice(
+            np.flatnonzero(alive), size=rng.integers(1, 6), replace=False
+        )
+        alive[dead] = False
+
+        newly_cut_off = tracker.remove(dead)
+        expected = set(find_cut_off_nodes(graph, base_links, alive))
+
+        assert set(tracker.get_cut_off_indices()) == expected
+        assert set(newly_cut_off) == expected - previous
+        assert tracker.get_connected_amount() == alive.sum() - len(expected)
+
+        previous = expected
+
+
+# The fast forward sends the amounts of the nodes in every round, also in the ones without any deaths
+def test_fast_forward_sends_every_round():
+    expected, expected_rounds = record_naive_rounds(False)
+    events, rounds = record_naive_rounds(True)
+
+    assert rounds == expected_rounds
+    assert events == expected
+
+    # The first amount is sent before the rounds, the other ones after each of them
+    assert sum(1 for event in events if event[0] == "on") == rounds
+    assert sum(1 for event in events if event[0] == "cut") == rounds + 1
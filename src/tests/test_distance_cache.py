@@ -0,0 +1,80 @@
+################################################################
+# Checks of the distance cache. The distances are the ones of  #
+# the geometry library, and only the recently used rows are    #
+# kept within the memory limit                                 #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# For the arrays of the layouts
+import numpy as np
+
+# For the reference distances
+import shapely
+
+# The tested objects
+from packages.backend.wsn import DistanceCache, SpatialIndex
+
+
+#########
+# Tests #
+#########
+
+
+# The distances between the nodes and to the base station are the ones of the geometry library
+def test_distances_match_geometry():
+    rng = np.random.default_rng(1)
+    positions = rng.uniform(0, 200, size=(60, 2))
+    cache = DistanceCache(positions, (100, 100), SpatialIndex(positions))
+
+    points = shapely.points(positions)
+
+    assert np.array_equal(
+        cache.get_base_distances(), shapely.distance(points, shapely.Point(100, 100))
+    )
+
+    for index in range(0, 60, 7):
+        assert np.array_equal(
+            cache.get_distances(index), shapely.distance(points[index], points)
+        )
+
+    # The sparse distances are the ones within the range, without the nodes themselves
+    sparse = cache.get_sparse_distances(30).toarray()
+    dense = np.hypot(*(positions[:, None, :] - positions[None, :, :]).T)
+
+    assert np.array_equal(sparse > 0, (dense <= 30) & (dense > 0))
+    assert np.allclose(sparse[sparse > 0], dense[sparse > 0])
+
+
+# Only as many rows as fit in the limit are kept, the least recently used one is dropped first
+def test_rows_are_least_recently_used():
+    positions = np.random.default_rng(2).uniform(0, 200, size=(100, 2))
+
+    # Every row takes 800 bytes, so three of them fit
+    cache = DistanceCache(positions, (100, 100), max_rows_size=2500)
+    assert cache.mv_MaxRows == 3
+
+    for index in (0, 1, 2):
+        cache.get_distances(index)
+
+    # Reading the first row marks it as used
+    cache.get_distance(0, 5)
+    cache.get_distances(3)
+
+    assert list(cache.md_Rows) == [2, 0, 3]
+
+    cache.get_distances(4)
+
+    assert list(cache.md_Rows) == [0, 3, 4]
+
+    # A dropped row is calculated again, with the same values
+    assert np.allclose(cache.get_distances(1), np.hypot(*(positions - positions[1]).T))
+    assert len(cache.md_Rows) == 3
+
+    cache.clear_rows()
+
+    assert len(cache.md_Rows) == 0
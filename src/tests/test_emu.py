@@ -0,0 +1,74 @@
+################################################################
+# Checks of the batch energy math of the EMU against the       #
+# scalar formulas, which the single nodes use                  #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# For the random inputs
+import numpy as np
+
+# The tested object
+from packages.backend.node_components import EMU
+
+
+#########
+# Tests #
+#########
+
+
+# The batch transmission energy is the one of the scalar formula, on both sides of the amplifier threshold
+def test_emu_transmission_consumption_batch():
+    emu = EMU(1)
+    rng = np.random.default_rng(1)
+
+    packet_sizes = rng.integers(1, 4000, size=500)
+    distances = rng.uniform(0, 3 * emu.get_threshold_distance(), size=500)
+
+    batch = emu.calculate_transmission_consumption_batch(packet_sizes, distances)
+    scalar = [
+        emu.calculate_transmission_consumption(int(size), float(distance))
+        for size, distance in zip(packet_sizes, distances)
+    ]
+
+    assert np.allclose(batch, scalar, rtol=1e-12, atol=0)
+
+
+# The closed form rounds until the level are the first ones, after which the drained charge is bellow the level
+def test_emu_rounds_until_level_batch():
+    emu = EMU(1)
+    rng = np.random.default_rng(2)
+
+    designed = rng.uniform(0.5, 2, size=300)
+    initial = designed * rng.uniform(0.02, 1, size=300)
+    amount = rng.uniform(0.001, 0.05, size=300)
+    amount[:10] = 0
+
+    rounds = emu.calculate_rounds_until_level_batch(initial, designed, amount, 1)
+
+    # The cells, that aren't used, never reach the level
+    assert np.all(np.isinf(rounds[:10]))
+
+    energy = np.empty_like(initial)
+
+    for index in range(10, len(initial)):
+        expected = 1
+
+        while True:
+            emu.drain_energy_batch(
+                energy[index : index + 1],
+                initial[index : index + 1],
+                amount[index],
+                expected,
+            )
+
+            if energy[index] * 100 / designed[index] < 1:
+                break
+
+            expected += 1
+
+        assert rounds[index] == expected
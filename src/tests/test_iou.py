@@ -0,0 +1,95 @@
+################################################################
+# Checks of the distance based IoU against the geometric one.  #
+# The circles of the geometric IoU are polygons inscribed in   #
+# them, so the two can only differ by the nodes lying in the   #
+# thin band between a circle and its polygon                   #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# For the arrays of the layouts
+import numpy as np
+
+# The tested objects
+from packages.backend.wsn import SimulationCore
+from packages.backend.wsn.simulation_core import Swarm
+
+
+#####################
+# Helpers functions #
+#####################
+
+
+# The shapely circles have 32 sides, their sides are this much closer to the centre than the radius
+BAND = 1 - np.cos(np.pi / 32)
+
+
+# Returns the amount of the active nodes, that lie between a circle and its polygon, in the compared circle
+# or in any of the circles overlapping with it
+def count_border_nodes(network, swarm, index, active):
+    positions = network.mo_State.ma_Positions[active]
+    centres = swarm.ma_Positions
+    radii = swarm.ma_Radii
+
+    overlapping = np.hypot(*(centres - centres[index]).T) <= radii + radii[index]
+
+    distances = np.hypot(
+        positions[:, 0][:, np.newaxis] - centres[overlapping, 0],
+        positions[:, 1][:, np.newaxis] - centres[overlapping, 1],
+    )
+
+    on_border = (distances <= radii[overlapping]) & (
+        distances >= radii[overlapping] * (1 - BAND)
+    )
+
+    return np.count_nonzero(on_border.any(axis=1))
+
+
+#########
+# Tests #
+#########
+
+
+# The two IoU modes differ only by the nodes on the borders of the circles, in a few of the calls
+def test_distance_iou_matches_geometric_iou():
+    calls = 0
+    differing = 0
+
+    for seed in range(1, 6):
+        network = SimulationCore(node_amount=300, battery_capacity=1, seed=seed)
+        network.initiate_network()
+
+        rng = np.random.default_rng(seed)
+        active = rng.uniform(size=300) < 0.9
+
+        for _ in range(10):
+            swarm = Swarm(
+                rng.uniform(0, 200, size=(30, 2)),
+                np.zeros((30, 2)),
+                rng.uniform(5, 40, size=30),
+            )
+
+            for index in range(30):
+                position = swarm.get_position(index)
+                radius = swarm.get_radius(index)
+
+                network.mb_GeometricIoU = False
+                distance_iou = network.IoU(position, radius, swarm, active, index)
+
+                network.mb_GeometricIoU = True
+                geometric_iou = network.IoU(position, radius, swarm, active, index)
+
+                # The difference in the amount of the nodes in the intersections
+                difference = round(abs(distance_iou - geometric_iou) * active.sum())
+
+                assert difference <= count_border_nodes(network, swarm, index, active)
+                assert difference <= 2
+
+                calls += 1
+                differing += difference > 0
+
+    assert differing / calls < 0.06
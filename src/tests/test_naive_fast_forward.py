@@ -0,0 +1,72 @@
+################################################################
+# Checks of the fast forward of the naive algorithm. Replaying #
+# only the rounds with the deaths gives the same statistics,   #
+# events and charge left as the round by round loop            #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# For the charge left in the nodes
+import numpy as np
+
+# For the parameters of the checks
+import pytest
+
+# The tested object
+from packages.backend.wsn import SimulationCore
+
+
+#####################
+# Helpers functions #
+#####################
+
+
+# Returns the events sent by the naive algorithm, the statistics and the charge left in the nodes at the end
+def run_naive(seed=int, fast_forward=bool, track_connectivity=bool):
+    network = SimulationCore(node_amount=150, battery_capacity=1, seed=seed)
+    network.mb_FastForward = fast_forward
+    network.set_connectivity_tracking(track_connectivity)
+
+    events = []
+
+    for event in ("coverage_delta_data_naive", "fnd_naive", "hnd_naive", "lnd_naive"):
+        network.add_observer(
+            event, lambda *data, event=event: events.append((event,) + data)
+        )
+
+    # The charge is read before the network is cleaned up after the run
+    charge = []
+    network.add_observer(
+        "simulation_finished",
+        lambda _: charge.append(network.mo_State.ma_CurrentCapacity.copy()),
+    )
+
+    network.naive_algorithm_new()
+
+    return events, (network.mv_FND, network.mv_HND, network.mv_LND), charge[0]
+
+
+#########
+# Tests #
+#########
+
+
+# The fast forward gives exactly the results of the round by round loop, with and without the cut off nodes
+@pytest.mark.parametrize("track_connectivity", [False, True])
+@pytest.mark.parametrize("seed", [1, 3])
+def test_fast_forward_matches_round_loop(seed, track_connectivity):
+    expected_events, expected_statistics, expected_charge = run_naive(
+        seed, False, track_connectivity
+    )
+    events, statistics, charge = run_naive(seed, True, track_connectivity)
+
+    assert statistics == expected_statistics
+    assert events == expected_events
+    assert np.array_equal(charge, expected_charge)
+
+    # The nodes die in many different rounds, so most of them are skipped
+    assert statistics[2] > len(events)
@@ -0,0 +1,69 @@
+################################################################
+# Checks of the profiling of the runs. Without it there is no  #
+# profiler at all, with it the phases and the counted calls of #
+# the algorithms are reported                                  #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# The tested object
+from packages.backend.wsn import SimulationCore
+
+
+#####################
+# Helpers functions #
+#####################
+
+
+# Returns the network after a short PSO run, with the profiling turned on or off
+def run_pso(profiling=bool):
+    network = SimulationCore(node_amount=20, battery_capacity=1, seed=1)
+    network.mv_MaxIteration = 3
+    network.set_profiling(profiling)
+
+    network.initiate_network()
+    network.pso_algorithm()
+
+    return network
+
+
+#########
+# Tests #
+#########
+
+
+# The phases and the calls of the algorithm are reported only when the profiling is on, with the same results
+def test_profiling_reports_only_when_enabled():
+    disabled = run_pso(False)
+
+    assert disabled.mo_Profiler is None
+
+    report = disabled.get_profile_report()
+
+    assert report["phases"] == {}
+    assert report["counters"] == {}
+
+    enabled = run_pso(True)
+    report = enabled.get_profile_report()
+
+    assert {"layout", "pso_setup", "particles_fitness", "round_energy"} <= set(
+        report["phases"]
+    )
+    assert report["counters"]["iou"] > 0
+    assert report["counters"]["population_fitness"] > 0
+    assert report["run"]["node_amount"] == 20
+
+    assert (enabled.mv_FND, enabled.mv_HND, enabled.mv_LND) == (
+        disabled.mv_FND,
+        disabled.mv_HND,
+        disabled.mv_LND,
+    )
+
+    # Turning the profiling off drops the profiler
+    enabled.set_profiling(False)
+
+    assert enabled.mo_Profiler is None
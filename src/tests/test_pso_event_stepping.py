@@ -0,0 +1,71 @@
+################################################################
+# Checks of the event stepping of the PSO algorithm. Skipping  #
+# to the rounds, in which something happens, gives the same    #
+# statistics, events and charge left as the round by round one #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# For the charge left in the nodes
+import numpy as np
+
+# For the parameters of the checks
+import pytest
+
+# The tested object
+from packages.backend.wsn import SimulationCore
+
+
+#####################
+# Helpers functions #
+#####################
+
+
+# Returns the events sent by the PSO algorithm, the statistics and the charge left in the nodes at the end
+def run_pso(node_amount=int, seed=int, event_stepping=bool):
+    network = SimulationCore(node_amount=node_amount, battery_capacity=1, seed=seed)
+    network.mv_MaxIteration = 5
+    network.mb_EventStepping = event_stepping
+
+    events = []
+
+    for event in ("coverage_delta_data_pso", "fnd_pso", "hnd_pso", "lnd_pso"):
+        network.add_observer(
+            event, lambda *data, event=event: events.append((event,) + data)
+        )
+
+    # The charge is read before the network is cleaned up after the run
+    charge = []
+    network.add_observer(
+        "simulation_finished",
+        lambda _: charge.append(network.mo_State.ma_CurrentCapacity.copy()),
+    )
+
+    network.pso_algorithm()
+
+    return events, (network.mv_FND, network.mv_HND, network.mv_LND), charge[0]
+
+
+#########
+# Tests #
+#########
+
+
+# The event stepping gives the results of the round by round simulation with the same seed
+@pytest.mark.parametrize("node_amount, seed", [(20, 1), (30, 3)])
+def test_event_stepping_matches_round_by_round(node_amount, seed):
+    expected_events, expected_statistics, expected_charge = run_pso(
+        node_amount, seed, False
+    )
+    events, statistics, charge = run_pso(node_amount, seed, True)
+
+    assert statistics == expected_statistics
+    assert events == expected_events
+    assert np.array_equal(charge, expected_charge)
+
+    # The nodes die in different rounds, so the simulation goes on long after the first death
+    assert 0 < statistics[0] < statistics[2]
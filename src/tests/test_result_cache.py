@@ -0,0 +1,79 @@
+################################################################
+# Checks of the results cache. Every setting of the runs is a  #
+# part of the key of the cached result, along with the code of #
+# the simulation, and the least recently used results go first #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# For the modification times of the cached results
+import os
+
+# For the random streams of the runs
+import numpy as np
+
+# The tested objects
+from packages.backend.wsn import ResultCache, SimulationCore
+
+
+#########
+# Tests #
+#########
+
+
+# Changing any of the settings of the network, or the code of the simulation, changes the key
+def test_key_covers_every_setting(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    seed_sequence = np.random.SeedSequence(7)
+
+    settings = SimulationCore(node_amount=10, battery_capacity=1, seed=1).get_settings()
+    key = cache.get_key(0, settings, seed_sequence)
+
+    assert cache.get_key(0, dict(settings), seed_sequence) == key
+    assert cache.get_key(1, settings, seed_sequence) != key
+
+    for name, value in settings.items():
+        changed = dict(settings)
+        changed[name] = (not value) if isinstance(value, bool) else value + 1
+
+        assert cache.get_key(0, changed, seed_sequence) != key, name
+
+    cache.mv_SourceHash = "0" * 64
+
+    assert cache.get_key(0, settings, seed_sequence) != key
+
+
+# The least recently used results are evicted first, reading a result marks it as used
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    seed_sequence = np.random.SeedSequence(7)
+    result = (0, (1, 2, 3), [(1, 0.5), (2, 0.25)])
+
+    keys = [
+        cache.get_key(0, {"node_amount": amount}, seed_sequence)
+        for amount in range(4)
+    ]
+
+    for age, key in enumerate(keys):
+        cache.put(key, result)
+
+        # The older results get the older modification times
+        modified = 1000000 + age * 10
+        os.utime(cache.get_path(key), (modified, modified))
+
+    assert cache.get(keys[0]) == result
+
+    # Only two of the results fit, the first one was read last
+    cache.mv_MaxSize = 2 * os.path.getsize(cache.get_path(keys[0]))
+    cache.evict()
+
+    assert cache.get(keys[0]) == result
+    assert cache.get(keys[3]) == result
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is None
+    assert cache.mv_Hits == 3
+    assert cache.mv_Misses == 2
@@ -0,0 +1,193 @@
+################################################################
+# Checks of the routing tree. Its costs are the ones of a      #
+# plain Dijkstra, the routes of the naive algorithm reach the  #
+# same nodes as the depth first search they replaced and the   #
+# routes to the base station end in its own vertex             #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# For the reference Dijkstra
+import heapq
+
+# For the arrays of the layouts
+import numpy as np
+
+# The tested objects
+from packages.backend.wsn import RoutingTree, SimulationCore
+
+# The shared layouts
+from layouts import build_layout
+
+
+#####################
+# Helpers functions #
+#####################
+
+
+# Returns the costs of the cheapest routes from the root found with a plain Dijkstra over all of the pairs
+def find_route_costs(positions, root=int, communication_range=float):
+    costs = np.full(len(positions), np.inf)
+    costs[root] = 0
+    queue = [(0.0, root)]
+
+    while queue:
+        cost, index = heapq.heappop(queue)
+
+        if cost > costs[index]:
+            continue
+
+        distances = np.hypot(*(positions - positions[index]).T)
+
+        for other in np.flatnonzero(distances <= communication_range):
+            if cost + distances[other] < costs[other]:
+                costs[other] = cost + distances[other]
+                heapq.heappush(queue, (costs[other], other))
+
+    return costs
+
+
+# The depth first search of the original naive algorithm, over the neighbours lists of the nodes.
+# Returns the route it went along from the node to the sink, the next hop first, or None
+def find_dfs_route(visited, node, sink):
+    if id(node) == id(sink):
+        return []
+
+    if node in visited:
+        return None
+
+    visited.add(node)
+
+    for neighbour in node.ml_AdjacentNodes:
+        route = find_dfs_route(visited, neighbour, sink)
+
+        if route is not None:
+            return [neighbour] + route
+
+    return None
+
+
+# Returns the network of the naive algorithm checks, with the neighbours lists built the original way
+def build_network(seed=int):
+    network = SimulationCore(node_amount=100, battery_capacity=1, seed=seed)
+    network.initiate_network()
+
+    for node in network.ml_Nodes:
+        node.ml_AdjacentNodes.clear()
+
+        for another_node in network.ml_Nodes:
+            if node.distance_to_node(another_node) <= node.get_communication_range():
+                node.add_to_neighbours_list(another_node)
+
+    return network
+
+
+# Returns the length of the route from the node
+def find_route_length(network, node, route):
+    hops = [node] + list(route)
+
+    return sum(network.get_distance(a, b) for a, b in zip(hops, hops[1:]))
+
+
+#########
+# Tests #
+#########
+
+
+# The costs of the routing tree are the ones of a plain Dijkstra and the paths follow the links to the root
+def test_routing_tree_matches_dijkstra():
+    graph, _, positions = build_layout(150, 30, 5)
+    root = 0
+
+    tree = RoutingTree(graph.get_matrix(), root)
+    expected = find_route_costs(positions, root, 30)
+
+    for index, cost in enumerate(expected):
+        assert tree.is_reachable(index) == np.isfinite(cost)
+
+        if not np.isfinite(cost):
+            assert tree.get_path(index) is None
+            continue
+
+        assert np.isclose(tree.get_cost(index), cost)
+
+        # The lengths of the hops add up to the cost of the route
+        path = tree.get_path(index)
+        hops = [index] + path
+        length = sum(graph.get_distance(a, b) for a, b in zip(hops, hops[1:]))
+
+        if index == root:
+            assert path == []
+        else:
+            assert path[-1] == root
+        assert np.isclose(length, cost)
+
+
+# The nodes reach the sink exactly when the original search found it, along the links and never on a longer route
+def test_routes_match_dfs():
+    for seed in (2, 4):
+        network = build_network(seed)
+        sink = network.ml_Nodes[
+            int(np.argmin(network.mo_DistanceCache.get_base_distances()))
+        ]
+
+        network.establish_routes(sink)
+
+        reached = 0
+
+        for node in network.ml_Nodes:
+            route = find_dfs_route(set(), node, sink)
+            path = node.get_path()
+
+            if route is None or node is sink:
+                assert path == []
+                continue
+
+            reached += 1
+
+            assert path[-1] is sink
+            assert all(
+                hop in previous.ml_AdjacentNodes
+                for previous, hop in zip([node] + path, path)
+            )
+            assert find_route_length(network, node, path) <= find_route_length(
+                network, node, route
+            ) + 1e-9
+
+        # Both the multi hop and the unreachable nodes are in the layouts
+        assert 0 < reached < len(network.ml_Nodes) - 1
+        assert any(len(node.get_path()) > 2 for node in network.ml_Nodes)
+
+
+# The routes to the base station end in it, the nodes, that reach it, are the ones, that aren't cut off
+def test_routes_to_base_station():
+    network = SimulationCore(node_amount=100, battery_capacity=1, seed=2)
+    network.set_connectivity_tracking(True)
+    network.initiate_network()
+    network.start_connectivity_tracking()
+
+    tree = network.establish_routes(network.mv_BaseStation)
+    base_distances = network.mo_DistanceCache.get_base_distances()
+
+    assert tree.get_root() == len(network.ml_Nodes)
+
+    for node in network.ml_Nodes:
+        path = node.get_path()
+
+        assert (len(path) > 0) != network.is_cut_off(node)
+        assert node.is_path_estabilished() == (len(path) > 0)
+
+        if len(path) > 0:
+            assert path[-1] is network.mv_BaseStation
+            assert network.mv_BaseStation not in path[:-1]
+            assert np.isclose(
+                tree.get_cost(node.mv_Index),
+                find_route_length(network, node, path),
+            )
+
+            if len(path) == 1:
+                assert base_distances[node.mv_Index] <= 25
@@ -0,0 +1,62 @@
+################################################################
+# Checks of the queue of the simulations. A job, that fails in #
+# its worker, is reported as an event and its batch finishes   #
+# along with the other ones                                    #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# Waiting for the workers
+import time
+
+# The tested object and the settings of the runs
+from packages.backend.wsn import SimulationCore, SimulationQueue
+
+
+#########
+# Tests #
+#########
+
+
+# A failed job is passed to the observers and the batches finish with the results of the other jobs
+def test_failed_job_finishes_batch():
+    settings = SimulationCore(node_amount=10, battery_capacity=1, seed=1).get_settings()
+
+    broken_settings = dict(settings)
+    del broken_settings["width"]
+
+    queue = SimulationQueue(processes=1)
+
+    failures = []
+    finished = {}
+
+    queue.add_observer(
+        "job_failed",
+        lambda batch, algorithm, repetition, exception: failures.append(
+            (batch, repetition, type(exception))
+        ),
+    )
+    queue.add_observer(
+        "batch_finished", lambda batch, results: finished.update({batch: results})
+    )
+
+    try:
+        broken = queue.submit([0], 2, broken_settings, 1)
+        working = queue.submit([0], 1, settings, 1)
+
+        deadline = time.monotonic() + 120
+
+        while queue.poll():
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+    finally:
+        queue.shutdown()
+
+    assert sorted(failures) == [(broken, 0, KeyError), (broken, 1, KeyError)]
+    assert finished[broken] == [None, None]
+    assert finished[working][0][0] == 0
+    assert not queue.is_busy()
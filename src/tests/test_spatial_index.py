@@ -0,0 +1,106 @@
+################################################################
+# Checks of the spatial index against the brute force scans    #
+# over all of the nodes, with the nodes on the borders of the  #
+# queried shapes included                                      #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# For the arrays of the positions
+import numpy as np
+
+# For the queried shapes and the reference point tests
+import shapely
+
+# The tested object
+from packages.backend.wsn import SpatialIndex
+
+
+#####################
+# Helpers functions #
+#####################
+
+
+# Returns the random positions, a part of them on the integer grid, so that some of them lie on the borders
+def build_positions(seed=int):
+    rng = np.random.default_rng(seed)
+
+    return np.vstack(
+        (
+            rng.uniform(0, 200, size=(400, 2)),
+            rng.integers(0, 200, size=(400, 2)).astype(np.float64),
+        )
+    )
+
+
+# Returns the shapes queried by the simulation, the circles of the nodes, their intersections and the area
+def build_shapes(rng):
+    shapes = [shapely.box(20, 30, 120, 80)]
+
+    for _ in range(20):
+        x, y = rng.integers(0, 200, size=2)
+        circle = shapely.Point(x, y).buffer(rng.uniform(5, 40))
+        other = shapely.Point(x + rng.uniform(-30, 30), y).buffer(rng.uniform(5, 40))
+
+        shapes += [circle, circle.intersection(other)]
+
+    return shapes
+
+
+#########
+# Tests #
+#########
+
+
+# The nodes within the radius are the ones found by comparing all of the distances
+def test_query_radius_matches_brute_force():
+    positions = build_positions(1)
+    index = SpatialIndex(positions)
+    rng = np.random.default_rng(2)
+
+    for _ in range(50):
+        x, y = rng.integers(0, 200, size=2).astype(np.float64)
+        radius = float(rng.integers(1, 40))
+
+        expected = np.flatnonzero(
+            np.hypot(positions[:, 0] - x, positions[:, 1] - y) <= radius
+        )
+
+        assert np.array_equal(index.query_radius(x, y, radius), expected)
+
+
+# The nodes in the shapes are the ones found by testing every node, both for intersecting and containing
+def test_query_polygon_matches_brute_force():
+    positions = build_positions(3)
+    index = SpatialIndex(positions)
+
+    for shape in build_shapes(np.random.default_rng(4)):
+        intersecting = np.flatnonzero(
+            shapely.intersects_xy(shape, positions[:, 0], positions[:, 1])
+        )
+        contained = np.flatnonzero(
+            shapely.contains_xy(shape, positions[:, 0], positions[:, 1])
+        )
+
+        assert np.array_equal(index.query_polygon(shape), intersecting)
+        assert np.array_equal(index.query_polygon(shape, contains=True), contained)
+
+    # The nodes on the border of the box intersect with it, but aren't inside of it
+    box = shapely.box(20, 30, 120, 80)
+    assert len(index.query_polygon(box)) > len(index.query_polygon(box, True))
+
+
+# An empty layout and an empty shape give no nodes
+def test_empty_queries():
+    empty = SpatialIndex(np.empty((0, 2)))
+
+    assert len(empty.query_radius(0, 0, 10)) == 0
+    assert len(empty.query_polygon(shapely.box(0, 0, 10, 10))) == 0
+
+    index = SpatialIndex(build_positions(5))
+
+    assert len(index.query_polygon(shapely.Polygon())) == 0
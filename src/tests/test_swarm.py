@@ -0,0 +1,148 @@
+################################################################
+# Checks of the PSO swarm against the object based particles   #
+# of the original algorithm. Every particle is its own         #
+# personal best, the global best follows the moving particle   #
+# and the particles move one after another                     #
+################################################################
+
+
+############
+# Includes #
+############
+
+
+# For the arrays of the particles
+import numpy as np
+
+# For the parameters of the checks
+import pytest
+
+# The tested objects
+from packages.backend.wsn import SimulationCore
+from packages.backend.wsn.simulation_core import Swarm
+
+
+#####################
+# Helpers functions #
+#####################
+
+
+# Moves the particles the way the object based algorithm did, calculating the gbest fitness again for every particle.
+# Returns the indices of the particles, that became the global best, in every iteration
+def move_reference_particles(network, particles, gbest, iterations, node_mask):
+    base = network.mv_BaseStation.get_localization()
+    moves = []
+
+    # The fitness of a particle in the swarm made of the current particles
+    def population_fitness(index):
+        swarm = Swarm(
+            [particle["position"] for particle in particles],
+            [particle["velocity"] for particle in particles],
+            [particle["radius"] for particle in particles],
+        )
+
+        return network.Fitness(
+            particles[index]["position"],
+            particles[index]["radius"],
+            swarm,
+            node_mask,
+            index,
+        )
+
+    for iteration in range(iterations):
+        gbest_indices = []
+
+        for j, particle in enumerate(particles):
+            r1 = network.mo_Random.uniform(0, 1)
+            r2 = network.mo_Random.uniform(0, 1)
+            w = 0.9 - (0.9 - 0.4) / (network.mv_MaxIteration / 10) * iteration
+
+            # The personal best is the particle itself, the global best is the current gbest particle
+            velocity = particle["velocity"]
+            particle["velocity"] = (
+                w * velocity
+                + 1 * r1 * (particle["position"] - velocity)
+                + 2 * r2 * (particles[gbest]["position"] - velocity)
+            )
+
+            for axis, bound in ((0, network.mv_Width), (1, network.mv_Height)):
+                position = particle["position"][axis]
+
+                if position + particle["velocity"][axis] < 0:
+                    if particle["velocity"][axis] < 0:
+                        particle["velocity"][axis] *= -1
+
+                if position + particle["velocity"][axis] > bound:
+                    if particle["velocity"][axis] > 0:
+                        particle["velocity"][axis] *= -1
+
+            particle["position"] = particle["position"] + particle["velocity"]
+
+            distance = np.hypot(
+                particle["position"][0] - base.x, particle["position"][1] - base.y
+            )
+            particle["radius"] = min(distance / 150 * (40 - 5) + 5, 40)
+
+            if population_fitness(j) < population_fitness(gbest):
+                gbest = j
+                gbest_indices.append(j)
+
+        moves.append(gbest_indices)
+
+    return moves, gbest
+
+
+#########
+# Tests #
+#########
+
+
+# The swarm moves the same way as the particles objects, with both of the IoU modes
+@pytest.mark.parametrize("geometric_iou", [False, True])
+def test_swarm_matches_object_particles(geometric_iou):
+    network = SimulationCore(node_amount=40, battery_capacity=1, seed=4)
+    network.mb_GeometricIoU = geometric_iou
+    network.initiate_network()
+
+    rng = np.random.default_rng(1)
+    positions = rng.uniform(0, 200, size=(40, 2))
+    velocities = np.repeat(rng.uniform(-50, 50, size=(40, 1)), 2, axis=1)
+    radii = rng.uniform(5, 40, size=40)
+    node_mask = np.ones(40, dtype=bool)
+
+    swarm = Swarm(positions, velocities, radii)
+    swarm.set_gbest(0)
+
+    state = network.mo_Random.bit_generator.state
+
+    moves = [
+        network.move_particles(swarm, iteration, node_mask, 150, 5, 40)
+        for iteration in range(6)
+    ]
+
+    # The same random values are used by the reference
+    network.mo_Random.bit_generator.state = state
+
+    particles = [
+        {
+            "position": positions[j].copy(),
+            "velocity": velocities[j].copy(),
+            "radius": radii[j],
+        }
+        for j in range(40)
+    ]
+
+    expected_moves, expected_gbest = move_reference_particles(
+        network, particles, 0, 6, node_mask
+    )
+
+    assert moves == expected_moves
+    assert any(len(indices) > 0 for indices in moves)
+    assert swarm.get_gbest_index() == expected_gbest
+
+    assert np.array_equal(
+        swarm.ma_Positions, [particle["position"] for particle in particles]
+    )
+    assert np.array_equal(
+        swarm.ma_Radii, [particle["radius"] for particle in particles]
+    )